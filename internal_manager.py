@@ -6,11 +6,11 @@ from typing import Any, Dict, List, Tuple
 
 from sheet_client import (
 	load_settings,
-	_get_client,
+	_get_spreadsheet,
+	_get_worksheets,
 	_find_header_row,
 	_build_records,
 	_get_value_flexible,
-	_normalize_key,
 	_collapse_spaces,
 	_parse_int_maybe,
 	_is_truthy,
@@ -227,8 +227,7 @@ def fetch_internal_items_for_company(company: str) -> List[Dict[str, Any]]:
 		company_business_names = None
 		company_business_names_normalized = {}
 	
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 	
 	# 한국 시간 기준 (KST)
 	kst = pytz.timezone('Asia/Seoul')
@@ -236,7 +235,7 @@ def fetch_internal_items_for_company(company: str) -> List[Dict[str, Any]]:
 	logger.info(f"📅 오늘 날짜 (KST): {today}")
 	
 	all_items = []
-	ws_list = ss.worksheets()
+	ws_list = _get_worksheets(ss)
 	tab_titles = [ws.title for ws in ws_list]
 	logger.info(f"📊 {company} raw 데이터 조회 - 워크시트: {len(ws_list)}개")
 	logger.info(f"   탭 목록: {', '.join(tab_titles)}")
@@ -260,25 +259,23 @@ def fetch_internal_items_for_company(company: str) -> List[Dict[str, Any]]:
 			continue
 		
 		for row in records:
-			row_norm = { _normalize_key(k): v for k, v in row.items() }
-			
 			# 내부 진행건 또는 후불 건 필터
-			is_internal = _is_internal_or_postpaid(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
+			is_internal = _is_internal_or_postpaid(_get_value_flexible(row, settings.internal_col, "INTERNAL_COLUMN"))
 			if not is_internal:
 				continue
 			
 			tab_stats[tab_title]["internal_count"] += 1
 			
 			# 기본 정보
-			bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
+			bizname = str(_get_value_flexible(row, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
 			if not bizname:
 				continue
 			
-			agency_raw = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-			remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
-			workload = str(_get_value_flexible(row_norm, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
-			product = str(_get_value_flexible(row_norm, settings.product_col, "PRODUCT_COLUMN") or "").strip()
-			product_name = str(_get_value_flexible(row_norm, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
+			agency_raw = str(_get_value_flexible(row, settings.agency_col, "AGENCY_COLUMN") or "").strip()
+			remain = _parse_int_maybe(_get_value_flexible(row, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
+			workload = str(_get_value_flexible(row, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
+			product = str(_get_value_flexible(row, settings.product_col, "PRODUCT_COLUMN") or "").strip()
+			product_name = str(_get_value_flexible(row, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
 			
 			# 회사 필터 (상호명 기준 - 정규화된 비교)
 			if company_business_names is not None:
@@ -300,7 +297,7 @@ def fetch_internal_items_for_company(company: str) -> List[Dict[str, Any]]:
 			start_date_str = None
 			start_col_found = None
 			for possible_col in ["작업 시작일", "작업시작일", "시작일", "세팅일", "작업시작", "시작"]:
-				start_val = _get_value_flexible(row_norm, possible_col, "")
+				start_val = _get_value_flexible(row, possible_col, "")
 				if start_val:
 					start_date_str = str(start_val).strip()
 					start_col_found = possible_col
@@ -348,7 +345,7 @@ def fetch_internal_items_for_company(company: str) -> List[Dict[str, Any]]:
 			if is_review_tab:
 				item_col_value = None
 				for possible_col in ["항목", "항목명"]:
-					val = _get_value_flexible(row_norm, possible_col, "")
+					val = _get_value_flexible(row, possible_col, "")
 					if val:
 						item_col_value = str(val).strip()
 						break
@@ -358,7 +355,7 @@ def fetch_internal_items_for_company(company: str) -> List[Dict[str, Any]]:
 				# 예: (퀀텀) 일류V2 트래픽
 				reception_value = None
 				for possible_col in ["접수처", "접수"]:
-					val = _get_value_flexible(row_norm, possible_col, "")
+					val = _get_value_flexible(row, possible_col, "")
 					if val:
 						reception_value = str(val).strip()
 						break
@@ -533,26 +530,24 @@ def fetch_internal_items() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
 	if not settings.spreadsheet_id:
 		raise RuntimeError("SPREADSHEET_ID 환경변수를 설정하세요.")
 
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 
 	# 중복 상호 병합 및 작업량 합산을 위한 집계: key=(agency, tab_title, task_display, bizname) -> sum(workload)
 	aggregator: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
-	ws_list = ss.worksheets()
+	ws_list = _get_worksheets(ss)
 	for ws in ws_list:
 		tab_title = (ws.title or "").strip()
 		header_row, headers = _find_header_row(ws, settings)
 		records = _build_records(ws, header_row, headers)
 		for row in records:
-			row_norm = { _normalize_key(k): v for k, v in row.items() }
-			agency_raw = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-			is_checked = _is_truthy(_get_value_flexible(row_norm, settings.checked_col, "CHECKED_COLUMN"))
-			is_internal = _is_internal_or_postpaid(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
-			remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
-			bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
-			product = str(_get_value_flexible(row_norm, settings.product_col, "PRODUCT_COLUMN") or "").strip()
-			product_name = str(_get_value_flexible(row_norm, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
-			workload = str(_get_value_flexible(row_norm, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
+			agency_raw = str(_get_value_flexible(row, settings.agency_col, "AGENCY_COLUMN") or "").strip()
+			is_checked = _is_truthy(_get_value_flexible(row, settings.checked_col, "CHECKED_COLUMN"))
+			is_internal = _is_internal_or_postpaid(_get_value_flexible(row, settings.internal_col, "INTERNAL_COLUMN"))
+			remain = _parse_int_maybe(_get_value_flexible(row, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
+			bizname = str(_get_value_flexible(row, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
+			product = str(_get_value_flexible(row, settings.product_col, "PRODUCT_COLUMN") or "").strip()
+			product_name = str(_get_value_flexible(row, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
+			workload = str(_get_value_flexible(row, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
 
 			if not is_internal:
 				continue
@@ -566,7 +561,7 @@ def fetch_internal_items() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
 				# (신)일류 탭: "(접수처) 상품명 상품" 형식으로 표시
 				reception_value = None
 				for possible_col in ["접수처", "접수"]:
-					val = _get_value_flexible(row_norm, possible_col, "")
+					val = _get_value_flexible(row, possible_col, "")
 					if val:
 						reception_value = str(val).strip()
 						break
@@ -760,8 +755,7 @@ def fetch_workload_schedule_direct(company: str = None, business_name: str = Non
 			logger.warning(f"보장건 데이터 로드 실패 (전체 내부 진행건 조회): {e}")
 			company_business_names = None
 	
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 	
 	# 한국 시간 기준 (KST)
 	kst = pytz.timezone('Asia/Seoul')
@@ -775,7 +769,7 @@ def fetch_workload_schedule_direct(company: str = None, business_name: str = Non
 	no_start_date = 0
 	valid_items = 0
 	
-	ws_list = ss.worksheets()
+	ws_list = _get_worksheets(ss)
 	logger.info(f"📊 작업량 조회 시작 - 회사: {company}, 워크시트 수: {len(ws_list)}")
 	
 	for ws in ws_list:
@@ -784,18 +778,17 @@ def fetch_workload_schedule_direct(company: str = None, business_name: str = Non
 		records = _build_records(ws, header_row, headers)
 		
 		for row in records:
-			row_norm = { _normalize_key(k): v for k, v in row.items() }
 			total_rows += 1
 			
 			# 내부 진행건 또는 후불 건 필터
-			is_internal = _is_internal_or_postpaid(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
+			is_internal = _is_internal_or_postpaid(_get_value_flexible(row, settings.internal_col, "INTERNAL_COLUMN"))
 			if not is_internal:
 				continue
 			
 			internal_rows += 1
 			
 			# 기본 정보
-			bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
+			bizname = str(_get_value_flexible(row, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
 			if not bizname:
 				continue
 			
@@ -804,11 +797,11 @@ def fetch_workload_schedule_direct(company: str = None, business_name: str = Non
 				if bizname != business_name:
 					continue
 			
-			agency_raw = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-			remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
-			workload = str(_get_value_flexible(row_norm, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
-			product = str(_get_value_flexible(row_norm, settings.product_col, "PRODUCT_COLUMN") or "").strip()
-			product_name = str(_get_value_flexible(row_norm, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
+			agency_raw = str(_get_value_flexible(row, settings.agency_col, "AGENCY_COLUMN") or "").strip()
+			remain = _parse_int_maybe(_get_value_flexible(row, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
+			workload = str(_get_value_flexible(row, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
+			product = str(_get_value_flexible(row, settings.product_col, "PRODUCT_COLUMN") or "").strip()
+			product_name = str(_get_value_flexible(row, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
 			
 			# 회사 필터 (상호명 기준으로 매칭) - 상호명 필터가 없을 때만 적용
 			if not business_name:
@@ -831,7 +824,7 @@ def fetch_workload_schedule_direct(company: str = None, business_name: str = Non
 			# 작업 시작일 파싱 (여러 컬럼명 시도)
 			start_date_str = None
 			for possible_col in ["작업 시작일", "작업시작일", "시작일", "세팅일"]:
-				start_val = _get_value_flexible(row_norm, possible_col, "")
+				start_val = _get_value_flexible(row, possible_col, "")
 				if start_val:
 					start_date_str = str(start_val).strip()
 					break
@@ -882,7 +875,7 @@ def fetch_workload_schedule_direct(company: str = None, business_name: str = Non
 				# 영수증리뷰 탭은 '항목' 컬럼 읽기
 				item_col_value = None
 				for possible_col in ["항목", "항목명"]:
-					val = _get_value_flexible(row_norm, possible_col, "")
+					val = _get_value_flexible(row, possible_col, "")
 					if val:
 						item_col_value = str(val).strip()
 						break
@@ -892,7 +885,7 @@ def fetch_workload_schedule_direct(company: str = None, business_name: str = Non
 				# 예: (퀀텀) 일류V2 트래픽
 				reception_value = None
 				for possible_col in ["접수처", "접수"]:
-					val = _get_value_flexible(row_norm, possible_col, "")
+					val = _get_value_flexible(row, possible_col, "")
 					if val:
 						reception_value = str(val).strip()
 						break
@@ -11,15 +11,24 @@ rank_update_logs에서 실패한 날짜를 찾아 재크롤링하고,
 """
 import os
 import re
+import bisect
 import json
 import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Set, Tuple
 from zoneinfo import ZoneInfo
 
 import gspread
 from google.oauth2.service_account import Credentials
 
+# Sheets API 재시도는 sheet_client와 같은 정책 사용
+# (429/5xx·연결 오류만, Retry-After/retryDelay는 RETRY_MAX_DELAY까지, 지터 포함)
+from sheet_client import _with_retry
+
 logger = logging.getLogger(__name__)
 
 KST = ZoneInfo("Asia/Seoul")
@@ -28,12 +37,95 @@ KST = ZoneInfo("Asia/Seoul")
 JTWOLAB_SHEET_ID = os.getenv("JTWOLAB_SHEET_ID", "1zRgtvTZ6SZF-bWiMO8qmnIhhrNVsrDxbIj3HvE8Tv3Y")
 ILRYU_SHEET_ID = os.getenv("ILRYU_SHEET_ID", "1gInZEFprmb_p43SPKUZT6zjpG36AQPW9OpcsljgNtxM")
 
+# 프로세스 단위로 재사용하는 gspread 클라이언트 (인증 JSON 파싱 + authorize는 1회만)
+_GSPREAD_CLIENT: Optional[gspread.Client] = None
+_GSPREAD_CLIENT_LOCK = threading.Lock()
+
+# 행 단위 루프에서 반복 사용하는 정규식 (미리 컴파일)
+_PLACE_ID_RE = re.compile(r'/(\d{5,})')  # 플레이스 URL의 숫자 ID
+_NON_DIGIT_RE = re.compile(r'[^\d]')  # 보장 순위 문자열에서 숫자 외 제거
+_CELL_DATE_RE = re.compile(r'(\d{2})\.\s*(\d{2})\.\s*(\d{2})')  # 일별 셀의 "YY. MM. DD"
+_WHITESPACE_RE = re.compile(r'\s+')  # 헤더 정규화용
+
+# 보장건 행 필터 / 일별 순위 열 개수
+VALID_STATUSES = frozenset({"진행중", "후불", "반불"})
+PLACE_PRODUCT_TOKEN = "플레이스"
+MAX_DAILY_COUNT = 25
+GUARANTEE_TAB = "보장건"
+
+# 보장건 시트에서 실제로 쓰는 헤더 (공백 제거) → 필드명
+# 표에 없는 헤더만 _classify_header()의 부분 문자열 규칙으로 판별
+HEADER_ALIASES = {
+    "작업여부": "status",
+    "상호": "business_name",
+    "상호명": "business_name",
+    "플레이스자동완성": "business_name",
+    "메인키워드": "keyword",
+    "상품": "product",
+    "URL": "url",
+    "플레이스URL": "url",
+    "보장순위": "guarantee_rank",
+}
+
+# 월보장 시트 목록 (이름, 시트 ID)
+GUARANTEE_SHEETS = [
+    ("jtwolab", JTWOLAB_SHEET_ID),
+    ("ilryu", ILRYU_SHEET_ID),
+]
+
+
+@dataclass(slots=True)
+class ParsedRow:
+    """보장건 시트에서 복구 대상이 되는 행 (시트당 1회 파싱, 날짜 간 재사용)"""
+    row_num: int  # 실제 시트 행 번호 (1-based)
+    business_name: str
+    keyword: str
+    place_id: Optional[str]  # URL에서 추출한 플레이스 ID
+    guarantee_rank: int
+    daily_cells: List[str]  # 일1~일25 셀 값 (strip, 업데이트 시 함께 갱신)
+    entries: List[Tuple[str, str]]  # 날짜가 있는 셀 [(YYMMDD, 셀 값)] 날짜순
+    existing_dates: Set[str]  # entries의 YYMMDD 집합 (중복 날짜 O(1) 확인)
+
+
+@dataclass(slots=True)
+class GuaranteeSheet:
+    """파싱된 보장건 시트 + 매칭용 색인 (복구 실행 중 재사용)"""
+    spreadsheet: gspread.Spreadsheet
+    daily_start_idx: int  # 일별 순위 시작 열 인덱스 (0-based)
+    rows: List[ParsedRow]
+    by_place_id: Dict[str, List[ParsedRow]]  # 플레이스 ID → 행
+    by_name_keyword: Dict[str, List[ParsedRow]]  # "상호|키워드" → 행
+
+    def candidate_rows(
+        self,
+        url_to_rank: Dict[str, Dict],
+        name_keyword_to_rank: Dict[str, Dict]
+    ) -> List[ParsedRow]:
+        """순위 데이터와 매칭될 수 있는 행만 시트 행 순서대로 반환
+
+        전체 행을 훑는 대신 순위 매핑의 키로 색인을 조회한다.
+        """
+        candidates: Dict[int, ParsedRow] = {}
+        for place_id, item in url_to_rank.items():
+            if item:
+                for row in self.by_place_id.get(place_id, ()):
+                    candidates[row.row_num] = row
+        for key, item in name_keyword_to_rank.items():
+            if item:
+                for row in self.by_name_keyword.get(key, ()):
+                    candidates[row.row_num] = row
+        return [candidates[row_num] for row_num in sorted(candidates)]
+
 
 class RecoveryService:
     """크롤링 실패 복구 서비스"""
 
     def __init__(self):
         self.gc = self._get_gspread_client()
+        # 시트별 전송 대기 셀 (여러 날짜를 모아 시트당 1회 values.batchUpdate)
+        self.pending_updates: Dict[str, List[gspread.Cell]] = {}
+        # 시트별 파싱 결과 (GuaranteeSheet) - 날짜 간 변경 내용을 반영하기 위해 재사용
+        self._sheet_cache: Dict[str, GuaranteeSheet] = {}
 
     def _parse_cell_date(self, cell_value: str) -> Optional[Tuple[str, str]]:
         """셀 값에서 날짜 파싱
@@ -48,7 +140,7 @@ class RecoveryService:
             return None
 
         # "YY. MM. DD" 형식 파싱
-        match = re.search(r'(\d{2})\.\s*(\d{2})\.\s*(\d{2})', cell_value)
+        match = _CELL_DATE_RE.search(cell_value)
         if match:
             yy, mm, dd = match.groups()
             sort_key = f"{yy}{mm}{dd}"
@@ -57,6 +149,16 @@ class RecoveryService:
         return None
 
     def _get_gspread_client(self) -> gspread.Client:
+        """gspread 클라이언트 (프로세스 내 최초 1회만 인증)"""
+        global _GSPREAD_CLIENT
+        if _GSPREAD_CLIENT is None:
+            with _GSPREAD_CLIENT_LOCK:
+                if _GSPREAD_CLIENT is None:
+                    _GSPREAD_CLIENT = self._authorize_gspread_client()
+        return _GSPREAD_CLIENT
+
+    @staticmethod
+    def _authorize_gspread_client() -> gspread.Client:
         """gspread 클라이언트 초기화"""
         scopes = [
             "https://www.googleapis.com/auth/spreadsheets",
@@ -77,11 +179,13 @@ class RecoveryService:
     # 1. 실패한 크롤링 날짜 조회
     # =========================================================================
 
-    def get_failed_crawl_dates(self, days_back: int = 7) -> List[Dict[str, Any]]:
+    def get_failed_crawl_dates(self, days_back: int = 7, include_details: bool = True) -> List[Dict[str, Any]]:
         """rank_update_logs에서 실패한 크롤링 날짜 조회
 
         Args:
             days_back: 조회할 과거 일수 (기본: 7일)
+            include_details: False면 failed_details JSON 파싱을 생략
+                             (날짜만 필요한 복구 흐름용, 결과에 failed_details 키 없음)
 
         Returns:
             실패 기록 리스트 [{date, time_slot, failed_count, message, failed_details}, ...]
@@ -92,12 +196,14 @@ class RecoveryService:
             spreadsheet = manager._get_spreadsheet()
 
             try:
-                log_ws = spreadsheet.worksheet("rank_update_logs")
+                log_ws = _with_retry(spreadsheet.worksheet, "rank_update_logs")
             except gspread.WorksheetNotFound:
                 logger.warning("rank_update_logs 탭을 찾을 수 없습니다")
                 return []
 
-            all_values = log_ws.get_all_values()
+            cutoff_date = (datetime.now(KST) - timedelta(days=days_back)).strftime("%Y-%m-%d")
+
+            all_values = self._read_recent_log_rows(log_ws, cutoff_date)
             if len(all_values) <= 1:
                 return []
 
@@ -108,22 +214,30 @@ class RecoveryService:
             for i, h in enumerate(headers):
                 idx_map[h] = i
 
-            cutoff_date = (datetime.now(KST) - timedelta(days=days_back)).strftime("%Y-%m-%d")
+            exec_i = idx_map.get("executed_at", 0)
+            slot_i = idx_map.get("time_slot", 1)
+            fc_i = idx_map.get("failed_count", 3)
+            msg_i = idx_map.get("message", 5)
+            fd_i = idx_map.get("failed_details", 6)
+            row_width = max(exec_i, slot_i, fc_i, msg_i, fd_i) + 1
 
             failed_records = []
             for row in all_values[1:]:
                 try:
-                    executed_at = row[idx_map.get("executed_at", 0)] if len(row) > idx_map.get("executed_at", 0) else ""
-                    failed_count_str = row[idx_map.get("failed_count", 3)] if len(row) > idx_map.get("failed_count", 3) else "0"
-                    message = row[idx_map.get("message", 5)] if len(row) > idx_map.get("message", 5) else ""
-                    failed_details_str = row[idx_map.get("failed_details", 6)] if len(row) > idx_map.get("failed_details", 6) else "[]"
-                    time_slot = row[idx_map.get("time_slot", 1)] if len(row) > idx_map.get("time_slot", 1) else ""
-
-                    # 날짜 추출 (ISO 형식에서)
-                    if "T" in executed_at:
-                        log_date = executed_at.split("T")[0]
-                    else:
-                        log_date = executed_at[:10] if len(executed_at) >= 10 else ""
+                    # 짧은 행은 빈 문자열로 채워 인덱스 접근만 하도록
+                    if len(row) < row_width:
+                        row = row + [""] * (row_width - len(row))
+
+                    executed_at = row[exec_i]
+                    failed_count_str = row[fc_i]
+                    message = row[msg_i]
+                    failed_details_str = row[fd_i]
+                    time_slot = row[slot_i]
+
+                    # 날짜 추출 (ISO 형식은 앞 10자리가 날짜, 그보다 짧으면 건너뜀)
+                    if len(executed_at) < 10:
+                        continue
+                    log_date = executed_at[:10]
 
                     # 날짜 필터
                     if log_date < cutoff_date:
@@ -136,20 +250,22 @@ class RecoveryService:
                     is_failed = failed_count > 0 or "실패" in message or "failed" in message.lower()
 
                     if is_failed:
-                        # failed_details JSON 파싱
-                        try:
-                            failed_details = json.loads(failed_details_str) if failed_details_str else []
-                        except json.JSONDecodeError:
-                            failed_details = []
-
-                        failed_records.append({
+                        record = {
                             "date": log_date,
                             "time_slot": time_slot,
                             "executed_at": executed_at,
                             "failed_count": failed_count,
                             "message": message,
-                            "failed_details": failed_details,
-                        })
+                        }
+
+                        if include_details:
+                            # failed_details JSON 파싱
+                            try:
+                                record["failed_details"] = json.loads(failed_details_str) if failed_details_str else []
+                            except json.JSONDecodeError:
+                                record["failed_details"] = []
+
+                        failed_records.append(record)
 
                 except Exception as e:
                     logger.warning(f"로그 행 파싱 오류: {e}")
@@ -165,6 +281,33 @@ class RecoveryService:
             logger.error(f"실패 기록 조회 오류: {e}")
             return []
 
+    def _read_recent_log_rows(self, log_ws: gspread.Worksheet, cutoff_date: str) -> List[List[str]]:
+        """rank_update_logs에서 헤더 + cutoff_date 이후 행만 읽기
+
+        로그는 append_row로 시간순 누적되므로 executed_at 열(A)만 먼저 읽어
+        cutoff 이후 첫 행을 찾고, 헤더와 해당 구간만 batch_get 1회로 가져온다.
+        A열 헤더가 executed_at이 아니면 전체 읽기로 폴백.
+
+        Returns:
+            get_all_values()와 같은 형태 (첫 행은 헤더)
+        """
+        executed_col = _with_retry(log_ws.col_values, 1)
+        if not executed_col or executed_col[0].strip() != "executed_at":
+            return _with_retry(log_ws.get_all_values)
+
+        start_row = None
+        for row_num, executed_at in enumerate(executed_col[1:], start=2):
+            if executed_at[:10] >= cutoff_date:
+                start_row = row_num
+                break
+
+        if start_row is None:
+            return []
+
+        header_range, recent_range = _with_retry(log_ws.batch_get, ["1:1", f"{start_row}:{len(executed_col)}"])
+        headers = header_range[0] if header_range else []
+        return [headers] + list(recent_range)
+
     def get_dates_missing_in_snapshots(self, target_dates: List[str]) -> List[str]:
         """rank_snapshots에서 데이터가 없는 날짜 찾기
 
@@ -232,21 +375,16 @@ class RecoveryService:
         expected_dates.sort()  # 오래된 날짜부터
         logger.info(f"   확인 기간: {expected_dates[0]} ~ {expected_dates[-1]}")
 
-        # 두 시트 모두 확인
-        sheets_config = [
-            ("jtwolab", JTWOLAB_SHEET_ID),
-            ("ilryu", ILRYU_SHEET_ID),
-        ]
-
         all_found_dates = set()
         sheets_checked = []
 
-        for sheet_name, sheet_id in sheets_config:
+        # 두 시트 모두 확인
+        for sheet_name, sheet_id in GUARANTEE_SHEETS:
             try:
-                spreadsheet = self.gc.open_by_key(sheet_id)
+                spreadsheet = _with_retry(self.gc.open_by_key, sheet_id)
                 # 보장건 탭 찾기
                 worksheet = None
-                for ws in spreadsheet.worksheets():
+                for ws in _with_retry(spreadsheet.worksheets):
                     title_lower = ws.title.lower().strip()
                     if "보장" in title_lower or "guarantee" in title_lower:
                         worksheet = ws
@@ -257,7 +395,7 @@ class RecoveryService:
                     continue
 
                 # 전체 데이터 읽기
-                all_values = worksheet.get_all_values()
+                all_values = _with_retry(worksheet.get_all_values)
                 if len(all_values) < 2:
                     continue
 
@@ -284,7 +422,7 @@ class RecoveryService:
                         cell_value = row[col_idx].strip()
                         if cell_value:
                             # "YY. MM. DD" 형식에서 날짜 추출
-                            match = re.search(r'(\d{2})\.\s*(\d{2})\.\s*(\d{2})', cell_value)
+                            match = _CELL_DATE_RE.search(cell_value)
                             if match:
                                 yy, mm, dd = match.groups()
                                 year = 2000 + int(yy)
@@ -381,6 +519,65 @@ class RecoveryService:
         logger.info(f"📅 {target_date}: {len(all_data)}건 중 {len(filtered)}건 필터링")
         return filtered
 
+    def _crawl_all_dates_once(
+        self
+    ) -> Tuple[Dict[str, Any], Dict[str, List[Dict]], Dict[str, Tuple[Dict[str, Dict], Dict[str, Dict]]]]:
+        """전체 데이터를 1회 크롤링한 뒤 날짜별로 묶음
+
+        날짜마다 전체 데이터를 다시 훑지 않고, 한 번의 순회로 버킷과
+        날짜별 (URL → 순위, 이름|키워드 → 순위) 매핑을 함께 만든다.
+
+        Returns:
+            (crawl_all_data_once 결과,
+             {날짜(YYYY-MM-DD): [레코드, ...]},
+             {날짜(YYYY-MM-DD): (url_to_rank, name_keyword_to_rank)})
+        """
+        crawl_result = self.crawl_all_data_once()
+
+        groups: Dict[str, List[Dict]] = defaultdict(list)
+        maps_by_date: Dict[str, Tuple[Dict[str, Dict], Dict[str, Dict]]] = {}
+        for record in crawl_result.get("data", []):
+            # 플레이스 ID는 여기서 한 번만 추출해 레코드에 저장 (이후 매핑은 dict 조회만)
+            if "place_id" not in record:
+                record["place_id"] = self._extract_place_id(record.get("place_url", ""))
+
+            record_date = record.get("date", "")
+            groups[record_date].append(record)
+
+            maps = maps_by_date.get(record_date)
+            if maps is None:
+                maps = maps_by_date[record_date] = ({}, {})
+            self._add_to_rank_maps(record, maps[0], maps[1])
+
+        return crawl_result, dict(groups), maps_by_date
+
+    @staticmethod
+    def _extract_place_id(place_url: str) -> Optional[str]:
+        """플레이스 URL → 숫자 ID (없으면 None)"""
+        if not place_url:
+            return None
+        match = _PLACE_ID_RE.search(place_url)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _add_to_rank_maps(
+        item: Dict[str, Any],
+        url_to_rank: Dict[str, Dict],
+        name_keyword_to_rank: Dict[str, Dict]
+    ) -> None:
+        """순위 레코드 1건을 URL / 이름+키워드 매핑에 추가 (뒤에 온 레코드가 우선)"""
+        if "place_id" in item:
+            place_id = item["place_id"]
+        else:
+            place_id = RecoveryService._extract_place_id(item.get("place_url", ""))
+        if place_id:
+            url_to_rank[place_id] = item
+
+        name = item.get("client_name", "")
+        keyword = item.get("keyword", "")
+        if name and keyword:
+            name_keyword_to_rank[f"{name}|{keyword}"] = item
+
     def crawl_historical_date(self, target_date: str) -> Dict[str, Any]:
         """특정 과거 날짜의 데이터 크롤링 (단일 날짜용)
 
@@ -393,7 +590,7 @@ class RecoveryService:
         Returns:
             크롤링 결과
         """
-        result = self.crawl_all_data_once()
+        result, groups, _ = self._crawl_all_dates_once()
 
         if not result.get("success"):
             return {
@@ -403,7 +600,7 @@ class RecoveryService:
                 "data": []
             }
 
-        filtered_data = self.filter_data_by_date(result.get("data", []), target_date)
+        filtered_data = groups.get(target_date, [])
 
         return {
             "success": True,
@@ -420,7 +617,9 @@ class RecoveryService:
     def update_guarantee_sheets_selective(
         self,
         rank_data: List[Dict[str, Any]],
-        target_date: str
+        target_date: str,
+        flush: bool = True,
+        rank_maps: Optional[Tuple[Dict[str, Dict], Dict[str, Dict]]] = None
     ) -> Dict[str, Any]:
         """월보장 시트에 선택적으로 순위 업데이트
 
@@ -430,49 +629,26 @@ class RecoveryService:
         Args:
             rank_data: 순위 데이터 리스트
             target_date: 업데이트할 날짜 (YYYY-MM-DD)
+            flush: True면 즉시 시트에 반영, False면 pending_updates에 모아둠
+                   (여러 날짜 복구 시 마지막에 flush_pending_updates() 1회 호출)
+            rank_maps: _crawl_all_dates_once()에서 미리 만든
+                       (url_to_rank, name_keyword_to_rank). 없으면 rank_data로 생성
 
         Returns:
             업데이트 결과
         """
-        results = {}
-
-        # 날짜 문자열 변환 (2025-01-08 → 25. 01. 08)
-        try:
-            dt = datetime.strptime(target_date, "%Y-%m-%d")
-            date_str = dt.strftime("%y. %m. %d")
-        except ValueError:
-            logger.error(f"잘못된 날짜 형식: {target_date}")
+        prepared = self._prepare_rank_update(rank_data, target_date, rank_maps)
+        if prepared is None:
             return {"success": False, "error": "Invalid date format"}
+        date_str, url_to_rank, name_keyword_to_rank = prepared
 
-        # URL → 순위 데이터 맵 생성
-        url_to_rank = {}
-        name_keyword_to_rank = {}
-
-        for item in rank_data:
-            place_url = item.get("place_url", "")
-            if place_url:
-                match = re.search(r'/(\d{5,})', place_url)
-                if match:
-                    place_id = match.group(1)
-                    url_to_rank[place_id] = item
-
-            name = item.get("client_name", "")
-            keyword = item.get("keyword", "")
-            if name and keyword:
-                key = f"{name}|{keyword}"
-                name_keyword_to_rank[key] = item
-
-        logger.info(f"[{target_date}] {len(url_to_rank)} URL 매핑, {len(name_keyword_to_rank)} 이름+키워드 매핑")
-
-        # 각 시트 업데이트
-        sheets_config = [
-            ("jtwolab", JTWOLAB_SHEET_ID),
-            ("ilryu", ILRYU_SHEET_ID),
-        ]
+        results = {}
 
-        for sheet_name, sheet_id in sheets_config:
-            try:
-                result = self._update_sheet_selective(
+        # 각 시트 업데이트 (두 시트는 서로 독립이므로 읽기 I/O를 동시에 진행)
+        with ThreadPoolExecutor(max_workers=len(GUARANTEE_SHEETS)) as executor:
+            futures = {
+                sheet_name: executor.submit(
+                    self._update_sheet_selective,
                     sheet_id,
                     sheet_name,
                     url_to_rank,
@@ -480,11 +656,121 @@ class RecoveryService:
                     date_str,
                     target_date
                 )
-                results[sheet_name] = result
+                for sheet_name, sheet_id in GUARANTEE_SHEETS
+            }
+
+        for sheet_name, future in futures.items():
+            try:
+                results[sheet_name] = future.result()
             except Exception as e:
                 logger.error(f"{sheet_name} 시트 업데이트 오류: {e}")
                 results[sheet_name] = {"success": False, "error": str(e)}
 
+        result = self._summarize_sheet_results(target_date, results)
+        if flush:
+            result["flush_results"] = self.flush_pending_updates()
+            self._apply_flush_results([result], result["flush_results"])
+        return result
+
+    def update_guarantee_sheets_for_dates(
+        self,
+        date_jobs: List[Tuple[str, List[Dict[str, Any]], Optional[Tuple[Dict[str, Dict], Dict[str, Dict]]]]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """여러 날짜를 시트별 작업자 1개로 선택적 업데이트 후 시트당 1회 전송
+
+        시트마다 작업자 하나가 모든 날짜를 차례로 적용한다. 한 시트를 읽는 동안에도
+        다른 시트는 날짜 처리를 계속 진행하고, 날짜마다 스레드 풀을 새로 만들지 않는다.
+        셀 변경은 pending_updates에 모았다가 flush_pending_updates()로 1회 전송하고,
+        날짜별 결과는 전송 결과를 반영해 집계한다.
+
+        Args:
+            date_jobs: [(target_date, rank_data, rank_maps), ...] (적용 순서대로)
+
+        Returns:
+            (date_jobs 순서와 같은 날짜별 결과 리스트, flush_pending_updates() 결과)
+            날짜별 결과 항목은 update_guarantee_sheets_selective()와 같은 형태
+        """
+        prepared = []
+        for target_date, rank_data, rank_maps in date_jobs:
+            prepared.append((target_date, self._prepare_rank_update(rank_data, target_date, rank_maps)))
+
+        def run_sheet(sheet_id: str, sheet_name: str) -> List[Optional[Dict[str, Any]]]:
+            sheet_results = []
+            for target_date, job in prepared:
+                if job is None:
+                    sheet_results.append(None)
+                    continue
+
+                date_str, url_to_rank, name_keyword_to_rank = job
+                try:
+                    sheet_results.append(self._update_sheet_selective(
+                        sheet_id,
+                        sheet_name,
+                        url_to_rank,
+                        name_keyword_to_rank,
+                        date_str,
+                        target_date
+                    ))
+                except Exception as e:
+                    logger.error(f"{sheet_name} 시트 업데이트 오류: {e}")
+                    sheet_results.append({"success": False, "error": str(e)})
+            return sheet_results
+
+        with ThreadPoolExecutor(max_workers=len(GUARANTEE_SHEETS)) as executor:
+            futures = {
+                sheet_name: executor.submit(run_sheet, sheet_id, sheet_name)
+                for sheet_name, sheet_id in GUARANTEE_SHEETS
+            }
+        by_sheet = {sheet_name: future.result() for sheet_name, future in futures.items()}
+
+        # 모든 날짜의 셀 변경을 시트당 1회 전송한 뒤, 실제 기록된 셀 기준으로 날짜별 집계
+        flush_results = self.flush_pending_updates()
+
+        date_results = []
+        for i, (target_date, job) in enumerate(prepared):
+            if job is None:
+                date_results.append({"success": False, "error": "Invalid date format"})
+                continue
+            results = {sheet_name: sheet_results[i] for sheet_name, sheet_results in by_sheet.items()}
+            date_results.append(self._summarize_sheet_results(target_date, results))
+        self._apply_flush_results(date_results, flush_results)
+        return date_results, flush_results
+
+    def _prepare_rank_update(
+        self,
+        rank_data: List[Dict[str, Any]],
+        target_date: str,
+        rank_maps: Optional[Tuple[Dict[str, Dict], Dict[str, Dict]]]
+    ) -> Optional[Tuple[str, Dict[str, Dict], Dict[str, Dict]]]:
+        """시트 셀 날짜 문자열과 순위 매핑 준비
+
+        Returns:
+            (셀 날짜 문자열 "YY. MM. DD", url_to_rank, name_keyword_to_rank)
+            또는 잘못된 날짜 형식이면 None
+        """
+        # 날짜 문자열 변환 (2025-01-08 → 25. 01. 08)
+        try:
+            dt = datetime.strptime(target_date, "%Y-%m-%d")
+            date_str = dt.strftime("%y. %m. %d")
+        except ValueError:
+            logger.error(f"잘못된 날짜 형식: {target_date}")
+            return None
+
+        # URL → 순위 데이터 맵 (미리 만든 매핑이 있으면 그대로 사용)
+        if rank_maps is not None:
+            url_to_rank, name_keyword_to_rank = rank_maps
+        else:
+            url_to_rank = {}
+            name_keyword_to_rank = {}
+            for item in rank_data:
+                self._add_to_rank_maps(item, url_to_rank, name_keyword_to_rank)
+
+        logger.info(f"[{target_date}] {len(url_to_rank)} URL 매핑, {len(name_keyword_to_rank)} 이름+키워드 매핑")
+        return date_str, url_to_rank, name_keyword_to_rank
+
+    @staticmethod
+    def _summarize_sheet_results(target_date: str, results: Dict[str, Any]) -> Dict[str, Any]:
+        """시트별 결과 → 날짜 단위 업데이트 결과"""
         total_updated = sum(
             r.get("updated", 0) for r in results.values() if isinstance(r, dict)
         )
@@ -493,13 +779,289 @@ class RecoveryService:
         )
 
         return {
-            "success": True,
+            "success": all(isinstance(r, dict) and r.get("success") for r in results.values()),
             "date": target_date,
             "results": results,
             "total_updated": total_updated,
             "total_skipped_existing": total_skipped_existing,
         }
 
+    @classmethod
+    def _apply_flush_results(cls, date_results: List[Dict[str, Any]], flush_results: Dict[str, Any]) -> None:
+        """전송 실패한 시트의 날짜별 결과를 실제 기록 기준으로 보정
+
+        _update_sheet_selective의 updated는 대기열에 넣은 셀 수이므로, 전송이 실패한 시트는
+        updated=0, success=False로 바꾸고 날짜 단위 합계를 다시 계산한다.
+        (해당 날짜에 대기 셀이 없던 시트는 잃은 기록이 없으므로 그대로 둠)
+        """
+        failed = {
+            sheet_name: r.get("error", "")
+            for sheet_name, r in flush_results.items() if not r.get("success")
+        }
+        if not failed:
+            return
+
+        for date_result in date_results:
+            results = date_result.get("results")
+            if not results:
+                continue
+            for sheet_name, error in failed.items():
+                r = results.get(sheet_name)
+                if isinstance(r, dict) and r.get("success") and r.get("updated", 0) > 0:
+                    r.update(success=False, updated=0, error=f"flush_failed:{error}")
+            date_result.update(cls._summarize_sheet_results(date_result["date"], results))
+
+    @staticmethod
+    def _flush_failed_sheets(flush_results: Dict[str, Any]) -> List[str]:
+        """flush_pending_updates() 결과 중 전송 실패한 시트 이름"""
+        return [sheet_name for sheet_name, r in flush_results.items() if not r.get("success")]
+
+    def _get_guarantee_sheet(self, sheet_id: str) -> GuaranteeSheet:
+        """보장건 워크시트 조회 + 복구 대상 행 파싱 (복구 실행 중에는 캐시 재사용)
+
+        Returns:
+            GuaranteeSheet (스프레드시트, 일별 순위 시작 열, 파싱된 행과 매칭 색인)
+
+        Raises:
+            ValueError: 시트 데이터 부족 또는 필수 헤더 누락
+            gspread.WorksheetNotFound: 보장건 탭 없음
+        """
+        cached = self._sheet_cache.get(sheet_id)
+        if cached is None:
+            spreadsheet = _with_retry(self.gc.open_by_key, sheet_id)
+            daily_start_idx, parsed_rows = self._parse_guarantee_rows(
+                self._read_guarantee_values(spreadsheet)
+            )
+
+            by_place_id: Dict[str, List[ParsedRow]] = defaultdict(list)
+            by_name_keyword: Dict[str, List[ParsedRow]] = defaultdict(list)
+            for parsed in parsed_rows:
+                if parsed.place_id:
+                    by_place_id[parsed.place_id].append(parsed)
+                if parsed.business_name and parsed.keyword:
+                    by_name_keyword[f"{parsed.business_name}|{parsed.keyword}"].append(parsed)
+
+            cached = GuaranteeSheet(
+                spreadsheet=spreadsheet,
+                daily_start_idx=daily_start_idx,
+                rows=parsed_rows,
+                by_place_id=dict(by_place_id),
+                by_name_keyword=dict(by_name_keyword),
+            )
+            self._sheet_cache[sheet_id] = cached
+        return cached
+
+    @staticmethod
+    def _read_guarantee_values(spreadsheet: gspread.Spreadsheet) -> List[List[str]]:
+        """보장건 탭 전체 값을 values.batchGet 1회로 읽기
+
+        worksheet()로 탭 메타데이터를 다시 받지 않고 탭 이름 범위로 바로 조회한다.
+        빈 행/셀은 API가 생략하므로 행 길이는 제각각일 수 있다.
+        """
+        try:
+            response = _with_retry(spreadsheet.values_batch_get, [f"'{GUARANTEE_TAB}'"])
+        except gspread.exceptions.APIError as e:
+            # 존재하지 않는 탭 범위는 400 "Unable to parse range"로 응답 (그 밖의 400은 그대로 전달)
+            if e.code == 400 and "Unable to parse range" in str(e.error.get("message", "")):
+                raise gspread.WorksheetNotFound(GUARANTEE_TAB) from e
+            raise
+
+        value_ranges = response.get("valueRanges", [])
+        return value_ranges[0].get("values", []) if value_ranges else []
+
+    @staticmethod
+    def _classify_header(h: str) -> Optional[str]:
+        """헤더 문자열 → 필드명 (해당 없으면 None)"""
+        field = HEADER_ALIASES.get(_WHITESPACE_RE.sub('', h))
+        if field:
+            return field
+
+        if "작업" in h and "여부" in h:
+            return "status"
+        if "상호" in h or ("플레이스" in h and "자동완성" in h):
+            return "business_name"
+        if "키워드" in h and "메인" in h:
+            return "keyword"
+        if "상품" in h:
+            return "product"
+        if "URL" in h.upper():
+            return "url"
+        if "보장" in h and "순위" in h:
+            return "guarantee_rank"
+        return None
+
+    def _parse_guarantee_rows(self, all_values: List[List[str]]) -> Tuple[int, List[ParsedRow]]:
+        """보장건 시트 값을 ParsedRow 리스트로 변환 (시트당 1회)
+
+        작업 여부/상품/보장 순위 조건을 통과한 행만 남기므로,
+        날짜별 처리에서는 매칭과 일별 셀 비교만 수행하면 된다.
+
+        Returns:
+            (일별 순위 시작 열 인덱스, 파싱된 행 리스트)
+        """
+        # 헤더 행 (보통 2행)
+        header_row_idx = 1
+        if len(all_values) <= header_row_idx:
+            raise ValueError("시트에 데이터가 부족합니다")
+
+        headers = all_values[header_row_idx]
+
+        # 헤더 매핑
+        col_map = {}
+        daily_start_idx = -1
+
+        for idx, header in enumerate(headers):
+            h = str(header).strip()
+
+            field = self._classify_header(h)
+            if field:
+                col_map[field] = idx
+
+            if daily_start_idx == -1:
+                if h == "1" or h == "1일":
+                    daily_start_idx = idx
+
+        # 필수 컬럼 체크
+        required_cols = ["business_name", "status", "product", "guarantee_rank"]
+        missing = [c for c in required_cols if c not in col_map]
+        if missing:
+            raise ValueError(f"필수 헤더 누락: {missing}")
+
+        if daily_start_idx == -1:
+            daily_start_idx = 17
+        daily_end_idx = daily_start_idx + MAX_DAILY_COUNT
+
+        status_i = col_map["status"]
+        product_i = col_map["product"]
+        rank_i = col_map["guarantee_rank"]
+        name_i = col_map["business_name"]
+        keyword_i = col_map.get("keyword")
+        url_i = col_map.get("url")
+        row_width = max(max(col_map.values()) + 1, daily_end_idx)
+
+        parsed_rows = []
+        start_row = header_row_idx + 1
+        for i, row in enumerate(all_values[start_row:]):
+            # 필터링 (대부분의 행은 작업 여부에서 걸러지므로 이 셀만 먼저 확인)
+            status = row[status_i].strip() if status_i < len(row) else ""
+            if status not in VALID_STATUSES:
+                continue
+
+            # 통과한 행은 한 번만 strip 하고 이후에는 인덱스로 접근
+            srow = [c.strip() for c in row]
+            if len(srow) < row_width:
+                srow.extend([""] * (row_width - len(srow)))
+
+            if PLACE_PRODUCT_TOKEN not in srow[product_i]:
+                continue
+
+            rank_str = srow[rank_i]
+            if rank_str.isdecimal():
+                guarantee_rank = int(rank_str)
+            else:
+                # "5위" 같은 표기만 정규식으로 정리
+                try:
+                    guarantee_rank = int(_NON_DIGIT_RE.sub('', rank_str))
+                except ValueError:
+                    continue
+
+            if not guarantee_rank:
+                continue
+
+            place_id = self._extract_place_id(srow[url_i]) if url_i is not None else None
+
+            # 일별 셀은 여기서 한 번만 스캔하고, 날짜별 처리에서는 entries/existing_dates 사용
+            daily_cells = srow[daily_start_idx:daily_end_idx]
+            entries = []
+            for cell_value in daily_cells:
+                if cell_value:
+                    cell_parsed = self._parse_cell_date(cell_value)
+                    if cell_parsed:
+                        entries.append(cell_parsed)
+            entries.sort(key=lambda x: x[0])
+
+            parsed_rows.append(ParsedRow(
+                row_num=start_row + i + 1,
+                business_name=srow[name_i],
+                keyword=srow[keyword_i] if keyword_i is not None else "",
+                place_id=place_id,
+                guarantee_rank=guarantee_rank,
+                daily_cells=daily_cells,
+                entries=entries,
+                existing_dates={key for key, _ in entries},
+            ))
+
+        return daily_start_idx, parsed_rows
+
+    @staticmethod
+    def _cells_to_value_ranges(cells: List[gspread.Cell]) -> List[Dict[str, Any]]:
+        """셀 목록 → values.batchUpdate용 A1 범위 목록
+
+        같은 행에서 열이 연속된 셀은 한 범위로 묶는다 (예: '보장건'!H3:J3).
+        """
+        by_row: Dict[int, List[gspread.Cell]] = defaultdict(list)
+        for cell in cells:
+            by_row[cell.row].append(cell)
+
+        value_ranges = []
+        for row in sorted(by_row):
+            row_cells = sorted(by_row[row], key=lambda c: c.col)
+            run = [row_cells[0]]
+            for cell in row_cells[1:] + [None]:
+                if cell is not None and cell.col == run[-1].col + 1:
+                    run.append(cell)
+                    continue
+
+                a1 = gspread.utils.rowcol_to_a1(row, run[0].col)
+                if len(run) > 1:
+                    a1 += ":" + gspread.utils.rowcol_to_a1(row, run[-1].col)
+                value_ranges.append({
+                    "range": gspread.utils.absolute_range_name(GUARANTEE_TAB, a1),
+                    "values": [[c.value for c in run]],
+                })
+                run = [cell]
+
+        return value_ranges
+
+    def flush_pending_updates(self) -> Dict[str, Any]:
+        """대기 중인 셀 업데이트를 시트당 1회 values.batchUpdate로 전송
+
+        Returns:
+            {sheet_name: {"success": bool, "updated": int} 또는 {"success": False, "error": str}}
+        """
+        sheet_names = {sheet_id: name for name, sheet_id in GUARANTEE_SHEETS}
+        pending = {sheet_id: cells for sheet_id, cells in self.pending_updates.items() if cells}
+
+        def flush_sheet(sheet_id: str, cells: List[gspread.Cell]) -> Dict[str, Any]:
+            sheet_name = sheet_names.get(sheet_id, sheet_id)
+            # 같은 셀이 여러 날짜에서 갱신되면 마지막 값만 전송
+            latest = {(cell.row, cell.col): cell for cell in cells}
+            try:
+                spreadsheet = self._get_guarantee_sheet(sheet_id).spreadsheet
+                _with_retry(spreadsheet.values_batch_update, body={
+                    "valueInputOption": "USER_ENTERED",
+                    "data": self._cells_to_value_ranges(list(latest.values())),
+                })
+                logger.info(f"[{sheet_name}] {len(latest)}개 셀 업데이트 완료")
+                return {"success": True, "updated": len(latest)}
+            except Exception as e:
+                logger.error(f"[{sheet_name}] 셀 업데이트 오류: {e}")
+                return {"success": False, "error": str(e)}
+
+        results = {}
+        if pending:
+            # 시트별 쓰기 요청도 동시에 전송
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {
+                    sheet_names.get(sheet_id, sheet_id): executor.submit(flush_sheet, sheet_id, cells)
+                    for sheet_id, cells in pending.items()
+                }
+            results = {sheet_name: future.result() for sheet_name, future in futures.items()}
+
+        self.pending_updates = {}
+        self._sheet_cache = {}
+        return results
+
     def _update_sheet_selective(
         self,
         sheet_id: str,
@@ -511,103 +1073,32 @@ class RecoveryService:
     ) -> Dict[str, Any]:
         """단일 시트 선택적 업데이트 (이미 채워진 날짜는 건너뛰기)"""
         try:
-            spreadsheet = self.gc.open_by_key(sheet_id)
-            worksheet = spreadsheet.worksheet("보장건")
-
-            all_values = worksheet.get_all_values()
-
-            # 헤더 행 (보통 2행)
-            header_row_idx = 1
-            if len(all_values) <= header_row_idx:
-                return {"success": False, "error": "시트에 데이터가 부족합니다"}
-
-            headers = all_values[header_row_idx]
-
-            # 헤더 매핑
-            col_map = {}
-            daily_start_idx = -1
-
-            for idx, header in enumerate(headers):
-                h = str(header).strip()
-
-                if "작업" in h and "여부" in h:
-                    col_map["status"] = idx
-                elif "상호" in h or ("플레이스" in h and "자동완성" in h):
-                    col_map["business_name"] = idx
-                elif "키워드" in h and "메인" in h:
-                    col_map["keyword"] = idx
-                elif "상품" in h:
-                    col_map["product"] = idx
-                elif "URL" in h.upper():
-                    col_map["url"] = idx
-                elif "보장" in h and "순위" in h:
-                    col_map["guarantee_rank"] = idx
-
-                if daily_start_idx == -1:
-                    if h == "1" or h == "1일":
-                        daily_start_idx = idx
-
-            # 필수 컬럼 체크
-            required_cols = ["business_name", "status", "product", "guarantee_rank"]
-            missing = [c for c in required_cols if c not in col_map]
-            if missing:
-                return {"success": False, "error": f"필수 헤더 누락: {missing}"}
-
-            if daily_start_idx == -1:
-                daily_start_idx = 17
+            try:
+                sheet = self._get_guarantee_sheet(sheet_id)
+            except ValueError as e:
+                return {"success": False, "error": str(e)}
 
-            VALID_STATUSES = ["진행중", "후불", "반불"]
-            MAX_DAILY_COUNT = 25
+            # 정렬/중복 확인용 날짜 키 (25. 01. 08 → 250108)
+            date_key = "".join(_CELL_DATE_RE.search(date_str).groups())
 
             updates = []
             matched_count = 0
             skipped_existing = 0  # 이미 채워진 셀 (담당자가 입력)
             skipped_rank = 0  # 보장 순위 초과
 
-            start_row = header_row_idx + 1
-            for i, row in enumerate(all_values[start_row:]):
-                row_num = start_row + i + 1
-
-                def get_val(col_name):
-                    idx = col_map.get(col_name)
-                    if idx is not None and idx < len(row):
-                        return row[idx].strip()
-                    return ""
-
-                # 필터링
-                status = get_val("status")
-                if status not in VALID_STATUSES:
-                    continue
-
-                product = get_val("product")
-                if "플레이스" not in product:
-                    continue
-
-                # 매칭 데이터 찾기
-                business_name = get_val("business_name")
-                keyword = get_val("keyword")
-                url = get_val("url")
-
-                guarantee_rank_str = get_val("guarantee_rank")
-                guarantee_rank = None
-                try:
-                    guarantee_rank = int(re.sub(r'[^\d]', '', guarantee_rank_str))
-                except ValueError:
-                    continue
+            daily_start_idx = sheet.daily_start_idx
 
-                if not guarantee_rank:
-                    continue
+            # 순위 데이터와 매칭되는 행만 순회 (나머지 행은 건너뜀)
+            for parsed in sheet.candidate_rows(url_to_rank, name_keyword_to_rank):
+                business_name = parsed.business_name
 
                 # 매칭 시도
                 rank_item = None
-                if url:
-                    match = re.search(r'/(\d{5,})', url)
-                    if match:
-                        place_id = match.group(1)
-                        rank_item = url_to_rank.get(place_id)
-
-                if not rank_item and business_name and keyword:
-                    key = f"{business_name}|{keyword}"
+                if parsed.place_id:
+                    rank_item = url_to_rank.get(parsed.place_id)
+
+                if not rank_item and business_name and parsed.keyword:
+                    key = f"{business_name}|{parsed.keyword}"
                     rank_item = name_keyword_to_rank.get(key)
 
                 if not rank_item:
@@ -618,70 +1109,52 @@ class RecoveryService:
                 if raw_rank is None:
                     continue
 
-                try:
-                    current_rank = int(str(raw_rank).replace('위', '').strip())
-                except ValueError:
-                    continue
+                if isinstance(raw_rank, int) and not isinstance(raw_rank, bool):
+                    current_rank = raw_rank
+                else:
+                    try:
+                        current_rank = int(str(raw_rank).replace('위', '').strip())
+                    except ValueError:
+                        continue
 
                 # 보장 순위 이내 확인
-                if current_rank > guarantee_rank:
+                if current_rank > parsed.guarantee_rank:
                     skipped_rank += 1
                     continue
 
                 # ====== 핵심: 일별 순위 열 - 날짜 기반 정렬 및 업데이트 ======
-                # 1. 기존 일별 데이터 수집 (날짜 포함)
-                existing_entries = []  # [(sort_key, cell_value), ...]
-                date_already_exists = False
-
-                for offset in range(MAX_DAILY_COUNT):
-                    check_idx = daily_start_idx + offset
-                    cell_value = ""
-                    if check_idx < len(row):
-                        cell_value = row[check_idx].strip()
-
-                    if cell_value:
-                        parsed = self._parse_cell_date(cell_value)
-                        if parsed:
-                            existing_entries.append(parsed)
-                            # 해당 날짜가 이미 기록되어 있는지 확인
-                            if date_str in cell_value:
-                                date_already_exists = True
-
-                # 이미 해당 날짜 데이터가 있으면 건너뛰기 (담당자가 입력)
-                if date_already_exists:
+                # 1. 이미 해당 날짜 데이터가 있으면 건너뛰기 (담당자가 입력)
+                if date_key in parsed.existing_dates:
                     skipped_existing += 1
                     logger.debug(f"[{sheet_name}] {business_name}: {target_date} 이미 기록됨 (건너뛰기)")
                     continue
 
-                # 2. 새 데이터 추가
-                new_cell_value = f"{date_str}\n{current_rank}등"
-                new_parsed = self._parse_cell_date(new_cell_value)
-                if new_parsed:
-                    existing_entries.append(new_parsed)
+                # 2. 새 데이터를 날짜순(YYMMDD) 위치에 삽입
+                existing_entries = parsed.entries
+                bisect.insort(existing_entries, (date_key, f"{date_str}\n{current_rank}등"))
+                parsed.existing_dates.add(date_key)
 
-                # 3. 날짜순 정렬 (YYMMDD 기준)
-                existing_entries.sort(key=lambda x: x[0])
+                # 3. 일25를 넘는 항목은 시트에 기록되지 않으므로 제외
+                if len(existing_entries) > MAX_DAILY_COUNT:
+                    del existing_entries[MAX_DAILY_COUNT:]
+                    parsed.existing_dates = {key for key, _ in existing_entries}
 
                 # 4. 정렬된 데이터로 셀 업데이트
+                # (다음 날짜 처리 시 채워진 칸을 인식하도록 파싱된 행도 함께 갱신)
+                daily_cells = parsed.daily_cells
                 for offset in range(MAX_DAILY_COUNT):
-                    col_idx = daily_start_idx + offset
-
                     # 정렬된 값 또는 빈 셀
                     if offset < len(existing_entries):
                         new_value = existing_entries[offset][1]
                     else:
                         new_value = ""
 
-                    # 현재 셀 값
-                    old_value = ""
-                    if col_idx < len(row):
-                        old_value = row[col_idx].strip()
-
                     # 값이 다르면 업데이트
-                    if new_value != old_value:
+                    if new_value != daily_cells[offset]:
+                        daily_cells[offset] = new_value
                         updates.append({
-                            "row": row_num,
-                            "col": col_idx + 1,
+                            "row": parsed.row_num,
+                            "col": daily_start_idx + offset + 1,
                             "value": new_value,
                             "business_name": business_name,
                             "type": "date_sorted"
@@ -690,15 +1163,12 @@ class RecoveryService:
                 matched_count += 1
                 logger.debug(f"[{sheet_name}] {business_name}: {target_date} 날짜순 정렬 적용 ({len(existing_entries)}개 항목)")
 
-            # 배치 업데이트
+            # 전송 대기열에 추가 (flush_pending_updates에서 시트당 1회 전송)
             if updates:
-                cells_to_update = []
+                pending = self.pending_updates.setdefault(sheet_id, [])
                 for update in updates:
-                    cell = gspread.Cell(update["row"], update["col"], update["value"])
-                    cells_to_update.append(cell)
-
-                worksheet.update_cells(cells_to_update, value_input_option='USER_ENTERED')
-                logger.info(f"[{sheet_name}] {len(updates)}개 셀 업데이트 완료")
+                    pending.append(gspread.Cell(update["row"], update["col"], update["value"]))
+                logger.info(f"[{sheet_name}] {target_date}: {len(updates)}개 셀 업데이트 대기")
 
             return {
                 "success": True,
@@ -729,7 +1199,7 @@ class RecoveryService:
         1. 실패한 날짜 조회
         2. rank_snapshots에서 누락 확인
         3. 전체 데이터 1회 크롤링 (제이투랩/일류기획 구분 없이)
-        4. 날짜별로 필터링하여 월보장 시트 업데이트
+        4. 날짜별로 묶어 월보장 시트 업데이트
 
         Args:
             days_back: 조회할 과거 일수
@@ -744,12 +1214,14 @@ class RecoveryService:
             "missing_dates": [],
             "crawl_results": [],
             "update_results": [],
+            "flush_results": {},
             "summary": {},
         }
 
-        # 1. 실패한 날짜 조회
-        failed_records = self.get_failed_crawl_dates(days_back)
-        failed_dates = list(set([r["date"] for r in failed_records]))
+        # 1. 실패한 날짜 조회 (날짜만 필요하므로 상세 JSON은 파싱하지 않음)
+        failed_records = self.get_failed_crawl_dates(days_back, include_details=False)
+        # 중복 제거 (조회 결과의 최신순 순서 유지)
+        failed_dates = list(dict.fromkeys(r["date"] for r in failed_records))
         result["failed_dates_found"] = failed_dates
 
         if not failed_dates:
@@ -772,7 +1244,7 @@ class RecoveryService:
 
         # 3. 전체 데이터 한 번만 크롤링 (핵심 변경!)
         logger.info("🔄 전체 데이터 1회 크롤링 시작 (제이투랩/일류기획 통합)")
-        crawl_result = self.crawl_all_data_once()
+        crawl_result, data_by_date, maps_by_date = self._crawl_all_dates_once()
 
         if not crawl_result.get("success"):
             logger.error(f"❌ 크롤링 실패: {crawl_result.get('message')}")
@@ -785,11 +1257,13 @@ class RecoveryService:
         all_crawled_data = crawl_result.get("data", [])
         logger.info(f"✅ 전체 크롤링 완료: {len(all_crawled_data)}건")
 
-        # 4. 날짜별로 필터링하여 처리
+        # 4. 날짜별 버킷으로 처리
         total_crawled = 0
+        date_jobs = []
         for target_date in sorted(missing_dates):  # 날짜순 정렬하여 처리
-            # 해당 날짜 데이터 필터링
-            date_data = self.filter_data_by_date(all_crawled_data, target_date)
+            # 해당 날짜 데이터 (크롤링 시 날짜별로 묶어둔 버킷)
+            date_data = data_by_date.get(target_date, [])
+            logger.info(f"📅 {target_date}: {len(all_crawled_data)}건 중 {len(date_data)}건")
 
             date_result = {
                 "success": len(date_data) > 0,
@@ -801,16 +1275,14 @@ class RecoveryService:
 
             if date_data:
                 total_crawled += len(date_data)
-
-                # 월보장 시트 업데이트
-                update_result = self.update_guarantee_sheets_selective(
-                    date_data,
-                    target_date
-                )
-                result["update_results"].append(update_result)
+                date_jobs.append((target_date, date_data, maps_by_date.get(target_date)))
             else:
                 logger.warning(f"⚠️ {target_date}: 해당 날짜 데이터 없음")
 
+        # 월보장 시트 업데이트 (시트별 작업자가 모든 날짜 처리, 셀 변경은 모아서 시트당 1회 전송)
+        result["update_results"], result["flush_results"] = self.update_guarantee_sheets_for_dates(date_jobs)
+        failed_sheets = self._flush_failed_sheets(result["flush_results"])
+
         # 요약
         total_updated = sum(
             r.get("total_updated", 0) for r in result["update_results"]
@@ -819,14 +1291,17 @@ class RecoveryService:
             r.get("total_skipped_existing", 0) for r in result["update_results"]
         )
 
+        message = f"{len(missing_dates)}개 날짜 복구, {total_updated}개 셀 업데이트, {total_skipped}개 건너뜀 (이미 입력됨)"
+        if failed_sheets:
+            message += f", 시트 기록 실패: {', '.join(failed_sheets)}"
         result["summary"] = {
-            "status": "completed",
+            "status": "flush_failed" if failed_sheets else "completed",
             "failed_dates_count": len(failed_dates),
             "missing_dates_count": len(missing_dates),
             "total_crawled": total_crawled,
             "total_updated": total_updated,
             "total_skipped_existing": total_skipped,
-            "message": f"{len(missing_dates)}개 날짜 복구, {total_updated}개 셀 업데이트, {total_skipped}개 건너뜀 (이미 입력됨)"
+            "message": message
         }
 
         logger.info(f"✅ 복구 완료: {result['summary']['message']}")
@@ -876,12 +1351,16 @@ class RecoveryService:
         )
         result["update_result"] = update_result
 
+        failed_sheets = self._flush_failed_sheets(update_result.get("flush_results", {}))
+        message = f"{len(crawl_result['data'])}건 크롤링, {update_result.get('total_updated', 0)}건 업데이트, {update_result.get('total_skipped_existing', 0)}건 건너뜀"
+        if failed_sheets:
+            message += f", 시트 기록 실패: {', '.join(failed_sheets)}"
         result["summary"] = {
-            "status": "completed",
+            "status": "flush_failed" if failed_sheets else "completed",
             "crawled_count": len(crawl_result["data"]),
             "updated_count": update_result.get("total_updated", 0),
             "skipped_existing": update_result.get("total_skipped_existing", 0),
-            "message": f"{len(crawl_result['data'])}건 크롤링, {update_result.get('total_updated', 0)}건 업데이트, {update_result.get('total_skipped_existing', 0)}건 건너뜀"
+            "message": message
         }
 
         logger.info(f"✅ {target_date} 복구 완료: {result['summary']['message']}")
@@ -907,6 +1386,7 @@ class RecoveryService:
             "missing_dates": [],
             "crawl_results": [],
             "update_results": [],
+            "flush_results": {},
             "summary": {},
         }
 
@@ -928,7 +1408,7 @@ class RecoveryService:
 
         # 2. 전체 데이터 한 번만 크롤링
         logger.info("🔄 전체 데이터 1회 크롤링 시작")
-        crawl_result = self.crawl_all_data_once()
+        crawl_result, data_by_date, maps_by_date = self._crawl_all_dates_once()
 
         if not crawl_result.get("success"):
             logger.error(f"❌ 크롤링 실패: {crawl_result.get('message')}")
@@ -941,11 +1421,13 @@ class RecoveryService:
         all_crawled_data = crawl_result.get("data", [])
         logger.info(f"✅ 전체 크롤링 완료: {len(all_crawled_data)}건")
 
-        # 3. 날짜별로 필터링하여 처리
+        # 3. 날짜별 버킷으로 처리
         total_crawled = 0
+        date_jobs = []
         for target_date in sorted(missing_dates):
-            # 해당 날짜 데이터 필터링
-            date_data = self.filter_data_by_date(all_crawled_data, target_date)
+            # 해당 날짜 데이터 (크롤링 시 날짜별로 묶어둔 버킷)
+            date_data = data_by_date.get(target_date, [])
+            logger.info(f"📅 {target_date}: {len(all_crawled_data)}건 중 {len(date_data)}건")
 
             date_result = {
                 "success": len(date_data) > 0,
@@ -957,16 +1439,14 @@ class RecoveryService:
 
             if date_data:
                 total_crawled += len(date_data)
-
-                # 월보장 시트 업데이트
-                update_result = self.update_guarantee_sheets_selective(
-                    date_data,
-                    target_date
-                )
-                result["update_results"].append(update_result)
+                date_jobs.append((target_date, date_data, maps_by_date.get(target_date)))
             else:
                 logger.warning(f"⚠️ {target_date}: 해당 날짜 데이터 없음 (애드로그에 기록 없을 수 있음)")
 
+        # 월보장 시트 업데이트 (시트별 작업자가 모든 날짜 처리, 셀 변경은 모아서 시트당 1회 전송)
+        result["update_results"], result["flush_results"] = self.update_guarantee_sheets_for_dates(date_jobs)
+        failed_sheets = self._flush_failed_sheets(result["flush_results"])
+
         # 요약
         total_updated = sum(
             r.get("total_updated", 0) for r in result["update_results"]
@@ -975,13 +1455,16 @@ class RecoveryService:
             r.get("total_skipped_existing", 0) for r in result["update_results"]
         )
 
+        message = f"{len(missing_dates)}개 누락 날짜 중 {total_crawled}건 크롤링, {total_updated}개 셀 업데이트"
+        if failed_sheets:
+            message += f", 시트 기록 실패: {', '.join(failed_sheets)}"
         result["summary"] = {
-            "status": "completed",
+            "status": "flush_failed" if failed_sheets else "completed",
             "missing_dates_count": len(missing_dates),
             "total_crawled": total_crawled,
             "total_updated": total_updated,
             "total_skipped_existing": total_skipped,
-            "message": f"{len(missing_dates)}개 누락 날짜 중 {total_crawled}건 크롤링, {total_updated}개 셀 업데이트"
+            "message": message
         }
 
         logger.info(f"✅ 누락 날짜 복구 완료: {result['summary']['message']}")
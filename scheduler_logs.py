@@ -3,12 +3,14 @@
 모든 스케줄러 작업의 실행 로그를 저장하고 조회
 
 핵심 기능:
-- 메모리 + 파일 기반 로그 저장 (최근 100개)
+- 메모리 + 파일 기반 로그 저장 (최근 100개, JSONL 추가 기록 + 주기적 압축)
 - 작업별 실행 상태, 시간, 결과 기록
 - API 엔드포인트를 통한 조회
 """
 import os
 import json
+import time
+import atexit
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -21,13 +23,24 @@ logger = logging.getLogger(__name__)
 # 기본 설정
 KST = pytz.timezone('Asia/Seoul')
 MAX_LOG_ENTRIES = 100
+COMPACT_EVERY = 500  # 추가 기록 N건마다 파일을 최근 로그만 남기도록 다시 씀
+
+# 연달아 들어오는 로그는 모아서 기록 (N건 또는 마지막 기록 후 일정 시간 경과 시)
+FLUSH_MAX_PENDING = 10
+FLUSH_INTERVAL_SECS = 0.5
+FLUSH_TIMER_SECS = 2.0  # 남은 로그를 백그라운드에서 기록하는 주기
+
+# 로그 한 줄 직렬화용 인코더 (json.dumps가 호출마다 인코더를 새로 만드는 비용 제거)
+_encode_line = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
 
 # Render Disk 경로 우선 사용
 DISK_PATH = "/var/data"
 if os.path.isdir(DISK_PATH):
-    DEFAULT_LOG_PATH = os.path.join(DISK_PATH, "scheduler_logs.json")
+    DEFAULT_LOG_PATH = os.path.join(DISK_PATH, "scheduler_logs.jsonl")
+    LEGACY_LOG_PATH = os.path.join(DISK_PATH, "scheduler_logs.json")
 else:
-    DEFAULT_LOG_PATH = os.path.join(os.getcwd(), "scheduler_logs.json")
+    DEFAULT_LOG_PATH = os.path.join(os.getcwd(), "scheduler_logs.jsonl")
+    LEGACY_LOG_PATH = os.path.join(os.getcwd(), "scheduler_logs.json")
 
 
 class SchedulerLogManager:
@@ -50,34 +63,188 @@ class SchedulerLogManager:
         
         self.log_file = os.getenv("SCHEDULER_LOG_FILE", DEFAULT_LOG_PATH)
         self.logs = deque(maxlen=MAX_LOG_ENTRIES)
+        self._write_lock = threading.Lock()
+        self._fp = None  # 추가 기록용 파일 핸들 (처음 기록할 때 열고 유지)
+        self._writes_since_compact = 0
+        self._pending_lines: List[str] = []  # 아직 파일에 쓰지 않은 JSONL 줄
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
+        # 요약용 집계 (로그 추가/밀려남 시 증감, 조회는 O(1))
+        self._status_counts: Dict[str, int] = {}
+        self._date_counts: Dict[str, int] = {}
+        # 작업별 최신 로그 (오래된 작업 → 최근 작업 순으로 유지)
+        self._latest_by_job: Dict[str, Dict] = {}
         self._load_logs()
+        atexit.register(self._flush_pending)
         self._initialized = True
     
     def _load_logs(self):
-        """파일에서 로그 로드"""
+        """파일에서 로그 로드
+
+        JSONL(한 줄에 로그 1건)을 순서대로 읽어 최근 MAX_LOG_ENTRIES개만 남긴다.
+        이전 형식({"logs": [...]} JSON)이면 읽은 뒤 JSONL로 다시 저장.
+        """
         try:
-            if os.path.exists(self.log_file):
-                with open(self.log_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    logs = data.get("logs", [])
-                    for log in logs[-MAX_LOG_ENTRIES:]:
-                        self.logs.append(log)
-                logger.info(f"Loaded {len(self.logs)} scheduler logs")
+            source = self.log_file
+            if not os.path.exists(source):
+                if os.getenv("SCHEDULER_LOG_FILE") or not os.path.exists(LEGACY_LOG_PATH):
+                    return
+                source = LEGACY_LOG_PATH
+
+            with open(source, "r", encoding="utf-8") as f:
+                content = f.read()
+
+            legacy_logs = self._parse_legacy(content)
+            if legacy_logs is not None:
+                self.logs.extend(legacy_logs[-MAX_LOG_ENTRIES:])
+                self._save_logs(durable=True)
+            else:
+                has_broken_line = False
+                for line in content.splitlines():
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self.logs.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # 기록 도중 중단된 마지막 줄 등은 건너뜀
+                        has_broken_line = True
+                if has_broken_line:
+                    # 깨진 줄 뒤에 이어 쓰지 않도록 정상 로그만으로 다시 저장
+                    self._save_logs(durable=True)
+
+            self._rebuild_counts()
+            logger.info(f"Loaded {len(self.logs)} scheduler logs")
         except Exception as e:
             logger.warning(f"Failed to load scheduler logs: {e}")
+
+    @staticmethod
+    def _parse_legacy(content: str) -> Optional[List[Dict]]:
+        """이전 형식({"updated_at": ..., "logs": [...]})이면 로그 리스트, 아니면 None"""
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            return None
+        if isinstance(data, dict) and isinstance(data.get("logs"), list):
+            return data["logs"]
+        return None
+
+    def _count_log(self, log: Dict, delta: int):
+        """상태별/날짜별 집계 증감 (0이 된 키는 제거해 남은 로그와 같은 키만 유지)"""
+        for counts, key in ((self._status_counts, log.get("status")), (self._date_counts, log.get("date"))):
+            count = counts.get(key, 0) + delta
+            if count > 0:
+                counts[key] = count
+            else:
+                counts.pop(key, None)
+
+    def _set_latest(self, log: Dict):
+        """작업별 최신 로그 갱신 (다시 넣어서 최근 작업이 뒤로 가도록)"""
+        job_id = log.get("job_id")
+        if job_id:
+            self._latest_by_job.pop(job_id, None)
+            self._latest_by_job[job_id] = log
+
+    def _rebuild_counts(self):
+        """현재 메모리 로그로 집계/작업별 최신 로그 다시 계산 (로드/정리 후)"""
+        self._status_counts = {}
+        self._date_counts = {}
+        self._latest_by_job = {}
+        for log in self.logs:
+            self._count_log(log, 1)
+            self._set_latest(log)
+
+    def _ensure_dir(self):
+        dir_path = os.path.dirname(self.log_file)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path, exist_ok=True)
+
+    def _append_log_line(self, log_entry: Dict):
+        """로그 1건을 메모리에 추가하고 파일 끝에 한 줄로 기록 (전체 파일을 다시 쓰지 않음)
+
+        바로 쓰지 않고 모아 두었다가 FLUSH_MAX_PENDING건이 쌓이거나
+        마지막 기록 후 FLUSH_INTERVAL_SECS가 지나면 한 번에 기록한다.
+        나머지는 백그라운드 타이머와 종료 시(atexit) 기록.
+        """
+        try:
+            with self._write_lock:
+                if len(self.logs) == self.logs.maxlen:
+                    # 가장 오래된 로그가 밀려나므로 집계에서 제외
+                    evicted = self.logs[0]
+                    self._count_log(evicted, -1)
+                    # 밀려난 로그가 그 작업의 최신 로그였다면 남은 로그가 없다는 뜻
+                    evicted_job = evicted.get("job_id")
+                    if self._latest_by_job.get(evicted_job) is evicted:
+                        del self._latest_by_job[evicted_job]
+                self.logs.append(log_entry)
+                self._count_log(log_entry, 1)
+                self._set_latest(log_entry)
+                self._pending_lines.append(_encode_line(log_entry) + "\n")
+                self._writes_since_compact += 1
+                needs_compact = self._writes_since_compact >= COMPACT_EVERY
+
+                if not needs_compact:
+                    if (len(self._pending_lines) >= FLUSH_MAX_PENDING
+                            or time.monotonic() - self._last_flush > FLUSH_INTERVAL_SECS):
+                        self._write_pending_locked()
+                    elif self._flush_timer is None:
+                        self._flush_timer = threading.Timer(FLUSH_TIMER_SECS, self._flush_pending)
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+
+            # 압축은 메모리 로그 전체를 다시 쓰므로 대기 중인 줄도 함께 반영됨
+            if needs_compact:
+                self._save_logs()
+        except Exception as e:
+            logger.warning(f"Failed to append scheduler log: {e}")
+
+    def _write_pending_locked(self):
+        """대기 중인 줄을 파일에 기록 (_write_lock을 잡은 상태에서 호출)"""
+        if self._pending_lines:
+            if self._fp is None:
+                self._ensure_dir()
+                self._fp = open(self.log_file, "a", encoding="utf-8")
+            self._fp.write("".join(self._pending_lines))
+            self._fp.flush()
+            self._pending_lines = []
+        self._last_flush = time.monotonic()
+
+    def _flush_pending(self):
+        """대기 중인 로그 기록 (타이머/종료 시 호출)"""
+        try:
+            with self._write_lock:
+                self._flush_timer = None
+                self._write_pending_locked()
+        except Exception as e:
+            logger.warning(f"Failed to flush scheduler logs: {e}")
     
-    def _save_logs(self):
-        """파일에 로그 저장"""
+    def _save_logs(self, durable: bool = False):
+        """파일을 현재 메모리 로그로 다시 씀 (압축, 임시 파일 + os.replace로 원자적 교체)
+
+        durable=True면 교체 전에 fsync (형식 변환/복구처럼 한 번뿐인 저장용).
+        주기적 압축은 지연을 줄이려고 fsync를 생략한다.
+        """
         try:
-            dir_path = os.path.dirname(self.log_file)
-            if dir_path and not os.path.exists(dir_path):
-                os.makedirs(dir_path, exist_ok=True)
-            
-            with open(self.log_file, "w", encoding="utf-8") as f:
-                json.dump({
-                    "updated_at": datetime.now(KST).isoformat(),
-                    "logs": list(self.logs)
-                }, f, ensure_ascii=False, indent=2)
+            with self._write_lock:
+                # 직렬화는 파일을 열기 전에 끝내고, 한 번의 write로 기록
+                payload = "".join(_encode_line(log) + "\n" for log in self.logs)
+
+                self._ensure_dir()
+
+                if self._fp is not None:
+                    self._fp.close()
+                    self._fp = None
+                # 대기 중이던 줄은 payload(메모리 로그 전체)에 이미 포함
+                self._pending_lines = []
+
+                tmp_path = f"{self.log_file}.tmp"
+                with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+                    f.write(payload)
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, self.log_file)
+                self._writes_since_compact = 0
         except Exception as e:
             logger.warning(f"Failed to save scheduler logs: {e}")
     
@@ -112,8 +279,7 @@ class SchedulerLogManager:
             "time": now.strftime("%H:%M:%S"),
         }
         
-        self.logs.append(log_entry)
-        self._save_logs()
+        self._append_log_line(log_entry)
         
         # 콘솔 로그도 출력
         status_emoji = {"started": "🚀", "success": "✅", "failed": "❌"}.get(status, "📝")
@@ -138,58 +304,54 @@ class SchedulerLogManager:
         """
         results = []
         
-        for log in reversed(list(self.logs)):
-            if job_id and log.get("job_id") != job_id:
-                continue
-            if status and log.get("status") != status:
-                continue
-            if date_from and log.get("date", "") < date_from:
-                continue
-            
-            results.append(log)
-            if len(results) >= limit:
-                break
+        # 복사 없이 deque를 뒤에서부터 순회 (추가 기록과 겹치지 않도록 잠금)
+        with self._write_lock:
+            for log in reversed(self.logs):
+                if job_id and log.get("job_id") != job_id:
+                    continue
+                if status and log.get("status") != status:
+                    continue
+                if date_from and log.get("date", "") < date_from:
+                    continue
+                
+                results.append(log)
+                if len(results) >= limit:
+                    break
         
         return results
     
     def get_latest_by_job(self) -> Dict[str, Dict]:
-        """각 작업별 최신 로그 조회"""
-        latest = {}
-        
-        for log in reversed(list(self.logs)):
-            job_id = log.get("job_id")
-            if job_id and job_id not in latest:
-                latest[job_id] = log
-        
-        return latest
+        """각 작업별 최신 로그 조회 (최근에 실행된 작업 순)"""
+        return dict(reversed(self._latest_by_job.items()))
     
     def get_summary(self) -> Dict:
         """로그 요약 통계"""
         total = len(self.logs)
-        success = sum(1 for l in self.logs if l.get("status") == "success")
-        failed = sum(1 for l in self.logs if l.get("status") == "failed")
+        success = self._status_counts.get("success", 0)
+        failed = self._status_counts.get("failed", 0)
         
         # 오늘 로그
         today = datetime.now(KST).strftime("%Y-%m-%d")
-        today_logs = [l for l in self.logs if l.get("date") == today]
         
         return {
             "total_logs": total,
             "success_count": success,
             "failed_count": failed,
-            "today_count": len(today_logs),
+            "today_count": self._date_counts.get(today, 0),
             "latest_by_job": self.get_latest_by_job()
         }
     
     def clear_old_logs(self, days: int = 7):
         """오래된 로그 정리"""
         cutoff = (datetime.now(KST) - timedelta(days=days)).strftime("%Y-%m-%d")
-        old_count = len(self.logs)
-        
-        self.logs = deque(
-            (l for l in self.logs if l.get("date", "") >= cutoff),
-            maxlen=MAX_LOG_ENTRIES
-        )
+        with self._write_lock:
+            old_count = len(self.logs)
+            
+            self.logs = deque(
+                (l for l in self.logs if l.get("date", "") >= cutoff),
+                maxlen=MAX_LOG_ENTRIES
+            )
+            self._rebuild_counts()
         
         removed = old_count - len(self.logs)
         if removed > 0:
@@ -3,9 +3,16 @@ import json
 import re
 import time
 import random
-from typing import Dict, List, Set, Any, Tuple, Callable
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Set, Any, Tuple, Callable, Iterator
 
 import gspread
+import requests
+from gspread.utils import absolute_range_name, fill_gaps, rowcol_to_a1
 from google.oauth2.service_account import Credentials
 
 # 환경변수 기본 키
@@ -32,7 +39,13 @@ SYNONYMS: Dict[str, List[str]] = {
 	"DAILY_WORKLOAD_COLUMN": ["일 작업량", "일작업량"],
 }
 
-TRUTHY_VALUES = {"true", "1", "yes", "y", "o", "ok", "checked", "done", "완료", "예", "y", "yy", "ㅇ", "ㅇㅇ", "o", "O", "✓", "✔"}
+# _is_truthy는 소문자로 바꾼 값과 비교하므로 소문자만 보관
+TRUTHY_VALUES = frozenset({"true", "1", "yes", "y", "o", "ok", "checked", "done", "완료", "예", "yy", "ㅇ", "ㅇㅇ", "✓", "✔"})
+# 이보다 긴 값은 소문자 변환 없이 바로 False (lower()는 길이를 줄이지 않음)
+_TRUTHY_MAX_LEN = max(len(v) for v in TRUTHY_VALUES)
+
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?[\d.]+")
 
 
 class Settings:
@@ -99,68 +112,283 @@ def _build_credentials() -> Credentials:
 	raise RuntimeError("서비스 계정 인증정보가 없습니다. SERVICE_ACCOUNT_JSON 또는 GOOGLE_APPLICATION_CREDENTIALS를 설정하세요.")
 
 
+# 인증된 클라이언트와 스프레드시트 핸들은 모듈 단위로 재사용
+# (액세스 토큰은 google-auth 세션이 만료 시 자동 갱신)
+_CLIENT: gspread.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+_SS_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
 def _get_client() -> gspread.Client:
-	creds = _build_credentials()
-	return gspread.authorize(creds)
+	global _CLIENT
+	if _CLIENT is None:
+		with _CLIENT_LOCK:
+			if _CLIENT is None:
+				creds = _build_credentials()
+				_CLIENT = gspread.authorize(creds)
+	return _CLIENT
+
+
+@lru_cache(maxsize=None)
+def _env_number(name: str, default: Any, cast: Callable[[str], Any] = int) -> Any:
+	"""숫자형 환경변수를 처음 쓸 때 한 번만 읽어 고정한다 (잘못된 값이면 기본값).
+
+	app.py가 이 모듈을 import한 뒤에 load_dotenv()를 호출하므로 import 시점이 아니라
+	첫 호출 시점에 읽는다.
+	"""
+	try:
+		return cast(os.getenv(name, str(default)).strip())
+	except Exception:
+		return default
+
+
+def _get_ss_cache_ttl_secs() -> int:
+	return _env_number("SPREADSHEET_CACHE_TTL_SECS", 60)
+
+
+def _get_spreadsheet(spreadsheet_id: str) -> gspread.Spreadsheet:
+	"""open_by_key 결과(메타데이터 조회 1회)를 환경변수 SPREADSHEET_CACHE_TTL_SECS(기본 60초) 동안 재사용."""
+	entry = _SS_CACHE.get(spreadsheet_id)
+	if entry and (_now() - entry.get('ts', 0)) <= _get_ss_cache_ttl_secs():
+		return entry['value']
+	ss = _get_client().open_by_key(spreadsheet_id)
+	_SS_CACHE[spreadsheet_id] = {"value": ss, "ts": _now()}
+	return ss
+
+
+def _get_worksheets(ss: gspread.Spreadsheet) -> List[gspread.Worksheet]:
+	"""ss.worksheets()(호출마다 메타데이터 조회 1회) 결과를 _get_spreadsheet 캐시 항목과 함께 재사용.
+
+	캐시 항목이 만료되어 스프레드시트 핸들이 바뀌면 목록도 다시 조회한다.
+	"""
+	entry = _SS_CACHE.get(ss.id)
+	if entry is None or entry.get("value") is not ss:
+		return ss.worksheets()
+	ws_list = entry.get("worksheets")
+	if ws_list is None:
+		ws_list = entry["worksheets"] = ss.worksheets()
+	return list(ws_list)
 
 
 # -----------------------
 # 읽기 요청 최소화를 위한 간단 캐시
 # 환경변수 READ_CACHE_TTL_SECS (기본 120초)
 # -----------------------
-_WS_CACHE: Dict[int, Dict[str, Any]] = {}
+# 키: (spreadsheet_id, worksheet id) — gid는 스프레드시트마다 0부터 겹치므로 스프레드시트까지 포함
+_WS_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
 
 def _now() -> float:
 	return time.time()
 
 def _get_cache_ttl_secs() -> int:
+	return _env_number("READ_CACHE_TTL_SECS", 120)
+
+# 헤더 행 탐지 결과 캐시 (헤더는 거의 바뀌지 않으므로 데이터 캐시보다 길게 유지)
+# 키: (spreadsheet_id, worksheet id, 설정된 컬럼명들), 환경변수 HEADER_CACHE_TTL_SECS (기본 300초)
+_HEADER_CACHE: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+def _get_header_cache_ttl_secs() -> int:
+	return _env_number("HEADER_CACHE_TTL_SECS", 300)
+
+# 재시도할 API 응답 코드 (쿼터 초과 / 일시적 서버 오류)
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+# 재시도할 연결/타임아웃 예외 (OSError 전체가 아님: 키 파일 없음 같은 로컬 I/O 오류는 바로 raise)
+_TRANSIENT_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, TimeoutError)
+
+def _is_transient_error(e: Exception) -> bool:
+	"""일시적 오류만 True: 429/5xx APIError, 연결/타임아웃 오류."""
+	if isinstance(e, gspread.exceptions.APIError):
+		return getattr(getattr(e, "response", None), "status_code", None) in _RETRYABLE_STATUS
+	return isinstance(e, _TRANSIENT_EXCEPTIONS)
+
+def _retry_after_secs(e: Exception) -> float | None:
+	"""APIError가 알려 준 재시도 대기 시간(초): Retry-After 헤더, 없으면 RetryInfo.retryDelay (예: '30s')."""
+	if not isinstance(e, gspread.exceptions.APIError):
+		return None
+	response = getattr(e, "response", None)
+	retry_after = response.headers.get("Retry-After") if response is not None else None
+	if retry_after:
+		try:
+			return float(retry_after)
+		except ValueError:
+			pass
 	try:
-		return int(os.getenv("READ_CACHE_TTL_SECS", "120").strip())
-	except Exception:
-		return 120
+		for detail in (getattr(e, "error", None) or {}).get("details", []):
+			retry_delay = str(detail.get("retryDelay") or "")
+			if retry_delay.endswith("s"):
+				return float(retry_delay[:-1])
+	except (AttributeError, TypeError, ValueError):
+		pass
+	return None
 
 def _with_retry(func: Callable, *args: Any, **kwargs: Any) -> Any:
-	"""지수 백오프 재시도 (429/5xx 완화). 환경변수로 조정 가능.
+	"""지수 백오프 재시도 (429/5xx·연결 오류만, 그 외 오류는 바로 raise). 환경변수로 조정 가능.
+
+	서버가 대기 시간(Retry-After / retryDelay)을 알려 주면 백오프보다 길 때 그 값을 따르되,
+	요청 스레드/스케줄러 작업이 오래 묶이지 않도록 RETRY_MAX_DELAY까지만 기다린다.
 
 	- RETRY_MAX_ATTEMPTS (기본 6)
 	- RETRY_BASE_DELAY (초, 기본 0.8)
+	- RETRY_MAX_DELAY (초, 기본 30)
 	"""
-	try:
-		max_attempts = int(os.getenv("RETRY_MAX_ATTEMPTS", "6").strip())
-	except Exception:
-		max_attempts = 6
-	try:
-		base = float(os.getenv("RETRY_BASE_DELAY", "0.8").strip())
-	except Exception:
-		base = 0.8
+	max_attempts = _env_number("RETRY_MAX_ATTEMPTS", 6)
+	base = _env_number("RETRY_BASE_DELAY", 0.8, float)
+	max_delay = _env_number("RETRY_MAX_DELAY", 30.0, float)
 	for attempt in range(max_attempts):
 		try:
 			return func(*args, **kwargs)
-		except Exception:
-			if attempt == max_attempts - 1:
+		except Exception as e:
+			if attempt == max_attempts - 1 or not _is_transient_error(e):
 				raise
 			delay = base * (2 ** attempt) + random.uniform(0, 0.4)
+			retry_after = _retry_after_secs(e)
+			if retry_after is not None:
+				delay = max(delay, min(retry_after, max_delay))
 			time.sleep(delay)
 
+def _ws_cache_id(ws: gspread.Worksheet) -> Tuple[str, int]:
+	try:
+		ws_id = int(getattr(ws, 'id', 0) or 0)
+	except Exception:
+		ws_id = 0
+	return (str(getattr(ws, 'spreadsheet_id', '') or ''), ws_id)
+
+# 스프레드시트 수정 시각(Drive modifiedTime) 캐시: 키 spreadsheet_id
+# 환경변수 MODIFIED_CHECK_SECS (기본 10초, 0 이하이면 수정 시각 확인 안 함) 동안 재조회하지 않음
+_MODIFIED_CACHE: Dict[str, Dict[str, Any]] = {}
+
+def _get_modified_check_secs() -> int:
+	return _env_number("MODIFIED_CHECK_SECS", 10)
+
+def _get_modified_time(spreadsheet_id: str | None) -> str | None:
+	"""Drive files.get(fields=modifiedTime)으로 스프레드시트 수정 시각을 조회 (실패·비활성 시 None)."""
+	if not spreadsheet_id or _get_modified_check_secs() <= 0:
+		return None
+	entry = _MODIFIED_CACHE.get(spreadsheet_id)
+	if entry and (_now() - entry.get('ts', 0)) <= _get_modified_check_secs():
+		return entry.get('value')
+	try:
+		resp = _authed_session().get(
+			f"https://www.googleapis.com/drive/v3/files/{spreadsheet_id}",
+			params={"fields": "modifiedTime", "supportsAllDrives": "true"},
+		)
+		resp.raise_for_status()
+		value = resp.json().get("modifiedTime")
+	except Exception:
+		value = None
+	_MODIFIED_CACHE[spreadsheet_id] = {"value": value, "ts": _now()}
+	return value
+
+def _store_cached_values(ws: gspread.Worksheet, values: List[List[str]], modified: str | None) -> None:
+	"""전체 값을 캐시에 저장. modified는 값을 읽기 직전에 조회한 스프레드시트 수정 시각."""
+	key = _ws_cache_id(ws)
+	_WS_CACHE[key] = {"values": values, "ts": _now(), "modified": modified, "spreadsheet_id": key[0]}
+
+def _get_cached_values(ws: gspread.Worksheet) -> List[List[str]] | None:
+	"""캐시된 전체 값 (없으면 None).
+
+	TTL 안이면 그대로 쓰고, TTL이 지났어도 읽은 뒤로 스프레드시트가 수정되지 않았으면
+	(Drive modifiedTime 동일) 다시 읽지 않고 TTL을 연장한다.
+	"""
+	entry = _WS_CACHE.get(_ws_cache_id(ws))
+	if not entry:
+		return None
+	values = entry.get('values')
+	if not isinstance(values, list):
+		return None
+	if (_now() - entry.get('ts', 0)) <= _get_cache_ttl_secs():
+		return values
+	modified = entry.get('modified')
+	if modified is not None and modified == _get_modified_time(entry.get('spreadsheet_id')):
+		entry['ts'] = _now()
+		return values
+	return None
+
+# values.batchGet 한 번에 보낼 최대 범위 수
+BATCH_GET_MAX_RANGES = 100
+
+def _prefetch_all_values(ss: gspread.Spreadsheet, worksheets: List[gspread.Worksheet]) -> None:
+	"""캐시에 없는 워크시트들의 전체 값을 values.batchGet 한 번으로 읽어 _WS_CACHE에 채운다.
+
+	탭마다 get_values(헤더) + get_all_values(데이터) 2회 호출하던 것을 요청 1회로 줄인다.
+	실패하면 채우지 않고 넘어가며, 각 워크시트는 기존 개별 조회 경로를 그대로 탄다.
+	"""
+	stale = [ws for ws in worksheets if _get_cached_values(ws) is None]
+	if not stale:
+		return
+	modified = _get_modified_time(getattr(ss, "id", None))
+	for start in range(0, len(stale), BATCH_GET_MAX_RANGES):
+		chunk = stale[start:start + BATCH_GET_MAX_RANGES]
+		try:
+			resp = _with_retry(ss.values_batch_get, [absolute_range_name(ws.title) for ws in chunk])
+		except Exception:
+			continue
+		value_ranges = resp.get("valueRanges", [])
+		if len(value_ranges) != len(chunk):
+			continue
+		for ws, vr in zip(chunk, value_ranges):
+			# get_all_values와 같은 모양으로 (빈 칸 패딩)
+			_store_cached_values(ws, fill_gaps(vr.get("values", [[]])), modified)
+
+def _get_fetch_workers() -> int:
+	"""개별 워크시트 조회 동시 실행 수. 환경변수 SHEET_FETCH_WORKERS (기본 8)."""
+	return max(1, _env_number("SHEET_FETCH_WORKERS", 8))
+
+def _load_worksheets(ss: gspread.Spreadsheet, worksheets: List[gspread.Worksheet], settings: Settings | None = None) -> None:
+	"""워크시트 전체 값과 헤더를 미리 읽어 캐시에 채운다 (settings가 없으면 값만).
+
+	values.batchGet 한 번을 먼저 시도하고, 그래도 캐시에 없는 탭(배치 실패 등)은
+	스레드 풀로 동시에 개별 조회한다. 이후 탭별 처리 루프는 캐시만 읽는다.
+	"""
+	_prefetch_all_values(ss, worksheets)
+	missing = [ws for ws in worksheets if _get_cached_values(ws) is None]
+	if not missing:
+		return
+
+	def warm(ws: gspread.Worksheet) -> None:
+		# 실패는 무시: 본 루프에서 같은 경로로 다시 조회/처리됨
+		try:
+			_get_all_values_full_cached(ws)
+			if settings is not None:
+				_find_header_row(ws, settings)
+		except Exception:
+			pass
+
+	if len(missing) == 1:
+		warm(missing[0])
+		return
+	with ThreadPoolExecutor(max_workers=min(_get_fetch_workers(), len(missing))) as ex:
+		list(ex.map(warm, missing))
+
+def _leading_rows(values: List[List[str]], limit: int) -> List[List[str]]:
+	"""전체 값에서 ws.get_values('1:limit') 결과를 재현한다.
+
+	API처럼 행 끝 빈 칸과 끝쪽 빈 행을 잘라낸 뒤 다시 사각형으로 패딩.
+	"""
+	rows: List[List[str]] = []
+	for row in values[:limit]:
+		end = len(row)
+		while end and row[end - 1] == "":
+			end -= 1
+		rows.append(row[:end])
+	while rows and not rows[-1]:
+		rows.pop()
+	return fill_gaps(rows)
+
 def _get_all_values_full_cached(ws: gspread.Worksheet) -> List[List[str]]:
 	"""워크시트 전체 값을 읽는다. 캐시를 우선 사용하고, 필요 시 배치 스캔으로 폴백.
 
 	반환 형태는 get_all_values와 동일.
 	"""
-	try:
-		ws_id = int(getattr(ws, 'id', 0) or 0)
-	except Exception:
-		ws_id = 0
-	entry = _WS_CACHE.get(ws_id)
-	if entry and (_now() - entry.get('ts', 0)) <= _get_cache_ttl_secs():
-		values = entry.get('values')
-		if isinstance(values, list):
-			return values
+	values = _get_cached_values(ws)
+	if values is not None:
+		return values
+	modified = _get_modified_time(getattr(ws, "spreadsheet_id", None))
 
 	# 1) 단일 호출 우선
 	try:
 		values = _with_retry(ws.get_all_values)
-		_WS_CACHE[ws_id] = {"values": values, "ts": _now()}
+		_store_cached_values(ws, values, modified)
 		return values
 	except Exception:
 		pass
@@ -171,15 +399,12 @@ def _get_all_values_full_cached(ws: gspread.Worksheet) -> List[List[str]]:
 	except Exception:
 		total = 0
 	if total <= 0:
-		_WS_CACHE[ws_id] = {"values": [], "ts": _now()}
+		_store_cached_values(ws, [], modified)
 		return []
 
 	all_values: List[List[str]] = []
 	chunk = 5000
-	try:
-		chunk_sleep = float(os.getenv("CHUNK_SLEEP_SECS", "0.25").strip())
-	except Exception:
-		chunk_sleep = 0.25
+	chunk_sleep = _env_number("CHUNK_SLEEP_SECS", 0.25, float)
 	last_non_empty_row = 0
 	for start in range(1, total + 1, chunk):
 		end = min(total, start + chunk - 1)
@@ -198,7 +423,7 @@ def _get_all_values_full_cached(ws: gspread.Worksheet) -> List[List[str]]:
 		# 청크 간 대기 (RPM 완화)
 		time.sleep(chunk_sleep)
 
-	_WS_CACHE[ws_id] = {"values": all_values, "ts": _now()}
+	_store_cached_values(ws, all_values, modified)
 	return all_values
 
 
@@ -206,8 +431,23 @@ def _normalize_key(key: str) -> str:
 	return (key or "").strip()
 
 
+@lru_cache(maxsize=4096)
 def _collapse_spaces(s: str) -> str:
-	return re.sub(r"\s+", "", s or "").strip().lower()
+	# 모든 공백 제거 후 소문자 (split()은 정규식 \s와 같은 공백 문자 기준)
+	# 입력은 대부분 반복되는 헤더/설정 문자열이므로 결과를 메모이즈
+	return "".join((s or "").split()).lower()
+
+
+# 동의어는 모듈 로드 시 한 번만 정규화 (헤더 매칭 루프에서 재계산하지 않음)
+_NORMALIZED_SYNONYMS: Dict[str, frozenset] = {
+	key_id: frozenset(_collapse_spaces(syn) for syn in syns)
+	for key_id, syns in SYNONYMS.items()
+}
+# 우선순위(목록 순서)가 필요한 조회용 (_get_value_flexible)
+_ORDERED_SYNONYMS: Dict[str, Tuple[str, ...]] = {
+	key_id: tuple(_collapse_spaces(syn) for syn in syns)
+	for key_id, syns in SYNONYMS.items()
+}
 
 
 def _parse_int_maybe(value: Any) -> int | None:
@@ -216,7 +456,12 @@ def _parse_int_maybe(value: Any) -> int | None:
 	s = str(value).strip()
 	if s == "":
 		return None
-	m = re.search(r"-?\d+", s)
+	# 대부분의 셀은 "3", "-1" 같은 순수 정수 문자열 → 정규식 없이 바로 변환
+	if s.isdecimal():
+		return int(s)
+	if s[0] == "-" and s[1:].isdecimal():
+		return int(s)
+	m = _INT_RE.search(s)
 	if not m:
 		return None
 	try:
@@ -226,39 +471,85 @@ def _parse_int_maybe(value: Any) -> int | None:
 
 
 def _is_truthy(value: Any) -> bool:
-	if value is None:
+	if value is None or value == "":
 		return False
-	s = str(value).strip().lower()
-	return s in TRUTHY_VALUES
+	# 셀 값은 거의 항상 str → str() 변환 생략
+	s = value.strip() if isinstance(value, str) else str(value).strip()
+	if not s or len(s) > _TRUTHY_MAX_LEN:
+		return False
+	return s.lower() in TRUTHY_VALUES
 
 
+@lru_cache(maxsize=4096)
 def _matches(header: str, preferred_key: str, key_id: str) -> bool:
 	h = _collapse_spaces(header)
-	p = _collapse_spaces(preferred_key)
-	if h == p:
-		return True
-	for syn in SYNONYMS.get(key_id, []):
-		if h == _collapse_spaces(syn):
-			return True
-	return False
+	return h == _collapse_spaces(preferred_key) or h in _NORMALIZED_SYNONYMS.get(key_id, frozenset())
+
+
+@lru_cache(maxsize=1024)
+def _resolve_flexible_key(keys: Tuple[str, ...], preferred_key: str, key_id: str) -> str | None:
+	"""레코드 키 목록에서 preferred_key에 해당하는 실제 키 (없으면 None).
+
+	같은 워크시트의 행들은 키 목록이 같으므로 행마다 다시 정규화하지 않도록 캐시한다.
+	"""
+	# 직접 키
+	if preferred_key in keys:
+		return preferred_key
+	# 정규화 키 -> 원래 키 (정규화 결과가 같은 키가 여럿이면 앞선 키)
+	norm_to_key: Dict[str, str] = {}
+	for k in keys:
+		norm_to_key.setdefault(_collapse_spaces(k), k)
+	# 공백/소문자 동치, 그다음 동의어 (SYNONYMS 목록 순서)
+	for norm in (_collapse_spaces(preferred_key),) + _ORDERED_SYNONYMS.get(key_id, ()):
+		k = norm_to_key.get(norm)
+		if k is not None:
+			return k
+	return None
 
 
 def _get_value_flexible(row: Dict[str, Any], preferred_key: str, key_id: str) -> Any:
 	# 직접 키
 	if preferred_key in row:
 		return row.get(preferred_key)
-	# 공백/소문자 동치
-	pref_norm = _collapse_spaces(preferred_key)
-	for k in row.keys():
-		if _collapse_spaces(k) == pref_norm:
-			return row.get(k)
-	# 동의어
-	for syn in SYNONYMS.get(key_id, []):
-		syn_norm = _collapse_spaces(syn)
-		for k in row.keys():
-			if _collapse_spaces(k) == syn_norm:
-				return row.get(k)
-	return None
+	k = _resolve_flexible_key(tuple(row), preferred_key, key_id)
+	return row.get(k) if k is not None else None
+
+
+def _resolve_positions(headers: List[str], settings: Settings) -> Dict[str, int | None]:
+	"""논리 컬럼(key_id) → 헤더 열 인덱스. 워크시트당 1회 계산해 행마다 인덱스로 접근.
+
+	_build_records 행 dict에 _get_value_flexible을 적용한 것과 같은 열을 고른다
+	(같은 헤더가 여러 번 나오면 마지막 열, 직접 키 → 공백/소문자 동치 → 동의어 순).
+	"""
+	key_to_idx: Dict[str, int] = {}
+	for i, h in enumerate(headers):
+		key_to_idx[_normalize_key(h)] = i
+	norm_keys = [(k, _collapse_spaces(k)) for k in key_to_idx]
+
+	def resolve(preferred_key: str, key_id: str) -> int | None:
+		if preferred_key in key_to_idx:
+			return key_to_idx[preferred_key]
+		pref_norm = _collapse_spaces(preferred_key)
+		for k, k_norm in norm_keys:
+			if k_norm == pref_norm:
+				return key_to_idx[k]
+		for syn in SYNONYMS.get(key_id, []):
+			syn_norm = _collapse_spaces(syn)
+			for k, k_norm in norm_keys:
+				if k_norm == syn_norm:
+					return key_to_idx[k]
+		return None
+
+	return {
+		"AGENCY_COLUMN": resolve(settings.agency_col, "AGENCY_COLUMN"),
+		"INTERNAL_COLUMN": resolve(settings.internal_col, "INTERNAL_COLUMN"),
+		"REMAINING_DAYS_COLUMN": resolve(settings.remaining_days_col, "REMAINING_DAYS_COLUMN"),
+		"CHECKED_COLUMN": resolve(settings.checked_col, "CHECKED_COLUMN"),
+		"BIZNAME_COLUMN": resolve(settings.bizname_col, "BIZNAME_COLUMN"),
+		"PRODUCT_COLUMN": resolve(settings.product_col, "PRODUCT_COLUMN"),
+		"PRODUCT_NAME_COLUMN": resolve(settings.product_name_col, "PRODUCT_NAME_COLUMN"),
+		"DAILY_WORKLOAD_COLUMN": resolve(settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN"),
+	}
 
 
 def _find_header_row(ws: gspread.Worksheet, settings: Settings) -> Tuple[int, List[str]]:
@@ -272,23 +563,60 @@ def _find_header_row(ws: gspread.Worksheet, settings: Settings) -> Tuple[int, Li
 		"PRODUCT_NAME_COLUMN": settings.product_name_col,
 		"DAILY_WORKLOAD_COLUMN": settings.daily_workload_col,
 	}
-	try:
-		candidates = _with_retry(ws.get_values, '1:100')  # 상단 100행 탐색 (재시도 적용)
-	except Exception:
-		candidates = []
+	columns_key = tuple(required_map.values())
+	cache_key = (getattr(ws, 'spreadsheet_id', ''), getattr(ws, 'id', None), columns_key)
+	# 전체 값 스냅샷이 캐시돼 있으면 헤더는 반드시 같은 스냅샷에서 구한다
+	# (헤더 캐시가 값보다 오래 살아 열이 밀린 뒤 엉뚱한 열을 읽고 쓰는 것 방지).
+	# 스냅샷별 결과는 _WS_CACHE 항목에 보관해 값과 함께 만료되게 한다.
+	cached_values = _get_cached_values(ws)
+	snapshot = _WS_CACHE.get(_ws_cache_id(ws)) if cached_values else None
+	if snapshot is not None:
+		memo = snapshot.setdefault("headers", {}).get(columns_key)
+		if memo:
+			header_row, headers = memo
+			return header_row, list(headers)
+	else:
+		entry = _HEADER_CACHE.get(cache_key)
+		if entry and (_now() - entry.get('ts', 0)) <= _get_header_cache_ttl_secs():
+			header_row, headers = entry['value']
+			return header_row, list(headers)
+
+	# 키별로 허용되는 정규화 헤더 집합 (설정값 + 동의어), 후보 행마다 재사용
+	match_sets = {
+		key_id: _NORMALIZED_SYNONYMS.get(key_id, frozenset()) | {_collapse_spaces(pref)}
+		for key_id, pref in required_map.items()
+	}
+	remaining_set = match_sets["REMAINING_DAYS_COLUMN"]
+	bizname_set = match_sets["BIZNAME_COLUMN"]
+	any_key_set = frozenset().union(*match_sets.values())
 
 	def score_headers(headers: List[str]) -> tuple[int, int]:
-		has_remaining = any(_matches(h, settings.remaining_days_col, "REMAINING_DAYS_COLUMN") for h in headers)
-		has_bizname = any(_matches(h, settings.bizname_col, "BIZNAME_COLUMN") for h in headers)
+		norms = [_collapse_spaces(h) for h in headers]
+		has_remaining = any(h in remaining_set for h in norms)
+		has_bizname = any(h in bizname_set for h in norms)
 		essentials = int(has_remaining) + int(has_bizname)
-		total = 0
-		for header in headers:
-			for key_id, pref in required_map.items():
-				if _matches(header, pref, key_id):
-					total += 1
-					break
+		total = sum(1 for h in norms if h in any_key_set)
 		return essentials, total
 
+	fetched = True
+	if cached_values:
+		# 전체 값이 이미 캐시돼 있으면 (예: _prefetch_all_values) 추가 요청 없이 상단 100행 사용
+		candidates = _leading_rows(cached_values, 100)
+	else:
+		# 흔한 경우(1행이 헤더): 1행에 필수 컬럼(남은 작업일수, 상호명)이 모두 있으면 100행 조회 생략
+		try:
+			first_row = _with_retry(ws.row_values, 1)
+		except Exception:
+			first_row = []
+		if score_headers([str(h).strip() for h in first_row])[0] == 2:
+			candidates = [first_row]
+		else:
+			try:
+				candidates = _with_retry(ws.get_values, '1:100')  # 상단 100행 탐색 (재시도 적용)
+			except Exception:
+				candidates = []
+				fetched = False
+
 	best_idx = 1
 	best_headers: List[str] = []
 	best_tuple = (-1, -1)
@@ -304,7 +632,17 @@ def _find_header_row(ws: gspread.Worksheet, settings: Settings) -> Tuple[int, Li
 			best_headers = [h.strip() for h in _with_retry(ws.row_values, 1)]
 		except Exception:
 			best_headers = []
+			fetched = False
 		best_idx = 1
+
+	# 읽기에 실패한 결과는 캐시하지 않음 (다음 호출에서 다시 시도)
+	if snapshot is not None:
+		if fetched:
+			snapshot["headers"][columns_key] = (best_idx, list(best_headers))
+	elif fetched:
+		_HEADER_CACHE[cache_key] = {"value": (best_idx, list(best_headers)), "ts": _now()}
+	else:
+		_HEADER_CACHE.pop(cache_key, None)
 	return best_idx, best_headers
 
 
@@ -317,67 +655,141 @@ def _build_records(ws: gspread.Worksheet, header_row: int, headers: List[str]) -
 	if header_row - 1 >= len(values):
 		return []
 	data_rows = values[header_row:]
+	# 키 정규화는 워크시트당 1회 (레코드 키는 _normalize_key 적용 상태)
+	keys = [_normalize_key(h) for h in headers]
+	n_keys = len(keys)
 	records: List[Dict[str, Any]] = []
 	for row in data_rows:
-		if all((str(c).strip() == "" for c in row)):
+		if not "".join(row).strip():
+			# 모든 칸이 공백뿐인 행 (셀 값은 모두 str)
 			continue
-		row_dict: Dict[str, Any] = {}
-		for i, h in enumerate(headers):
-			key = _normalize_key(h)
-			val = row[i] if i < len(row) else ""
-			row_dict[key] = val
-		records.append(row_dict)
+		if len(row) < n_keys:
+			row = row + [""] * (n_keys - len(row))
+		records.append(dict(zip(keys, row)))
 	return records
 
 
+def _nested_sum_dict(depth: int) -> defaultdict:
+	"""depth단 중첩 defaultdict (마지막 단은 int 합계). 집계 시 setdefault 체인 대신 사용."""
+	if depth <= 1:
+		return defaultdict(int)
+	return defaultdict(lambda: _nested_sum_dict(depth - 1))
+
+
+def _format_names(name_to_wl: Dict[str, int]) -> List[str]:
+	"""상호명 -> 일작업량 합계를 이름순 표시 문자열로 (합계가 0이면 이름만)."""
+	return [f"{name} (일작업량 {wl_sum})" if wl_sum > 0 else name for name, wl_sum in sorted(name_to_wl.items())]
+
+
+# '기타' 탭은 작업명으로 '상품 명' 값을 사용
+_MISC_NORM = _collapse_spaces("기타")
+
+
+# _iter_rows가 돌려주는 튜플의 필드 순서
+_ROW_FIELDS = (
+	"AGENCY_COLUMN",
+	"INTERNAL_COLUMN",
+	"REMAINING_DAYS_COLUMN",
+	"CHECKED_COLUMN",
+	"BIZNAME_COLUMN",
+	"PRODUCT_COLUMN",
+	"PRODUCT_NAME_COLUMN",
+	"DAILY_WORKLOAD_COLUMN",
+)
+
+
+def _extract_rows(values: List[List[str]], header_row: int, positions: Dict[str, int | None], require_bizname: bool = False) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+	"""헤더 아래의 비어 있지 않은 행마다 (시트 행 번호(1-based), _ROW_FIELDS 순서의 값 튜플).
+
+	행 dict 없이 미리 구한 열 위치로 필요한 칸만 꺼낸다. 값은 _build_records 레코드에
+	_get_value_flexible을 쓴 결과와 같다 (없는 컬럼은 None, 행 길이를 넘는 칸은 "").
+	require_bizname=True면 상호명 칸이 빈 행도 건너뛴다 (어차피 버리는 호출부용):
+	행 전체 대신 상호명 칸 하나만 확인.
+	"""
+	idx = [positions.get(key_id) for key_id in _ROW_FIELDS]
+	width = max((i for i in idx if i is not None), default=-1) + 1
+	# 없는 컬럼은 행 끝에 덧붙인 None 칸(width)을 가리키게 해서 itemgetter 한 번으로 추출
+	getter = itemgetter(*(width if i is None else i for i in idx))
+	biz_pos = positions.get("BIZNAME_COLUMN")
+	if require_bizname and biz_pos is None:
+		return
+	for row_num, row in enumerate(values[header_row:], start=header_row + 1):
+		if require_bizname:
+			if biz_pos >= len(row) or not str(row[biz_pos]).strip():
+				continue
+		elif not "".join(row).strip():
+			# 모든 칸이 공백뿐인 행 (셀 값은 모두 str)
+			continue
+		cells = row[:width]
+		cells += [""] * (width - len(cells))
+		cells.append(None)
+		yield row_num, getter(cells)
+
+
+def _tab_values(ws: gspread.Worksheet) -> List[List[str]]:
+	"""워크시트 전체 값 (읽기 실패 시 빈 목록 = 데이터 행 없음)."""
+	try:
+		return _get_all_values_full_cached(ws)
+	except Exception:
+		return []
+
+
+def _iter_rows(ws: gspread.Worksheet, header_row: int, positions: Dict[str, int | None]) -> Iterator[Tuple[Any, ...]]:
+	"""워크시트 값을 읽어 _extract_rows의 값 튜플만 돌려준다 (읽기 실패 시 빈 결과)."""
+	for _, fields in _extract_rows(_tab_values(ws), header_row, positions):
+		yield fields
+
+
+def _iter_matching_rows(values: List[List[str]], header_row: int, positions: Dict[str, int | None], selected_set: Set[int], want_internal: bool) -> Iterator[Tuple[int, int, str, Tuple[Any, ...]]]:
+	"""리스트/스트림/체크 처리의 공통 행 필터.
+
+	남은일수가 selected_set에 있고, 상호명이 있고, 내부 진행 여부가 want_internal과 같고,
+	아직 체크되지 않은 행만 (시트 행 번호, 남은일수, 상호명, _ROW_FIELDS 값 튜플)로 돌려준다.
+	대부분의 행은 남은일수에서 걸러지므로 싼 검사부터 한다.
+	"""
+	for row_num, fields in _extract_rows(values, header_row, positions, require_bizname=True):
+		# _ROW_FIELDS 순서: 0 대행사, 1 내부 진행, 2 남은일수, 3 체크, 4 상호명
+		remain = _parse_int_maybe(fields[2])
+		if remain is None or remain not in selected_set:
+			continue
+		bizname = str(fields[4] or "").strip()
+		if not bizname:
+			continue
+		if _is_truthy(fields[1]) != want_internal:
+			continue
+		if _is_truthy(fields[3]):
+			continue
+		yield row_num, remain, bizname, fields
+
+
 def fetch_grouped_messages(selected_days: List[int], settings: Settings | None = None) -> Dict[str, Dict[str, List[str]]]:
 	if settings is None:
 		settings = load_settings()
 	if not settings.spreadsheet_id:
 		raise RuntimeError("SPREADSHEET_ID 환경변수를 설정하세요.")
 
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 
 	agency_to_task_to_names: Dict[str, Dict[str, List[str]]] = {}
 	# 중복 상호명 병합을 위한 임시 집계: agency -> task -> bizname -> sum(workload)
-	aggregator: Dict[str, Dict[str, Dict[str, int]]] = {}
+	aggregator: Dict[str, Dict[str, Dict[str, int]]] = _nested_sum_dict(3)
 	selected_set: Set[int] = set(selected_days)
+	worksheets = _get_worksheets(ss)
+	_load_worksheets(ss, worksheets, settings)
 
-	for ws in ss.worksheets():
+	for ws in worksheets:
 		task_name = ws.title
 		header_row, headers = _find_header_row(ws, settings)
-		records = _build_records(ws, header_row, headers)
-		for row in records:
-			row_norm = { _normalize_key(k): v for k, v in row.items() }
-			agency = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip() or "미지정 대행사"
-			is_checked = _is_truthy(_get_value_flexible(row_norm, settings.checked_col, "CHECKED_COLUMN"))
-			is_internal = _is_truthy(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
-			remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
-			bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
-			workload_raw = str(_get_value_flexible(row_norm, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
-			workload_num = _parse_int_maybe(workload_raw) or 0
-
-			if is_checked:
-				continue
-			if is_internal:
-				continue
-			if remain is None or remain not in selected_set:
-				continue
-			if not bizname:
-				continue
+		positions = _resolve_positions(headers, settings)
+		# 내부 진행건은 항상 제외
+		for _, _, bizname, (agency_v, _, _, _, _, _, _, workload_v) in _iter_matching_rows(_tab_values(ws), header_row, positions, selected_set, False):
+			agency = str(agency_v or "").strip() or "미지정 대행사"
+			workload_num = _parse_int_maybe(str(workload_v or "").strip()) or 0
 
-			by_task = aggregator.setdefault(agency, {}).setdefault(task_name, {})
-			by_task[bizname] = by_task.get(bizname, 0) + workload_num
+			aggregator[agency][task_name][bizname] += workload_num
 	# 집계 결과를 출력 포맷으로 변환
 	for agency, tasks in aggregator.items():
-		out_task_map: Dict[str, List[str]] = {}
-		for task, name_to_wl in tasks.items():
-			names: List[str] = []
-			for name, wl_sum in sorted(name_to_wl.items(), key=lambda kv: kv[0]):
-				names.append(f"{name} (일작업량 {wl_sum})" if wl_sum > 0 else name)
-			out_task_map[task] = names
-		agency_to_task_to_names[agency] = out_task_map
+		agency_to_task_to_names[agency] = {task: _format_names(name_to_wl) for task, name_to_wl in tasks.items()}
 
 	return agency_to_task_to_names
 
@@ -393,53 +805,39 @@ def fetch_grouped_messages_by_date(selected_days: List[int], settings: Settings
 	if not settings.spreadsheet_id:
 		raise RuntimeError("SPREADSHEET_ID 환경변수를 설정하세요.")
 
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 
 	selected_set: Set[int] = set(selected_days)
 	# 임시 집계: category -> agency -> day -> task -> bizname -> sum(workload)
-	aggregator: Dict[str, Dict[str, Dict[int, Dict[str, Dict[str, int]]]]] = {}
+	aggregator: Dict[str, Dict[str, Dict[int, Dict[str, Dict[str, int]]]]] = _nested_sum_dict(5)
+	want_internal = filter_mode == "internal"
+	worksheets = _get_worksheets(ss)
+	_load_worksheets(ss, worksheets, settings)
+
+	# 업종 분류 (일반/맛집)
+	from business_category import classify_business_category
 
-	for ws in ss.worksheets():
+	for ws in worksheets:
 		tab_title = (ws.title or "").strip()
+		# 작업명 규칙은 탭 단위로 정해짐
+		base_task = tab_title
+		is_misc = _collapse_spaces(tab_title) == _MISC_NORM
 		header_row, headers = _find_header_row(ws, settings)
-		records = _build_records(ws, header_row, headers)
-		for row in records:
-			row_norm = { _normalize_key(k): v for k, v in row.items() }
-			agency_raw = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-			is_checked = _is_truthy(_get_value_flexible(row_norm, settings.checked_col, "CHECKED_COLUMN"))
-			is_internal = _is_truthy(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
-			remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
-			bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
-			product = str(_get_value_flexible(row_norm, settings.product_col, "PRODUCT_COLUMN") or "").strip()
-			product_name = str(_get_value_flexible(row_norm, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
-			workload = str(_get_value_flexible(row_norm, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
-
-			# 필터 모드 적용
-			if filter_mode == "agency":
-				if is_internal:
-					continue
-			elif filter_mode == "internal":
-				if not is_internal:
-					continue
-			else:
-				if is_internal:
-					continue
-
-			# 공통 필터
-			if is_checked or remain is None or remain not in selected_set or not bizname:
-				continue
+		# 논리 컬럼 위치는 탭당 1회 계산하고 행은 위치로만 접근
+		positions = _resolve_positions(headers, settings)
+		# 필터 모드: 'internal'은 내부 진행건만, 그 외('agency' 포함)는 내부 진행건 제외
+		for _, remain, bizname, (agency_v, _, _, _, _, product_v, product_name_v, workload_v) in _iter_matching_rows(_tab_values(ws), header_row, positions, selected_set, want_internal):
+			agency_raw = str(agency_v or "").strip()
+			product = str(product_v or "").strip()
+			product_name = str(product_name_v or "").strip()
+			workload = str(workload_v or "").strip()
 
 			# 작업명 생성 규칙
-			base_task = tab_title
-			is_misc = _collapse_spaces(tab_title) == _collapse_spaces("기타")
 			if is_misc:
 				display_task = product_name if product_name else base_task
 			else:
 				display_task = f"{base_task} {product}".strip() if product else base_task
 
-			# 업종 분류 (일반/맛집)
-			from business_category import classify_business_category
 			category = classify_business_category(tab_title=tab_title, product=product, product_name=product_name)
 
 			agency_label = agency_raw if filter_mode == "agency" else (agency_raw or "내부 진행")
@@ -448,28 +846,19 @@ def fetch_grouped_messages_by_date(selected_days: List[int], settings: Settings
 				wl_num = _parse_int_maybe(workload) or 0
 			except Exception:
 				wl_num = 0
-			dict_by_agency = aggregator.setdefault(category, {})
-			dict_by_day = dict_by_agency.setdefault(agency_label, {})
-			dict_by_task = dict_by_day.setdefault(remain, {})
-			by_name = dict_by_task.setdefault(display_task, {})
-			by_name[bizname] = by_name.get(bizname, 0) + wl_num
+			aggregator[category][agency_label][remain][display_task][bizname] += wl_num
 
 	# 집계를 최종 출력 포맷으로 변환: category -> agency -> day -> task -> [biznames]
-	result: Dict[str, Dict[str, Dict[int, Dict[str, List[str]]]]] = {}
-	for category, by_agency in aggregator.items():
-		agency_out: Dict[str, Dict[int, Dict[str, List[str]]]] = {}
-		for agency, by_day in by_agency.items():
-			day_out: Dict[int, Dict[str, List[str]]] = {}
-			for day_key, by_task in by_day.items():
-				task_out: Dict[str, List[str]] = {}
-				for task, name_to_wl in by_task.items():
-					names: List[str] = []
-					for name, wl_sum in sorted(name_to_wl.items(), key=lambda kv: kv[0]):
-						names.append(f"{name} (일작업량 {wl_sum})" if wl_sum > 0 else name)
-					task_out[task] = names
-				day_out[day_key] = task_out
-			agency_out[agency] = day_out
-		result[category] = agency_out
+	result: Dict[str, Dict[str, Dict[int, Dict[str, List[str]]]]] = {
+		category: {
+			agency: {
+				day_key: {task: _format_names(name_to_wl) for task, name_to_wl in by_task.items()}
+				for day_key, by_task in by_day.items()
+			}
+			for agency, by_day in by_agency.items()
+		}
+		for category, by_agency in aggregator.items()
+	}
 
 	return result
 
@@ -484,64 +873,45 @@ def stream_grouped_messages_by_date(selected_days: List[int], settings: Settings
 	if not settings.spreadsheet_id:
 		raise RuntimeError("SPREADSHEET_ID 환경변수를 설정하세요.")
 
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
-	worksheets = ss.worksheets()
+	ss = _get_spreadsheet(settings.spreadsheet_id)
+	worksheets = _get_worksheets(ss)
 	total = len(worksheets)
 	processed = 0
 
 	selected_set: Set[int] = set(selected_days)
-	# 임시 집계 저장
-	aggregator: Dict[str, Dict[int, Dict[str, Dict[str, int]]]] = {}
+	want_internal = filter_mode == "internal"
+	# 임시 집계: agency -> day -> task -> bizname -> sum(workload)
+	aggregator: Dict[str, Dict[int, Dict[str, Dict[str, int]]]] = _nested_sum_dict(4)
 
 	# 시작 이벤트
 	yield {"type": "start", "total": total}
 
+	# 탭별 읽기를 values.batchGet 한 번으로 (실패한 탭은 스레드 풀로 동시 조회, 이후 탭 처리는 캐시 조회)
+	_load_worksheets(ss, worksheets, settings)
+
 	for ws in worksheets:
 		tab_title = (ws.title or "").strip()
+		# 작업명 규칙은 탭 단위로 정해짐
+		base_task = tab_title
+		is_misc = _collapse_spaces(tab_title) == _MISC_NORM
 		try:
 			header_row, headers = _find_header_row(ws, settings)
-			records = _build_records(ws, header_row, headers)
-			for row in records:
-				row_norm = { _normalize_key(k): v for k, v in row.items() }
-				agency_raw = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-				is_checked = _is_truthy(_get_value_flexible(row_norm, settings.checked_col, "CHECKED_COLUMN"))
-				is_internal = _is_truthy(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
-				remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
-				bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
-				product = str(_get_value_flexible(row_norm, settings.product_col, "PRODUCT_COLUMN") or "").strip()
-				product_name = str(_get_value_flexible(row_norm, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
-				workload = str(_get_value_flexible(row_norm, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
-
-				# 필터 모드 적용
-				if filter_mode == "agency":
-					if is_internal:
-						continue
-				elif filter_mode == "internal":
-					if not is_internal:
-						continue
-				else:
-					if is_internal:
-						continue
-
-				# 공통 필터
-				if is_checked or remain is None or remain not in selected_set or not bizname:
-					continue
+			positions = _resolve_positions(headers, settings)
+			# 필터 모드: 'internal'은 내부 진행건만, 그 외('agency' 포함)는 내부 진행건 제외
+			for _, remain, bizname, (agency_v, _, _, _, _, product_v, product_name_v, workload_v) in _iter_matching_rows(_tab_values(ws), header_row, positions, selected_set, want_internal):
+				agency_raw = str(agency_v or "").strip()
+				product = str(product_v or "").strip()
+				product_name = str(product_name_v or "").strip()
+				workload = str(workload_v or "").strip()
 
 				# 작업명 생성 규칙
-				base_task = tab_title
-				is_misc = _collapse_spaces(tab_title) == _collapse_spaces("기타")
 				if is_misc:
 					display_task = product_name if product_name else base_task
 				else:
 					display_task = f"{base_task} {product}".strip() if product else base_task
 
 				agency_label = agency_raw if filter_mode == "agency" else (agency_raw or "내부 진행")
-				dict_by_day = aggregator.setdefault(agency_label, {})
-				dict_by_task = dict_by_day.setdefault(remain, {})
-				by_name = dict_by_task.setdefault(display_task, {})
-				wl_num = _parse_int_maybe(workload) or 0
-				by_name[bizname] = by_name.get(bizname, 0) + wl_num
+				aggregator[agency_label][remain][display_task][bizname] += _parse_int_maybe(workload) or 0
 		except Exception as e:
 			# 워크시트 처리 실패도 진행률로 보고
 			yield {"type": "progress", "processed": processed, "total": total, "tab": tab_title, "error": str(e)}
@@ -550,18 +920,13 @@ def stream_grouped_messages_by_date(selected_days: List[int], settings: Settings
 			yield {"type": "progress", "processed": processed, "total": total, "tab": tab_title}
 
 	# 완료 시 집계를 최종 포맷으로 변환
-	final_map: Dict[str, Dict[int, Dict[str, List[str]]]] = {}
-	for agency, by_day in aggregator.items():
-		day_out: Dict[int, Dict[str, List[str]]] = {}
-		for day_key, by_task in by_day.items():
-			task_out: Dict[str, List[str]] = {}
-			for task, name_to_wl in by_task.items():
-				names: List[str] = []
-				for name, wl_sum in sorted(name_to_wl.items(), key=lambda kv: kv[0]):
-					names.append(f"{name} (일작업량 {wl_sum})" if wl_sum > 0 else name)
-				task_out[task] = names
-			day_out[day_key] = task_out
-		final_map[agency] = day_out
+	final_map: Dict[str, Dict[int, Dict[str, List[str]]]] = {
+		agency: {
+			day_key: {task: _format_names(name_to_wl) for task, name_to_wl in by_task.items()}
+			for day_key, by_task in by_day.items()
+		}
+		for agency, by_day in aggregator.items()
+	}
 
 	# 완료 이벤트
 	yield {"type": "result", "total": total, "grouped": final_map}
@@ -575,6 +940,36 @@ def _find_checked_col_index(headers: List[str], settings: Settings) -> int | Non
 	return None
 
 
+def _row_runs(row_nums: List[int]) -> List[Tuple[int, int]]:
+	"""행 번호들을 연속 구간 (시작, 끝) 목록으로 묶는다. 예: [3, 4, 5, 9] → [(3, 5), (9, 9)]"""
+	runs: List[List[int]] = []
+	for r in sorted(row_nums):
+		if runs and runs[-1][1] == r - 1:
+			runs[-1][1] = r
+		else:
+			runs.append([r, r])
+	return [(a, b) for a, b in runs]
+
+
+def _write_checked_cells(ss: gspread.Spreadsheet, targets: List[Tuple[gspread.Worksheet, List[int], int]]) -> None:
+	"""여러 워크시트의 체크 칸들을 values.batchUpdate 한 번으로 'TRUE' 기록 (워크시트·셀마다 왕복 제거).
+
+	targets: (워크시트, 실제 행 번호들, 체크 열 1-based). 연속된 행은 한 범위(예: D5:D9)로 묶는다.
+	update_cell과 같은 USER_ENTERED 입력 방식. 실패 시 예외를 그대로 올린다.
+	"""
+	data = [
+		{
+			"range": absolute_range_name(ws.title, rowcol_to_a1(a, col) if a == b else f"{rowcol_to_a1(a, col)}:{rowcol_to_a1(b, col)}"),
+			"values": [["TRUE"]] * (b - a + 1),
+		}
+		for ws, row_nums, col in targets
+		for a, b in _row_runs(row_nums)
+	]
+	if not data:
+		return
+	_with_retry(ss.values_batch_update, body={"valueInputOption": "USER_ENTERED", "data": data})
+
+
 def mark_checked_for_agency(selected_days: List[int], agency_label: str, filter_mode: str = "agency", settings: Settings | None = None) -> Dict[str, Any]:
 	"""선택한 일수/보기 모드에서 특정 카드(agency_label)에 포함되는 모든 행의
 	'마감 안내 체크' 값을 TRUE로 업데이트한다.
@@ -586,14 +981,18 @@ def mark_checked_for_agency(selected_days: List[int], agency_label: str, filter_
 	if not settings.spreadsheet_id:
 		raise RuntimeError("SPREADSHEET_ID 환경변수를 설정하세요.")
 
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 
 	selected_set: Set[int] = set(selected_days)
+	want_internal = filter_mode == "internal"
 	results: List[Dict[str, Any]] = []
-	total_updated = 0
+	# 쓰기는 모든 워크시트 분을 모아 마지막에 한 번 (워크시트, 대상 행, 체크 열, 결과 항목)
+	pending: List[Tuple[gspread.Worksheet, List[int], int, Dict[str, Any]]] = []
 
-	for ws in ss.worksheets():
+	worksheets = _get_worksheets(ss)
+	_load_worksheets(ss, worksheets, settings)
+
+	for ws in worksheets:
 		# 헤더 및 컬럼 인덱스 파악
 		header_row, headers = _find_header_row(ws, settings)
 		checked_col = _find_checked_col_index(headers, settings)
@@ -610,61 +1009,33 @@ def mark_checked_for_agency(selected_days: List[int], agency_label: str, filter_
 		if header_row - 1 >= len(values):
 			results.append({"worksheet": ws.title, "updated": 0, "reason": "no_data"})
 			continue
-		data_rows = values[header_row:]
+		positions = _resolve_positions(headers, settings)
 
 		update_targets: List[int] = []  # 실제 시트 행 번호(1-based)
-		for idx, row in enumerate(data_rows):
-			# dict 구성
-			row_dict: Dict[str, Any] = {}
-			for i, h in enumerate(headers):
-				key = _normalize_key(h)
-				val = row[i] if i < len(row) else ""
-				row_dict[key] = val
-			row_norm = { _normalize_key(k): v for k, v in row_dict.items() }
-
-			agency_raw = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-			is_checked = _is_truthy(_get_value_flexible(row_norm, settings.checked_col, "CHECKED_COLUMN"))
-			is_internal = _is_truthy(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
-			remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
-			bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
-
-			# 필터 모드 적용 (리스트 뷰와 동일 규칙)
-			if filter_mode == "agency":
-				if is_internal:
-					continue
-			elif filter_mode == "internal":
-				if not is_internal:
-					continue
-			else:
-				if is_internal:
-					continue
-
-			# 공통 필터 (리스트 뷰와 동일)
-			if is_checked or remain is None or remain not in selected_set or not bizname:
-				continue
+		# 리스트 뷰와 같은 필터
+		for real_row_num, _, _, (agency_v, *_) in _iter_matching_rows(values, header_row, positions, selected_set, want_internal):
+			agency_raw = str(agency_v or "").strip()
 
 			# 에이전시 라벨 계산 (뷰와 동일)
 			computed_label = agency_raw if filter_mode == "agency" else (agency_raw or "내부 진행")
 			if computed_label != agency_label:
 				continue
 
-			# 실제 시트 상의 행 번호 계산: header_row는 헤더가 있는 1-based 라인
-			# data_rows는 header_row 바로 다음 줄부터 시작이므로 + (header_row + idx + 1)
-			real_row_num = header_row + idx + 1
 			update_targets.append(real_row_num)
 
-		# 업데이트 수행 (개별 업데이트: 신뢰성 우선)
-		updated_here = 0
-		for r in update_targets:
-			try:
-				ws.update_cell(r, checked_col, "TRUE")
-			except Exception:
-				continue
-			else:
-				updated_here += 1
+		entry = {"worksheet": ws.title, "updated": len(update_targets)}
+		results.append(entry)
+		pending.append((ws, update_targets, checked_col, entry))
 
-		results.append({"worksheet": ws.title, "updated": updated_here})
-		total_updated += updated_here
+	# 업데이트 수행 (전체 워크시트 values.batchUpdate 1회)
+	try:
+		_write_checked_cells(ss, [(ws, rows, col) for ws, rows, col, _ in pending])
+	except Exception as e:
+		for _, rows, _, entry in pending:
+			if rows:
+				entry["updated"] = 0
+				entry["reason"] = f"update_failed:{e}"
+	total_updated = sum(entry["updated"] for _, _, _, entry in pending)
 
 	return {"updated": total_updated, "details": results}
 
@@ -685,15 +1056,19 @@ def mark_checked_for_agencies(selected_days: List[int], agency_labels: List[str]
 	if not target_labels:
 		return {"updated": 0, "details": [], "per_agency": {}}
 
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 
 	selected_set: Set[int] = set(selected_days)
+	want_internal = filter_mode == "internal"
 	results: List[Dict[str, Any]] = []
-	total_updated = 0
 	per_agency: Dict[str, int] = {label: 0 for label in target_labels}
+	# 쓰기는 모든 워크시트 분을 모아 마지막에 한 번 (워크시트, 대상 행, 체크 열, 행별 라벨, 결과 항목)
+	pending: List[Tuple[gspread.Worksheet, List[int], int, List[str], Dict[str, Any]]] = []
+
+	worksheets = _get_worksheets(ss)
+	_load_worksheets(ss, worksheets, settings)
 
-	for ws in ss.worksheets():
+	for ws in worksheets:
 		# 헤더 및 컬럼 인덱스 파악
 		header_row, headers = _find_header_row(ws, settings)
 		checked_col = _find_checked_col_index(headers, settings)
@@ -710,61 +1085,40 @@ def mark_checked_for_agencies(selected_days: List[int], agency_labels: List[str]
 		if header_row - 1 >= len(values):
 			results.append({"worksheet": ws.title, "updated": 0, "reason": "no_data"})
 			continue
-		data_rows = values[header_row:]
+		positions = _resolve_positions(headers, settings)
 
 		# 업데이트 대상 수집
 		update_targets: List[int] = []  # 실제 시트 행 번호(1-based)
 		labels_for_row: List[str] = []  # 행별 라벨(통계용)
-		for idx, row in enumerate(data_rows):
-			row_dict: Dict[str, Any] = {}
-			for i, h in enumerate(headers):
-				key = _normalize_key(h)
-				val = row[i] if i < len(row) else ""
-				row_dict[key] = val
-			row_norm = { _normalize_key(k): v for k, v in row_dict.items() }
-
-			agency_raw = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-			is_checked = _is_truthy(_get_value_flexible(row_norm, settings.checked_col, "CHECKED_COLUMN"))
-			is_internal = _is_truthy(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
-			remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
-			bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
-
-			# 필터 모드 적용
-			if filter_mode == "agency":
-				if is_internal:
-					continue
-			elif filter_mode == "internal":
-				if not is_internal:
-					continue
-			else:
-				if is_internal:
-					continue
-
-			# 공통 필터
-			if is_checked or remain is None or remain not in selected_set or not bizname:
-				continue
+		# 리스트 뷰와 같은 필터
+		for real_row_num, _, _, (agency_v, *_) in _iter_matching_rows(values, header_row, positions, selected_set, want_internal):
+			agency_raw = str(agency_v or "").strip()
 
 			computed_label = agency_raw if filter_mode == "agency" else (agency_raw or "내부 진행")
 			if computed_label not in target_labels:
 				continue
 
-			real_row_num = header_row + idx + 1
 			update_targets.append(real_row_num)
 			labels_for_row.append(computed_label)
 
-		# 업데이트 수행 (개별 업데이트: 신뢰성 우선)
-		updated_here = 0
-		for r, label in zip(update_targets, labels_for_row):
-			try:
-				ws.update_cell(r, checked_col, "TRUE")
-			except Exception:
-				continue
-			else:
-				updated_here += 1
-				per_agency[label] = per_agency.get(label, 0) + 1
+		entry = {"worksheet": ws.title, "updated": len(update_targets)}
+		results.append(entry)
+		pending.append((ws, update_targets, checked_col, labels_for_row, entry))
 
-		results.append({"worksheet": ws.title, "updated": updated_here})
-		total_updated += updated_here
+	# 업데이트 수행 (전체 워크시트 values.batchUpdate 1회)
+	try:
+		_write_checked_cells(ss, [(ws, rows, col) for ws, rows, col, _, _ in pending])
+	except Exception as e:
+		for _, rows, _, _, entry in pending:
+			if rows:
+				entry["updated"] = 0
+				entry["reason"] = f"update_failed:{e}"
+		total_updated = 0
+	else:
+		total_updated = sum(len(rows) for _, rows, _, _, _ in pending)
+		for _, _, _, labels_for_row, _ in pending:
+			for label in labels_for_row:
+				per_agency[label] = per_agency.get(label, 0) + 1
 
 	return {"updated": total_updated, "details": results, "per_agency": per_agency}
 
@@ -774,11 +1128,13 @@ def inspect_sheets(settings: Settings | None = None) -> List[Dict[str, Any]]:
 	if not settings.spreadsheet_id:
 		raise RuntimeError("SPREADSHEET_ID 환경변수를 설정하세요.")
 
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 
 	results: List[Dict[str, Any]] = []
-	for ws in ss.worksheets():
+	worksheets = _get_worksheets(ss)
+	_prefetch_all_values(ss, worksheets)
+
+	for ws in worksheets:
 		header_row, headers = _find_header_row(ws, settings)
 		results.append({
 			"title": ws.title,
@@ -797,26 +1153,26 @@ def diagnose_matches(selected_days: List[int], settings: Settings | None = None,
 	"""탭별 매칭된 항목과 제외 사유 샘플, 사유별 카운트를 반환한다."""
 	if settings is None:
 		settings = load_settings()
-	client = _get_client()
-	ss = client.open_by_key(settings.spreadsheet_id)
+	ss = _get_spreadsheet(settings.spreadsheet_id)
 
 	selected_set: Set[int] = set(selected_days)
 	report: Dict[str, Any] = {}
-	for ws in ss.worksheets():
+	worksheets = _get_worksheets(ss)
+	_load_worksheets(ss, worksheets, settings)
+
+	for ws in worksheets:
 		task_name = ws.title
 		header_row, headers = _find_header_row(ws, settings)
-		records = _build_records(ws, header_row, headers)
+		positions = _resolve_positions(headers, settings)
 		matched: List[Dict[str, Any]] = []
 		excluded: List[Dict[str, Any]] = []
 		reason_counts: Dict[str, int] = {}
-		for row in records:
-			row_norm = { _normalize_key(k): v for k, v in row.items() }
-			agency = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-			is_checked = _is_truthy(_get_value_flexible(row_norm, settings.checked_col, "CHECKED_COLUMN"))
-			is_internal = _is_truthy(_get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN"))
-			remain_val_raw = _get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN")
+		for agency_v, internal_v, remain_val_raw, checked_v, bizname_v, _, _, _ in _iter_rows(ws, header_row, positions):
+			agency = str(agency_v or "").strip()
+			is_checked = _is_truthy(checked_v)
+			is_internal = _is_truthy(internal_v)
 			remain = _parse_int_maybe(remain_val_raw)
-			bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
+			bizname = str(bizname_v or "").strip()
 
 			reason = None
 			if is_checked:
@@ -855,20 +1211,18 @@ def list_sheet_tabs(spreadsheet_id: str | None = None) -> List[str]:
 		spreadsheet_id = settings.spreadsheet_id
 	if not spreadsheet_id:
 		raise RuntimeError("스프레드시트 ID가 비어 있습니다.")
-	client = _get_client()
-	ss = client.open_by_key(spreadsheet_id)
-	return [str((ws.title or "").strip()) for ws in ss.worksheets()]
+	ss = _get_spreadsheet(spreadsheet_id)
+	return [str((ws.title or "").strip()) for ws in _get_worksheets(ss)]
 
 
 def inspect_sheets_by_id(spreadsheet_id: str) -> List[Dict[str, Any]]:
 	"""지정된 스프레드시트 ID에 대해 탭별 헤더 정보를 반환한다."""
 	if not spreadsheet_id:
 		raise RuntimeError("스프레드시트 ID가 비어 있습니다.")
-	client = _get_client()
-	ss = client.open_by_key(spreadsheet_id)
+	ss = _get_spreadsheet(spreadsheet_id)
 	settings = load_settings()
 	results: List[Dict[str, Any]] = []
-	for ws in ss.worksheets():
+	for ws in _get_worksheets(ss):
 		header_row, headers = _find_header_row(ws, settings)
 		results.append({
 			"title": ws.title,
@@ -878,59 +1232,136 @@ def inspect_sheets_by_id(spreadsheet_id: str) -> List[Dict[str, Any]]:
 	return results
 
 
+_SIMPLE_HEADER_KEYS = frozenset(("상호명", "상품명", "저장", "트래픽"))
+
+
 def _find_header_row_simple(values: List[List[str]]) -> int:
 	"""상단 20행 내에서 '상호명/상품명/저장/트래픽' 중 하나 이상이 있는 첫 행을 헤더로 간주한다.
 	반환: 1-based 행 번호(없으면 1)
 	"""
-	max_scan = min(len(values), 20)
-	keys = {"상호명", "상품명", "저장", "트래픽"}
-	for idx in range(max_scan):
-		row = [str(c or "").strip() for c in values[idx]]
-		row_set = set(row)
-		if any(k in row_set for k in keys):
-			return idx + 1
+	for idx in range(min(len(values), 20)):
+		# 행마다 집합을 만들지 않고 셀을 훑다가 첫 일치에서 종료
+		for c in values[idx]:
+			if c and str(c).strip() in _SIMPLE_HEADER_KEYS:
+				return idx + 1
 	return 1
 
 
 
 def _authed_session():
-	"""Google API Authorized session 생성"""
-	from google.auth.transport.requests import AuthorizedSession
-	creds = _build_credentials()
-	return AuthorizedSession(creds)
+	"""Google API Authorized session.
 
+	공유 gspread 클라이언트의 AuthorizedSession을 그대로 쓴다 (인증정보 재구성 없이
+	토큰과 HTTP 연결 풀을 gspread 호출과 공유, 토큰은 만료 시 자동 갱신).
+	"""
+	return _get_client().http_client.session
 
-def _fetch_background_colors(spreadsheet_id: str, sheet_title: str, max_rows: int) -> Dict[Tuple[int, int], Tuple[float, float, float]]:
-	"""지정 탭의 A1:Z{max_rows} 배경색을 조회한다.
-	반환: {(row0,col0): (r,g,b)} 0-based
+
+# 배경색 조회 필드 (범위별 시작 행으로 시트 기준 위치를 맞춤)
+_BG_COLOR_FIELDS = "sheets(properties(title),data(startRow,rowData(values(effectiveFormat(backgroundColor)))))"
+
+
+def _fetch_background_colors(spreadsheet_id: str, sheet_title: str, a1_ranges: List[str]) -> List[List[Tuple[float, float, float]]]:
+	"""지정 탭 범위들(예: ['B3:B9', 'B12:B40'])의 배경색을 요청 한 번으로 조회한다.
+	반환: _grid_background_colors 형식 (시트 기준 0-based 행). 조회는 _color_at으로.
 	"""
 	sess = _authed_session()
 	url = f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}"
-	params = {
-		"includeGridData": "true",
-		"ranges": f"{sheet_title}!A1:Z{max_rows}",
-		"fields": "sheets(data(rowData(values(effectiveFormat(backgroundColor)))))",
-	}
+	params = [("includeGridData", "true"), ("fields", _BG_COLOR_FIELDS)]
+	params += [("ranges", absolute_range_name(sheet_title, r)) for r in a1_ranges]
 	try:
 		resp = sess.get(url, params=params)
 		resp.raise_for_status()
 		data = resp.json()
 	except Exception:
-		return {}
-	colors: Dict[Tuple[int, int], Tuple[float, float, float]] = {}
+		return []
 	try:
-		row_data = data.get("sheets", [{}])[0].get("data", [{}])[0].get("rowData", [])
-		for r_idx, row in enumerate(row_data):
-			cells = row.get("values", [])
-			for c_idx, cell in enumerate(cells):
-				bg = cell.get("effectiveFormat", {}).get("backgroundColor", {})
-				r, g, b = bg.get("red", 0.0), bg.get("green", 0.0), bg.get("blue", 0.0)
-				colors[(r_idx, c_idx)] = (float(r or 0.0), float(g or 0.0), float(b or 0.0))
+		return _grid_background_colors(data.get("sheets", [{}])[0].get("data", []))
 	except Exception:
-		return {}
+		return []
+
+
+def _parse_background_colors(row_data: List[Dict[str, Any]]) -> List[List[Tuple[float, float, float]]]:
+	"""GridData.rowData → 행 목록 (행마다 열 순서의 (r,g,b)).
+
+	셀마다 (row,col) 키 튜플과 dict 항목을 만들지 않도록 행/열 위치 그대로 보관한다.
+	"""
+	colors: List[List[Tuple[float, float, float]]] = []
+	for row in row_data:
+		row_colors: List[Tuple[float, float, float]] = []
+		for cell in row.get("values", []):
+			bg = cell.get("effectiveFormat", {}).get("backgroundColor", {})
+			r, g, b = bg.get("red", 0.0), bg.get("green", 0.0), bg.get("blue", 0.0)
+			row_colors.append((float(r or 0.0), float(g or 0.0), float(b or 0.0)))
+		colors.append(row_colors)
 	return colors
 
 
+def _grid_background_colors(grids: List[Dict[str, Any]]) -> List[List[Tuple[float, float, float]]]:
+	"""범위별 GridData 목록 → 시트 기준 0-based 행 목록 (행마다 범위 왼쪽 열부터의 (r,g,b)).
+
+	요청하지 않은 행은 빈 목록으로 남아 _color_at에서 None이 된다.
+	"""
+	colors: List[List[Tuple[float, float, float]]] = []
+	for grid in grids:
+		start = int(grid.get("startRow") or 0)
+		rows = _parse_background_colors(grid.get("rowData", []))
+		if len(colors) < start + len(rows):
+			colors.extend([] for _ in range(start + len(rows) - len(colors)))
+		colors[start:start + len(rows)] = rows
+	return colors
+
+
+def _color_at(colors: List[List[Tuple[float, float, float]]], row0: int, col0: int) -> Tuple[float, float, float] | None:
+	"""_parse_background_colors/_grid_background_colors 결과에서 (row0,col0) 색 (범위 밖이면 None)."""
+	if row0 < len(colors):
+		row_colors = colors[row0]
+		if col0 < len(row_colors):
+			return row_colors[col0]
+	return None
+
+
+def _fetch_background_colors_batch(spreadsheet_id: str, tab_to_ranges: Dict[str, List[str]]) -> Dict[str, List[List[Tuple[float, float, float]]]]:
+	"""여러 탭의 지정 범위들 배경색을 spreadsheets.get(요청당 최대 BATCH_GET_MAX_RANGES개 범위)으로 조회한다.
+
+	반환: {탭 제목: _grid_background_colors 형식}. 배치 요청이 실패했거나 응답에서 빠진 탭은 탭별 조회로 폴백.
+	"""
+	out: Dict[str, List[List[Tuple[float, float, float]]]] = {}
+	pairs = [(title, a1) for title, ranges in tab_to_ranges.items() for a1 in ranges]
+	if not pairs:
+		return out
+	grids: Dict[str, List[Dict[str, Any]]] = {}
+	failed: Set[str] = set()
+	sess = _authed_session()
+	url = f"https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}"
+	for start in range(0, len(pairs), BATCH_GET_MAX_RANGES):
+		chunk = pairs[start:start + BATCH_GET_MAX_RANGES]
+		# ranges를 여러 번 넘기려면 (키, 값) 목록으로 전달
+		params = [("includeGridData", "true"), ("fields", _BG_COLOR_FIELDS)]
+		params += [("ranges", absolute_range_name(title, a1)) for title, a1 in chunk]
+		try:
+			resp = sess.get(url, params=params)
+			resp.raise_for_status()
+			data = resp.json()
+		except Exception:
+			failed.update(title for title, _ in chunk)
+			continue
+		# 응답 시트 순서는 요청 순서가 아니라 스프레드시트 탭 순서이므로 제목으로 매칭
+		for sheet in data.get("sheets", []):
+			title = sheet.get("properties", {}).get("title")
+			if title in tab_to_ranges:
+				grids.setdefault(title, []).extend(sheet.get("data", []))
+	for title, ranges in tab_to_ranges.items():
+		if title in grids and title not in failed:
+			try:
+				out[title] = _grid_background_colors(grids[title])
+				continue
+			except Exception:
+				pass
+		out[title] = _fetch_background_colors(spreadsheet_id, title, ranges)
+	return out
+
+
 def _is_yellow(rgb: Tuple[float, float, float]) -> bool:
     if not rgb or len(rgb) != 3:
         return False
@@ -951,6 +1382,32 @@ def _is_manage_green(rgb: Tuple[float, float, float]) -> bool:
     return (abs(r - target[0]) <= tol and abs(g - target[1]) <= tol and abs(b - target[2]) <= tol)
 
 
+@lru_cache(maxsize=256)
+def _internal_type_for_color(rgb: Tuple[float, float, float] | None) -> str | None:
+	"""상호명 셀 배경색 → 'guarantee'(노란색) / 'manage'(연녹색) / None.
+
+	시트에 쓰이는 배경색은 몇 가지뿐이므로 색마다 한 번만 판정해 캐시한다.
+	"""
+	if _is_yellow(rgb):
+		return "guarantee"
+	if _is_manage_green(rgb):
+		return "manage"
+	return None
+
+
+# 결재선 시트 컬럼명 (정규화 형태로 미리 계산, 후보 목록은 앞쪽이 우선)
+_SETTLE_AGENCY = _collapse_spaces("상호명")
+_SETTLE_JOB = _collapse_spaces("상품명")
+_SETTLE_STORE = _collapse_spaces("저장")
+_SETTLE_TRAF = _collapse_spaces("트래픽")
+_SETTLE_STORE_ACTUAL = _collapse_spaces("저장 감은타수")
+_SETTLE_TRAF_ACTUAL = _collapse_spaces("트래픽 감은타수")
+_SETTLE_AMOUNT_CANDIDATES = tuple(_collapse_spaces(h) for h in ("금액(vat제외)", "금액(VAT제외)", "금액(vat별도)", "금액", "매출"))
+_SETTLE_PAID_CANDIDATES = tuple(_collapse_spaces(h) for h in ("입금확인", "입금 확인", "입금여부", "입금 여부", "입금"))
+# 정산 행(rows) 필드 순서 — 루프에서는 튜플로 모으고 반환 직전에 dict로 변환
+_SETTLE_ROW_KEYS = ("date", "client", "job", "type", "qty", "unit_price", "expense", "income", "is_internal", "internal_type")
+
+
 def compute_settlement_rows(spreadsheet_id: str, selected_tabs: List[str], pricebook: List[Dict[str, Any]]) -> Dict[str, Any]:
 	"""결재선 시트에서 선택 탭의 행을 읽어 정산 행 + 집계를 생성한다.
 
@@ -960,107 +1417,103 @@ def compute_settlement_rows(spreadsheet_id: str, selected_tabs: List[str], price
 	"""
 	if not spreadsheet_id:
 		raise RuntimeError("스프레드시트 ID가 비어 있습니다.")
-	client = _get_client()
-	ss = client.open_by_key(spreadsheet_id)
+	ss = _get_spreadsheet(spreadsheet_id)
 	wanted = set([str(t).strip() for t in (selected_tabs or []) if str(t).strip()])
 
 	# 단가 조회: (client, product, type) → (client, product, 공통) → (product, type) → (product, 공통)
+	# 키마다 단가표에서 먼저 나온 항목이 우선이므로 한 번 색인해 두고 행마다 dict 조회만 한다
+	by_cpt: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+	by_pt: Dict[Tuple[str, str], Dict[str, Any]] = {}
+	for it in pricebook:
+		it_client = str(it.get("client") or "").strip()
+		it_product = str(it.get("product") or "").strip()
+		it_type = str(it.get("type") or "공통").strip()
+		by_cpt.setdefault((it_client, it_product, it_type), it)
+		by_pt.setdefault((it_product, it_type), it)
+
 	def find_unit_price(client_name: str, product_name: str, qty_type: str) -> float:
 		client_name = (client_name or "").strip()
 		product_name = (product_name or "").strip()
 		qty_type = (qty_type or "").strip()
-		for it in pricebook:
-			it_type = str(it.get("type") or "공통").strip()
-			if str(it.get("client") or "").strip() == client_name and str(it.get("product") or "").strip() == product_name and it_type == qty_type:
-				return float(it.get("price") or 0)
-		for it in pricebook:
-			it_type = str(it.get("type") or "공통").strip()
-			if str(it.get("client") or "").strip() == client_name and str(it.get("product") or "").strip() == product_name and it_type == "공통":
-				return float(it.get("price") or 0)
-		for it in pricebook:
-			it_type = str(it.get("type") or "공통").strip()
-			if str(it.get("product") or "").strip() == product_name and it_type == qty_type:
-				return float(it.get("price") or 0)
-		for it in pricebook:
-			it_type = str(it.get("type") or "공통").strip()
-			if str(it.get("product") or "").strip() == product_name and it_type == "공통":
+		for it in (
+			by_cpt.get((client_name, product_name, qty_type)),
+			by_cpt.get((client_name, product_name, "공통")),
+			by_pt.get((product_name, qty_type)),
+			by_pt.get((product_name, "공통")),
+		):
+			if it is not None:
 				return float(it.get("price") or 0)
 		return 0.0
 
-	rows_out: List[Dict[str, Any]] = []
-	missing: Dict[Tuple[str, str, str], int] = {}
-	by_client_expense: Dict[str, float] = {}
-	by_client_income: Dict[str, float] = {}
-	unpaid_by_agency: Dict[str, float] = {}
+	rows_out: List[Tuple[Any, ...]] = []  # _SETTLE_ROW_KEYS 순서
+	# 합산용 집계는 조회 한 번으로 누적 (반환 시 일반 dict로 변환)
+	missing: Counter = Counter()
+	by_client_expense: Dict[str, float] = defaultdict(float)
+	by_client_income: Dict[str, float] = defaultdict(float)
+	unpaid_by_agency: Dict[str, float] = defaultdict(float)
 	grand_expense = 0.0
 	grand_income = 0.0
 	by_product: Dict[str, Dict[str, Dict[str, float]]] = {}
 	by_agency: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
 
-	for ws in ss.worksheets():
+	selected = [ws for ws in _get_worksheets(ss) if not wanted or (ws.title or "").strip() in wanted]
+	# 선택 탭 전체 값을 values.batchGet 한 번으로 캐시에 채움 (실패한 탭은 스레드 풀로 동시 조회)
+	_load_worksheets(ss, selected)
+
+	# 수량/금액 파싱 (천 단위 쉼표 제거 후 첫 숫자)
+	def to_int(s: str) -> int:
+		m = _INT_RE.search((s or "").replace(",", ""))
+		return int(m.group(0)) if m else 0
+
+	def to_float(s: str) -> float:
+		m = _FLOAT_RE.search((s or "").replace(",", ""))
+		return float(m.group(0)) if m else 0.0
+
+	# 1단계: 탭마다 상호명/수량으로 정산 대상 행만 추림 (배경색은 이 행들만 조회)
+	tabs: List[Tuple[str, str, Callable[[List[str]], Tuple[str, ...]], List[Tuple[int, str, int, int, List[str]]]]] = []
+	color_ranges: Dict[str, List[str]] = {}
+	for ws in selected:
 		tab = (ws.title or "").strip()
-		if wanted and tab not in wanted:
-			continue
-		# 전체 값
 		values = _get_all_values_full_cached(ws)
 		if not values:
 			continue
 		header_row = _find_header_row_simple(values)
 		headers = [str(c or "").strip() for c in (values[header_row-1] if header_row-1 < len(values) else [])]
-		# 배경색 조회
-		bg = _fetch_background_colors(spreadsheet_id, tab, max_rows=len(values))
+		# 정규화 헤더 → 열 인덱스 (같은 이름이 여러 번이면 첫 열 우선)
+		header_idx: Dict[str, int] = {}
+		for i, h in enumerate(headers):
+			header_idx.setdefault(_collapse_spaces(h), i)
 		# 컬럼 인덱스 (유연한 매칭)
-		def col_idx(target: str) -> int | None:
-			target_norm = _collapse_spaces(target)
-			for i, h in enumerate(headers):
-				if _collapse_spaces(h) == target_norm:
-					return i
-			return None
-
-		ci_agency = col_idx("상호명")
-		ci_job = col_idx("상품명")
-		ci_store = col_idx("저장")
-		ci_traf = col_idx("트래픽")
-		ci_store_actual = col_idx("저장 감은타수")
-		ci_traf_actual = col_idx("트래픽 감은타수")
-		
-		# 금액 컬럼 찾기 (여러 후보)
-		ci_amount = None
-		for cand in ["금액(vat제외)", "금액(VAT제외)", "금액(vat별도)", "금액", "매출"]:
-			ci = col_idx(cand)
-			if ci is not None:
-				ci_amount = ci
-				break
-		
-		# 입금확인 컬럼 찾기 (여러 후보)
-		ci_paid = None
-		for cand in ["입금확인", "입금 확인", "입금여부", "입금 여부", "입금"]:
-			ci = col_idx(cand)
-			if ci is not None:
-				ci_paid = ci
-				break
+		ci_agency = header_idx.get(_SETTLE_AGENCY)
+		ci_job = header_idx.get(_SETTLE_JOB)
+		ci_store = header_idx.get(_SETTLE_STORE)
+		ci_traf = header_idx.get(_SETTLE_TRAF)
+		ci_store_actual = header_idx.get(_SETTLE_STORE_ACTUAL)
+		ci_traf_actual = header_idx.get(_SETTLE_TRAF_ACTUAL)
+		# 금액/입금확인 컬럼은 여러 후보 중 먼저 나오는 이름
+		ci_amount = next((header_idx[h] for h in _SETTLE_AMOUNT_CANDIDATES if h in header_idx), None)
+		ci_paid = next((header_idx[h] for h in _SETTLE_PAID_CANDIDATES if h in header_idx), None)
+
+		# 상호명 열이 없으면 모든 행이 건너뛰어지므로 탭 자체를 생략
+		if ci_agency is None:
+			continue
 
-		for row_idx, r in enumerate(values[header_row:]):
-			agency = str((r[ci_agency] if (ci_agency is not None and ci_agency < len(r)) else "").strip()) if ci_agency is not None else ""
-			job = str((r[ci_job] if (ci_job is not None and ci_job < len(r)) else "").strip()) if ci_job is not None else ""
-			store_s = str((r[ci_store] if (ci_store is not None and ci_store < len(r)) else "").strip()) if ci_store is not None else ""
-			traf_s = str((r[ci_traf] if (ci_traf is not None and ci_traf < len(r)) else "").strip()) if ci_traf is not None else ""
-			store_actual_s = str((r[ci_store_actual] if (ci_store_actual is not None and ci_store_actual < len(r)) else "").strip()) if ci_store_actual is not None else ""
-			traf_actual_s = str((r[ci_traf_actual] if (ci_traf_actual is not None and ci_traf_actual < len(r)) else "").strip()) if ci_traf_actual is not None else ""
-			amount_note_s = str((r[ci_amount] if (ci_amount is not None and ci_amount < len(r)) else "").strip()) if ci_amount is not None else ""
-			paid_s = str((r[ci_paid] if (ci_paid is not None and ci_paid < len(r)) else "").strip()) if ci_paid is not None else ""
+		# 필요한 칸을 itemgetter로 꺼냄 (없는 컬럼은 행 끝에 덧붙인 빈 칸을 가리킴)
+		# 건너뛸 행에서 불필요한 파싱을 하지 않도록 상호명 → 수량 → 나머지 순으로 나눠 꺼냄
+		cols = (ci_agency, ci_job, ci_store, ci_traf, ci_store_actual, ci_traf_actual, ci_amount, ci_paid)
+		width = max(c for c in cols if c is not None) + 1
+		qty_getter = itemgetter(*(width if c is None else c for c in (ci_store, ci_traf, ci_store_actual, ci_traf_actual)))
+		rest_getter = itemgetter(*(width if c is None else c for c in (ci_job, ci_amount, ci_paid)))
 
+		kept: List[Tuple[int, str, int, int, List[str]]] = []
+		for row_idx, r in enumerate(values[header_row:]):
+			agency = r[ci_agency].strip() if ci_agency < len(r) else ""
 			if not agency:
 				continue
-			# 수량 파싱
-			def to_int(s: str) -> int:
-				s_clean = (s or "").replace(",", "").strip()
-				m = re.search(r"-?\d+", s_clean)
-				return int(m.group(0)) if m else 0
-			def to_float(s: str) -> float:
-				s_clean = (s or "").replace(",", "").strip()
-				m = re.search(r"-?[\d.]+", s_clean)
-				return float(m.group(0)) if m else 0.0
+			cells = r[:width]
+			cells += [""] * (width + 1 - len(cells))
+			# 수량 파싱 (to_int는 앞뒤 공백과 무관하므로 strip 생략)
+			store_s, traf_s, store_actual_s, traf_actual_s = qty_getter(cells)
 			qty_store_raw = to_int(store_s)
 			qty_traf_raw = to_int(traf_s)
 			qty_store_act = to_int(store_actual_s)
@@ -1068,79 +1521,76 @@ def compute_settlement_rows(spreadsheet_id: str, selected_tabs: List[str], price
 			# 감은타수가 존재(>0)하면 그것을 우선 사용
 			qty_store = qty_store_act if qty_store_act > 0 else qty_store_raw
 			qty_traf = qty_traf_act if qty_traf_act > 0 else qty_traf_raw
-			income_noted = to_float(amount_note_s)  # 대행사건에만 매출 반영
 			if qty_store == 0 and qty_traf == 0:
 				continue
+			kept.append((header_row + row_idx, agency, qty_store, qty_traf, cells))
+		if not kept:
+			continue
+		tabs.append((ws.title, tab, rest_getter, kept))
+
+		# 남은 행의 상호명 셀만 연속 구간으로 묶어 조회 (예: B5:B12, B15:B15 — 실제 탭 제목 기준)
+		runs = _row_runs([row0 + 1 for row0, *_ in kept])
+		color_ranges[ws.title] = [f"{rowcol_to_a1(a, ci_agency + 1)}:{rowcol_to_a1(b, ci_agency + 1)}" for a, b in runs]
+
+	# 2단계: 모든 탭의 배경색을 배치 요청으로 조회
+	bg_by_title = _fetch_background_colors_batch(spreadsheet_id, color_ranges)
+
+	# 3단계: 정산 행/집계 생성
+	for title, tab, rest_getter, kept in tabs:
+		# 상호명 열 배경색 (시트 기준 0-based 행)
+		bg = bg_by_title.get(title, [])
 
-			# 입금 여부 확인
-			is_paid = _is_truthy(paid_s)
+		# 탭별 집계 dict는 행마다 다시 찾지 않도록 한 번만 꺼내 둠
+		bp_tab = by_product.setdefault(tab, {})
+		ba_tab = by_agency.setdefault(tab, {})
+
+		for row0, agency, qty_store, qty_traf, cells in kept:
+			job, amount_note_s, paid_s = rest_getter(cells)
+			job = job.strip()
+			income_noted = to_float(amount_note_s)  # 대행사건에만 매출 반영
 
 			# 자사건/관리형 판정: 상호명 셀 배경 노란색(자사) 또는 연녹색(관리형) → 매출 0 처리
-			is_internal = False
-			internal_type = None  # 'guarantee'(노란색) or 'manage'(연녹색)
-			if ci_agency is not None:
-				rgb = bg.get((header_row + row_idx, ci_agency))
-				if _is_yellow(rgb):
-					is_internal = True
-					internal_type = "guarantee"
-				elif _is_manage_green(rgb):
-					is_internal = True
-					internal_type = "manage"
+			internal_type = _internal_type_for_color(_color_at(bg, row0, 0))  # 'guarantee'(노란색) or 'manage'(연녹색)
+			is_internal = internal_type is not None
 
 			# 미수금 집계: 'O'가 없는 행의 '금액(vat제외)' 값을 상호명별로 합산 (자사 보장건 제외)
-			is_paid = _is_truthy(paid_s)
-			if not is_internal and income_noted > 0 and not is_paid:
-				unpaid_by_agency[agency] = unpaid_by_agency.get(agency, 0.0) + income_noted
-
-			# 저장 행
-			if qty_store:
-				unit = find_unit_price(agency, job, "저장")
-				expense = float(qty_store) * unit
-				income = 0.0 if is_internal else income_noted
-				rows_out.append({"date": tab, "client": agency, "job": job, "type": "저장", "qty": qty_store, "unit_price": unit, "expense": expense, "income": income, "is_internal": is_internal, "internal_type": internal_type})
-				by_client_expense[agency] = by_client_expense.get(agency, 0.0) + expense
-				if not is_internal:
-					by_client_income[agency] = by_client_income.get(agency, 0.0) + income
-					# 미수금 집계는 라인 1082-1085에서 행 단위로 이미 처리됨 (중복 방지)
-
-				grand_expense += expense
-				grand_income += income
-				if unit == 0:
-					missing[(agency, job, "저장")] = missing.get((agency, job, "저장"), 0) + qty_store
-				# 집계: 상품명 기준(type을 붙이지 않음)
-				bp = by_product.setdefault(tab, {}).setdefault(job, {"qty": 0.0, "expense": 0.0, "income": 0.0})
-				bp["qty"] += float(qty_store); bp["expense"] += expense; bp["income"] += income
-				by_agency.setdefault(tab, {}).setdefault(agency, []).append({"product": job, "type": "저장", "qty": qty_store, "unit_price": unit, "expense": expense, "income": income, "internal_type": internal_type})
-			# 트래픽 행
-			if qty_traf:
-				unit = find_unit_price(agency, job, "트래픽")
-				expense = float(qty_traf) * unit
-				income = 0.0 if is_internal else income_noted
-				rows_out.append({"date": tab, "client": agency, "job": job, "type": "트래픽", "qty": qty_traf, "unit_price": unit, "expense": expense, "income": income, "is_internal": is_internal, "internal_type": internal_type})
-				by_client_expense[agency] = by_client_expense.get(agency, 0.0) + expense
+			# 입금 여부는 미수금 후보일 때만 확인
+			if not is_internal and income_noted > 0 and not _is_truthy(paid_s):
+				unpaid_by_agency[agency] += income_noted
+
+			# 저장/트래픽 행 (같은 행이므로 상품/상호명 집계 항목은 한 번만 찾음)
+			income = 0.0 if is_internal else income_noted
+			bp = bp_tab.setdefault(job, {"qty": 0.0, "expense": 0.0, "income": 0.0})  # 집계: 상품명 기준(type을 붙이지 않음)
+			ba_list = ba_tab.setdefault(agency, [])
+			for kind, qty in (("저장", qty_store), ("트래픽", qty_traf)):
+				if not qty:
+					continue
+				unit = find_unit_price(agency, job, kind)
+				expense = float(qty) * unit
+				rows_out.append((tab, agency, job, kind, qty, unit, expense, income, is_internal, internal_type))
+				by_client_expense[agency] += expense
 				if not is_internal:
-					by_client_income[agency] = by_client_income.get(agency, 0.0) + income
-					# 미수금 집계는 라인 1082-1085에서 행 단위로 이미 처리됨 (중복 방지)
+					# 미수금은 위에서 행 단위로 이미 집계됨 (중복 방지)
+					by_client_income[agency] += income
 
 				grand_expense += expense
 				grand_income += income
 				if unit == 0:
-					missing[(agency, job, "트래픽")] = missing.get((agency, job, "트래픽"), 0) + qty_traf
-				bp = by_product.setdefault(tab, {}).setdefault(job, {"qty": 0.0, "expense": 0.0, "income": 0.0})
-				bp["qty"] += float(qty_traf); bp["expense"] += expense; bp["income"] += income
-				by_agency.setdefault(tab, {}).setdefault(agency, []).append({"product": job, "type": "트래픽", "qty": qty_traf, "unit_price": unit, "expense": expense, "income": income, "internal_type": internal_type})
+					missing[(agency, job, kind)] += qty
+				bp["qty"] += float(qty); bp["expense"] += expense; bp["income"] += income
+				ba_list.append({"product": job, "type": kind, "qty": qty, "unit_price": unit, "expense": expense, "income": income, "internal_type": internal_type})
 
 	# missing 리스트 가공
 	missing_list = [{"client": k[0], "job": k[1], "type": k[2], "qty_sum": v} for k, v in missing.items()]
 	return {
-		"rows": rows_out,
+		"rows": [dict(zip(_SETTLE_ROW_KEYS, t)) for t in rows_out],
 		"totals": {
-			"by_client_expense": by_client_expense,
-			"by_client_income": by_client_income,
+			"by_client_expense": dict(by_client_expense),
+			"by_client_income": dict(by_client_income),
 			"grand_expense": grand_expense,
 			"grand_income": grand_income,
 		},
 		"aggregates": {"by_product": by_product, "by_agency": by_agency},
 		"missing_prices": missing_list,
-		"unpaid_receivables": unpaid_by_agency,
+		"unpaid_receivables": dict(unpaid_by_agency),
 	}
@@ -0,0 +1,190 @@
+"""
+recovery_service 보장건 탭 읽기·시트 업데이트·전송 결과 집계 테스트 (가짜 스프레드시트 사용, 네트워크 없음)
+"""
+import gspread
+import pytest
+
+from recovery_service import RecoveryService, GUARANTEE_SHEETS
+
+
+HEADERS = ["작업 여부", "상호명", "메인 키워드", "상품", "플레이스 URL", "보장 순위", "1"] + [str(i) for i in range(2, 26)]
+
+
+def make_values(place_id):
+    """1행 제목 + 2행 헤더 + 복구 대상 1행"""
+    return [
+        ["보장건"],
+        HEADERS,
+        ["진행중", "맛집", "강남맛집", "플레이스", f"https://m.place.naver.com/restaurant/{place_id}", "5"],
+    ]
+
+
+class FakeSpreadsheet:
+    """values_batch_get / values_batch_update만 흉내 내는 스프레드시트 (쓰기 요청 본문 기록)"""
+
+    def __init__(self, values, write_error=None):
+        self.values = values
+        self.write_error = write_error
+        self.bodies = []
+
+    def values_batch_get(self, ranges):
+        return {"valueRanges": [{"values": self.values}]}
+
+    def values_batch_update(self, body):
+        self.bodies.append(body)
+        if self.write_error is not None:
+            raise self.write_error
+        return {}
+
+
+class FakeClient:
+    def __init__(self, by_id):
+        self.by_id = by_id
+
+    def open_by_key(self, key):
+        return self.by_id[key]
+
+
+@pytest.fixture
+def sheets():
+    """시트 이름 → 가짜 스프레드시트 (두 시트 모두 같은 플레이스 행 1개)"""
+    return {name: FakeSpreadsheet(make_values("1234567")) for name, _ in GUARANTEE_SHEETS}
+
+
+@pytest.fixture
+def service(monkeypatch, sheets):
+    by_id = {sheet_id: sheets[name] for name, sheet_id in GUARANTEE_SHEETS}
+    monkeypatch.setattr(RecoveryService, "_get_gspread_client", lambda self: FakeClient(by_id))
+    return RecoveryService()
+
+
+RANK_DATA = [{"place_id": "1234567", "client_name": "맛집", "keyword": "강남맛집", "rank": 3}]
+
+
+def test_selective_update_counts_only_written_cells(service, sheets):
+    """전송이 실패한 시트는 updated=0, success=False로 집계되어야 함"""
+    failed_name, ok_name = GUARANTEE_SHEETS[0][0], GUARANTEE_SHEETS[1][0]
+    sheets[failed_name].write_error = RuntimeError("write failed")
+
+    result = service.update_guarantee_sheets_selective(RANK_DATA, "2025-01-08")
+
+    assert result["flush_results"][failed_name]["success"] is False
+    assert result["results"][failed_name]["success"] is False
+    assert result["results"][failed_name]["updated"] == 0
+    assert result["results"][ok_name]["updated"] == 1
+    assert result["total_updated"] == 1
+    assert result["success"] is False
+    assert sheets[ok_name].bodies[0]["data"][0]["values"] == [["25. 01. 08\n3등"]]
+
+
+def test_recover_specific_date_reports_flush_failure(service, sheets, monkeypatch):
+    """요약 상태/메시지도 실제 기록된 셀 수 기준이어야 함"""
+    for sheet in sheets.values():
+        sheet.write_error = RuntimeError("write failed")
+    monkeypatch.setattr(service, "crawl_historical_date", lambda target_date: {"success": True, "data": RANK_DATA})
+
+    result = service.recover_specific_date("2025-01-08")
+
+    assert result["summary"]["status"] == "flush_failed"
+    assert result["summary"]["updated_count"] == 0
+    assert "0건 업데이트" in result["summary"]["message"]
+
+
+def test_recover_missing_dates_totals_after_flush(service, sheets, monkeypatch):
+    """여러 날짜 복구: 전송 실패한 시트의 날짜별 결과가 합계에서 빠져야 함"""
+    failed_name = GUARANTEE_SHEETS[0][0]
+    sheets[failed_name].write_error = RuntimeError("write failed")
+    dates = ["2025-01-08", "2025-01-09"]
+    monkeypatch.setattr(service, "get_missing_dates_from_sheets", lambda days_back: {"missing_dates": dates})
+    monkeypatch.setattr(service, "_crawl_all_dates_once", lambda: (
+        {"success": True, "data": RANK_DATA * 2},
+        {d: RANK_DATA for d in dates},
+        {},
+    ))
+
+    result = service.recover_missing_dates()
+
+    for date_result in result["update_results"]:
+        assert date_result["results"][failed_name]["success"] is False
+        assert date_result["results"][failed_name]["updated"] == 0
+        assert date_result["total_updated"] == 1
+    assert result["summary"]["status"] == "flush_failed"
+    assert result["summary"]["total_updated"] == 2
+    assert failed_name in result["summary"]["message"]
+
+
+def test_update_for_dates_summarizes_after_flush(service, sheets):
+    """여러 날짜 업데이트: 시트당 1회 전송 후 날짜별 결과가 전송 결과를 반영해야 함"""
+    failed_name, ok_name = GUARANTEE_SHEETS[0][0], GUARANTEE_SHEETS[1][0]
+    sheets[failed_name].write_error = RuntimeError("write failed")
+    dates = ["2025-01-08", "2025-01-09"]
+
+    date_results, flush_results = service.update_guarantee_sheets_for_dates(
+        [(d, RANK_DATA, None) for d in dates]
+    )
+
+    assert flush_results[failed_name]["success"] is False
+    assert flush_results[ok_name] == {"success": True, "updated": 2}
+    assert len(sheets[ok_name].bodies) == 1
+    assert [r["date"] for r in date_results] == dates
+    for date_result in date_results:
+        assert date_result["results"][failed_name]["updated"] == 0
+        assert date_result["results"][ok_name]["updated"] == 1
+        assert date_result["total_updated"] == 1
+        assert date_result["success"] is False
+    assert service.pending_updates == {}
+
+
+class FakeResponse:
+    def __init__(self, code, message):
+        self.status_code = code
+        self.headers = {}
+        self._message = message
+
+    def json(self):
+        return {"error": {"code": self.status_code, "message": self._message, "status": "INVALID_ARGUMENT"}}
+
+
+class ErrorSpreadsheet:
+    def __init__(self, error):
+        self.error = error
+
+    def values_batch_get(self, ranges):
+        raise self.error
+
+
+def test_read_guarantee_values_missing_tab_becomes_worksheet_not_found():
+    """탭 범위를 해석할 수 없는 400만 WorksheetNotFound로 바꿔야 함"""
+    error = gspread.exceptions.APIError(FakeResponse(400, "Unable to parse range: '보장건'"))
+
+    with pytest.raises(gspread.WorksheetNotFound):
+        RecoveryService._read_guarantee_values(ErrorSpreadsheet(error))
+
+
+def test_read_guarantee_values_other_400_is_reraised():
+    """그 밖의 400 오류는 원래 APIError 그대로 전달되어야 함"""
+    error = gspread.exceptions.APIError(FakeResponse(400, "Request contains an invalid argument."))
+
+    with pytest.raises(gspread.exceptions.APIError) as excinfo:
+        RecoveryService._read_guarantee_values(ErrorSpreadsheet(error))
+    assert excinfo.value is error
+
+
+def test_read_guarantee_values_retries_with_shared_policy(monkeypatch):
+    """sheet_client와 같은 재시도 정책: 429는 재시도하고 Retry-After는 RETRY_MAX_DELAY(30초)까지만 대기"""
+    import sheet_client
+
+    sleeps = []
+    monkeypatch.setattr(sheet_client.time, "sleep", sleeps.append)
+    response = FakeResponse(429, "Quota exceeded")
+    response.headers = {"Retry-After": "600"}
+    errors = [gspread.exceptions.APIError(response)]
+
+    class FlakySpreadsheet:
+        def values_batch_get(self, ranges):
+            if errors:
+                raise errors.pop()
+            return {"valueRanges": [{"values": [["보장건"]]}]}
+
+    assert RecoveryService._read_guarantee_values(FlakySpreadsheet()) == [["보장건"]]
+    assert sleeps == [30.0]
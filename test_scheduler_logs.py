@@ -0,0 +1,92 @@
+"""
+scheduler_logs 파일 기록/복원/요약 집계 테스트 (임시 SCHEDULER_LOG_FILE 사용)
+"""
+import json
+
+import pytest
+
+import scheduler_logs
+from scheduler_logs import SchedulerLogManager
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """임시 로그 파일 경로 + 싱글턴 초기화, 로그는 추가할 때마다 바로 기록 (타이머 없음)"""
+    path = tmp_path / "scheduler_logs.jsonl"
+    monkeypatch.setenv("SCHEDULER_LOG_FILE", str(path))
+    monkeypatch.setattr(scheduler_logs, "FLUSH_MAX_PENDING", 1)
+    monkeypatch.setattr(SchedulerLogManager, "_instance", None)
+    yield path
+    manager = SchedulerLogManager._instance
+    if manager is not None and manager._fp is not None:
+        manager._fp.close()
+
+
+def new_manager():
+    """파일에서 다시 읽는 새 인스턴스 (재시작 흉내)"""
+    old = SchedulerLogManager._instance
+    if old is not None and old._fp is not None:
+        old._fp.close()
+    SchedulerLogManager._instance = None
+    return SchedulerLogManager()
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def test_legacy_json_is_migrated_to_jsonl(log_file, monkeypatch):
+    """이전 형식({"logs": [...]})은 최근 MAX_LOG_ENTRIES개만 읽고 JSONL로 다시 저장"""
+    monkeypatch.setattr(scheduler_logs, "MAX_LOG_ENTRIES", 3)
+    legacy = [{"job_id": f"job{i}", "status": "success", "date": "2025-01-08"} for i in range(5)]
+    log_file.write_text(json.dumps({"updated_at": "2025-01-08T00:00:00", "logs": legacy}), encoding="utf-8")
+
+    manager = new_manager()
+
+    assert list(manager.logs) == legacy[-3:]
+    assert read_lines(log_file) == legacy[-3:]
+    assert list(new_manager().logs) == legacy[-3:]
+
+
+def test_reload_after_compaction(log_file, monkeypatch):
+    """COMPACT_EVERY건을 넘겨 압축한 뒤에도 다시 읽으면 최근 로그가 순서대로 복원"""
+    monkeypatch.setattr(scheduler_logs, "MAX_LOG_ENTRIES", 5)
+    monkeypatch.setattr(scheduler_logs, "COMPACT_EVERY", 7)
+    manager = new_manager()
+    for i in range(12):
+        manager.add_log(f"job{i}", "작업", "success", f"msg{i}")
+
+    # 7건째에 압축(최근 5건) + 이후 5건 추가 기록
+    assert len(read_lines(log_file)) == 10
+    assert manager._writes_since_compact == 5
+
+    reloaded = new_manager()
+    assert [log["message"] for log in reloaded.logs] == [f"msg{i}" for i in range(7, 12)]
+    assert reloaded.get_summary()["success_count"] == 5
+
+
+def test_summary_counts_after_eviction(log_file, monkeypatch):
+    """MAX_LOG_ENTRIES를 넘겨 밀려난 로그는 상태별/오늘 건수와 작업별 최신 로그에서 빠져야 함"""
+    monkeypatch.setattr(scheduler_logs, "MAX_LOG_ENTRIES", 3)
+    manager = new_manager()
+    manager._append_log_line({"job_id": "old", "status": "started", "date": "2025-01-01"})
+    manager.add_log("a", "작업 A", "success")
+    manager.add_log("b", "작업 B", "failed")
+    manager.add_log("c", "작업 C", "success")
+    manager.add_log("b", "작업 B", "failed")
+
+    summary = manager.get_summary()
+    assert summary["total_logs"] == 3
+    assert summary["success_count"] == 1
+    assert summary["failed_count"] == 2
+    assert summary["today_count"] == 3
+    assert list(summary["latest_by_job"]) == ["b", "c"]
+    # 밀려난 날짜/상태 키는 집계에 남지 않음
+    today = manager.logs[-1]["date"]
+    assert manager._date_counts == {today: 3}
+    assert manager._status_counts == {"success": 1, "failed": 2}
+
+    # 다시 읽은 뒤의 집계도 같아야 함
+    reloaded = new_manager().get_summary()
+    assert (reloaded["total_logs"], reloaded["success_count"], reloaded["failed_count"]) == (3, 1, 2)
+    assert list(reloaded["latest_by_job"]) == ["b", "c"]
@@ -0,0 +1,402 @@
+"""
+sheet_client 캐시/쓰기/배경색 조회 테스트 (가짜 워크시트·스프레드시트 사용, 네트워크 없음)
+"""
+import pytest
+
+import sheet_client
+
+
+class FakeWorksheet:
+	"""get_all_values / row_values / get_values만 흉내 내는 워크시트"""
+
+	def __init__(self, spreadsheet_id, ws_id, title, rows):
+		self.spreadsheet_id = spreadsheet_id
+		self.id = ws_id
+		self.title = title
+		self.rows = rows
+		self.row_count = len(rows)
+
+	def get_all_values(self):
+		return [list(r) for r in self.rows]
+
+	def row_values(self, i):
+		return list(self.rows[i - 1]) if i <= len(self.rows) else []
+
+	def get_values(self, a1):
+		start, end = (int(x) for x in a1.split(":"))
+		return [list(r) for r in self.rows[start - 1:end]]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches(monkeypatch):
+	"""테스트마다 모듈 캐시 초기화, Drive 수정 시각 확인은 끔"""
+	monkeypatch.setattr(sheet_client, "_get_modified_time", lambda spreadsheet_id: None)
+	sheet_client._WS_CACHE.clear()
+	sheet_client._HEADER_CACHE.clear()
+	sheet_client._SS_CACHE.clear()
+	yield
+	sheet_client._WS_CACHE.clear()
+	sheet_client._HEADER_CACHE.clear()
+	sheet_client._SS_CACHE.clear()
+
+
+def test_ws_cache_separates_spreadsheets_with_same_gid():
+	"""다른 스프레드시트의 같은 gid(0) 워크시트가 서로의 캐시 값을 받지 않아야 함"""
+	main_ws = FakeWorksheet("MAIN", 0, "시트1", [["메인"]])
+	settle_ws = FakeWorksheet("SETTLE", 0, "시트1", [["정산"]])
+
+	assert sheet_client._get_all_values_full_cached(main_ws) == [["메인"]]
+	assert sheet_client._get_cached_values(settle_ws) is None
+	assert sheet_client._get_all_values_full_cached(settle_ws) == [["정산"]]
+	assert sheet_client._get_all_values_full_cached(main_ws) == [["메인"]]
+
+
+def test_header_follows_reread_values_after_column_insert(monkeypatch):
+	"""값을 다시 읽은 뒤에는 헤더도 새 값에서 구해야 함 (열 삽입 후 체크 열 위치)"""
+	now = [1000.0]
+	monkeypatch.setattr(sheet_client, "_now", lambda: now[0])
+	settings = sheet_client.Settings(SPREADSHEET_ID="MAIN")
+	ws = FakeWorksheet("MAIN", 1, "시트1", [
+		["대행사 명", "상호명", "마감 잔여일", "마감 안내 체크"],
+		["A사", "맛집", "1", ""],
+	])
+
+	sheet_client._get_all_values_full_cached(ws)
+	_, headers = sheet_client._find_header_row(ws, settings)
+	assert sheet_client._find_checked_col_index(headers, settings) == 4
+
+	# 맨 앞에 열 삽입 → 값 캐시 TTL(120초)은 지났지만 헤더 캐시 TTL(300초)은 남은 시점
+	ws.rows = [["메모"] + r for r in ws.rows]
+	now[0] += 130
+	values = sheet_client._get_all_values_full_cached(ws)
+	assert values[0][0] == "메모"
+	header_row, headers = sheet_client._find_header_row(ws, settings)
+	assert header_row == 1
+	assert sheet_client._find_checked_col_index(headers, settings) == 5
+
+
+class FakeSpreadsheet:
+	"""worksheets / values_batch_get / values_batch_update만 흉내 내는 스프레드시트 (쓰기 요청 본문 기록)"""
+
+	def __init__(self, spreadsheet_id, worksheets, write_error=None):
+		self.id = spreadsheet_id
+		self._worksheets = worksheets
+		self.write_error = write_error
+		self.bodies = []
+
+	def worksheets(self):
+		return list(self._worksheets)
+
+	def values_batch_get(self, ranges):
+		by_range = {sheet_client.absolute_range_name(ws.title): ws for ws in self._worksheets}
+		return {"valueRanges": [{"values": by_range[r].get_all_values()} for r in ranges]}
+
+	def values_batch_update(self, body):
+		self.bodies.append(body)
+		if self.write_error is not None:
+			raise self.write_error
+		return {}
+
+
+MARK_HEADERS = ["대행사 명", "상호명", "마감 잔여일", "마감 안내 체크"]
+
+
+@pytest.fixture
+def mark_ss(monkeypatch):
+	"""체크 대상 행이 연속/비연속으로 섞인 탭, 체크 열이 없는 탭, 대상 행이 없는 탭"""
+	ss = FakeSpreadsheet("MAIN", [
+		FakeWorksheet("MAIN", 1, "N 작업", [
+			MARK_HEADERS,
+			["A사", "맛집", "1", ""],
+			["A사", "빵집", "1", ""],
+			["B사", "꽃집", "1", ""],
+			["A사", "카페", "3", ""],
+			["A사", "술집", "1", ""],
+			["A사", "체크됨", "1", "TRUE"],
+		]),
+		FakeWorksheet("MAIN", 2, "메모", [["대행사 명", "상호명", "마감 잔여일"], ["A사", "국밥", "1"]]),
+		FakeWorksheet("MAIN", 3, "기타", [MARK_HEADERS, ["C사", "분식", "1", ""]]),
+	])
+	monkeypatch.setattr(sheet_client, "_get_spreadsheet", lambda spreadsheet_id: ss)
+	return ss
+
+
+def test_row_runs_groups_consecutive_rows():
+	assert sheet_client._row_runs([9, 3, 5, 4]) == [(3, 5), (9, 9)]
+	assert sheet_client._row_runs([]) == []
+
+
+def test_write_checked_cells_builds_ranges(mark_ss):
+	"""연속 행은 한 범위, 단일 행은 한 칸, 탭 이름은 따옴표로 감싼 A1 범위 (요청 1회)"""
+	ws, other = mark_ss._worksheets[0], mark_ss._worksheets[2]
+	sheet_client._write_checked_cells(mark_ss, [(ws, [6, 2, 3], 4), (other, [], 4), (other, [2], 2)])
+
+	assert mark_ss.bodies == [{
+		"valueInputOption": "USER_ENTERED",
+		"data": [
+			{"range": "'N 작업'!D2:D3", "values": [["TRUE"], ["TRUE"]]},
+			{"range": "'N 작업'!D6", "values": [["TRUE"]]},
+			{"range": "'기타'!B2", "values": [["TRUE"]]},
+		],
+	}]
+
+
+def test_write_checked_cells_skips_request_without_targets(mark_ss):
+	sheet_client._write_checked_cells(mark_ss, [(mark_ss._worksheets[0], [], 4)])
+	assert mark_ss.bodies == []
+
+
+def test_mark_checked_for_agency_writes_once(mark_ss):
+	settings = sheet_client.Settings(SPREADSHEET_ID="MAIN")
+	result = sheet_client.mark_checked_for_agency([1], "A사", settings=settings)
+
+	assert result["updated"] == 3
+	assert result["details"] == [
+		{"worksheet": "N 작업", "updated": 3},
+		{"worksheet": "메모", "updated": 0, "reason": "no_checked_col"},
+		{"worksheet": "기타", "updated": 0},
+	]
+	assert len(mark_ss.bodies) == 1
+	assert [d["range"] for d in mark_ss.bodies[0]["data"]] == ["'N 작업'!D2:D3", "'N 작업'!D6"]
+
+
+def test_mark_checked_for_agency_failure_bookkeeping(mark_ss):
+	"""쓰기 실패 시 대상 행이 있던 탭만 updated=0 + update_failed 사유"""
+	mark_ss.write_error = RuntimeError("quota")
+	settings = sheet_client.Settings(SPREADSHEET_ID="MAIN")
+	result = sheet_client.mark_checked_for_agency([1], "A사", settings=settings)
+
+	assert result["updated"] == 0
+	assert result["details"] == [
+		{"worksheet": "N 작업", "updated": 0, "reason": "update_failed:quota"},
+		{"worksheet": "메모", "updated": 0, "reason": "no_checked_col"},
+		{"worksheet": "기타", "updated": 0},
+	]
+
+
+def test_mark_checked_for_agencies_counts_per_agency(mark_ss):
+	settings = sheet_client.Settings(SPREADSHEET_ID="MAIN")
+	result = sheet_client.mark_checked_for_agencies([1], ["A사", "B사", " "], settings=settings)
+
+	assert result["updated"] == 4
+	assert result["per_agency"] == {"A사": 3, "B사": 1}
+	assert len(mark_ss.bodies) == 1
+	assert [d["range"] for d in mark_ss.bodies[0]["data"]] == ["'N 작업'!D2:D4", "'N 작업'!D6"]
+
+
+def test_mark_checked_for_agencies_failure_bookkeeping(mark_ss):
+	"""쓰기 실패 시 합계·라벨별 집계 모두 0, 대상 행이 있던 탭만 update_failed 사유"""
+	mark_ss.write_error = RuntimeError("quota")
+	settings = sheet_client.Settings(SPREADSHEET_ID="MAIN")
+	result = sheet_client.mark_checked_for_agencies([1], ["A사", "B사"], settings=settings)
+
+	assert result["updated"] == 0
+	assert result["per_agency"] == {"A사": 0, "B사": 0}
+	assert result["details"][0] == {"worksheet": "N 작업", "updated": 0, "reason": "update_failed:quota"}
+	assert result["details"][2] == {"worksheet": "기타", "updated": 0}
+
+
+YELLOW = {"effectiveFormat": {"backgroundColor": {"red": 1, "green": 1}}}
+GREEN = {"effectiveFormat": {"backgroundColor": {"red": 0.85, "green": 0.92, "blue": 0.83}}}
+WHITE = {"effectiveFormat": {"backgroundColor": {"red": 1, "green": 1, "blue": 1}}}
+
+
+class FakeResponse:
+	def __init__(self, data, error=None):
+		self.data = data
+		self.error = error
+
+	def raise_for_status(self):
+		if self.error is not None:
+			raise self.error
+
+	def json(self):
+		return self.data
+
+
+class FakeSession:
+	"""spreadsheets.get 흉내: 요청 범위별 GridData를 스프레드시트 탭 순서로 묶어 응답 (요청 파라미터 기록)
+
+	grids: {(탭 제목, A1): GridData}, fail_requests: 실패시킬 요청 순번(0부터) 집합
+	"""
+
+	def __init__(self, tab_order, grids, fail_requests=()):
+		self.tab_order = tab_order
+		self.grids = grids
+		self.fail_requests = set(fail_requests)
+		self.requests = []
+
+	def get(self, url, params):
+		index = len(self.requests)
+		ranges = [v for k, v in params if k == "ranges"]
+		self.requests.append(ranges)
+		if index in self.fail_requests:
+			return FakeResponse({}, RuntimeError("HTTP 500"))
+		by_title = {}
+		for r in ranges:
+			quoted, a1 = r.rsplit("!", 1)
+			title = quoted[1:-1]
+			by_title.setdefault(title, []).append(self.grids[(title, a1)])
+		return FakeResponse({"sheets": [
+			{"properties": {"title": t}, "data": by_title[t]} for t in self.tab_order if t in by_title
+		]})
+
+
+def test_grid_background_colors_places_rows_by_start_row():
+	"""startRow가 없는 범위는 0행부터, 요청하지 않은 행은 비어 있어 _color_at이 None"""
+	colors = sheet_client._grid_background_colors([
+		{"rowData": [{"values": [YELLOW]}]},
+		{"startRow": 3, "rowData": [{"values": [GREEN, WHITE]}, {}]},
+	])
+
+	assert len(colors) == 5
+	assert sheet_client._color_at(colors, 0, 0) == (1.0, 1.0, 0.0)
+	assert sheet_client._color_at(colors, 1, 0) is None
+	assert sheet_client._color_at(colors, 3, 0) == (0.85, 0.92, 0.83)
+	assert sheet_client._color_at(colors, 3, 1) == (1.0, 1.0, 1.0)
+	assert sheet_client._color_at(colors, 4, 0) is None
+	assert sheet_client._color_at(colors, 9, 0) is None
+
+
+BG_GRIDS = {
+	("B탭", "B3:B4"): {"startRow": 2, "rowData": [{"values": [YELLOW]}, {"values": [WHITE]}]},
+	("B탭", "B8"): {"startRow": 7, "rowData": [{"values": [GREEN]}]},
+	("A탭", "B1"): {"rowData": [{"values": [GREEN]}]},
+}
+
+
+def test_fetch_background_colors_batch_matches_tabs_by_title(monkeypatch):
+	"""탭마다 범위 여러 개 + 응답이 요청 순서가 아닌 탭 순서여도 제목으로 맞춰 한 번에 조회"""
+	session = FakeSession(["A탭", "B탭"], BG_GRIDS)
+	monkeypatch.setattr(sheet_client, "_authed_session", lambda: session)
+
+	out = sheet_client._fetch_background_colors_batch("MAIN", {"B탭": ["B3:B4", "B8"], "A탭": ["B1"]})
+
+	assert session.requests == [["'B탭'!B3:B4", "'B탭'!B8", "'A탭'!B1"]]
+	assert sheet_client._color_at(out["B탭"], 2, 0) == (1.0, 1.0, 0.0)
+	assert sheet_client._color_at(out["B탭"], 3, 0) == (1.0, 1.0, 1.0)
+	assert sheet_client._color_at(out["B탭"], 5, 0) is None
+	assert sheet_client._color_at(out["B탭"], 7, 0) == (0.85, 0.92, 0.83)
+	assert sheet_client._color_at(out["A탭"], 0, 0) == (0.85, 0.92, 0.83)
+	assert sheet_client._color_at(out["A탭"], 2, 0) is None
+
+
+def test_fetch_background_colors_batch_failed_chunk_falls_back_per_tab(monkeypatch):
+	"""실패한 배치 묶음의 탭만 탭별 조회로 다시 가져오고, 성공한 묶음의 탭은 그대로 사용"""
+	monkeypatch.setattr(sheet_client, "BATCH_GET_MAX_RANGES", 2)
+	session = FakeSession(["A탭", "B탭"], BG_GRIDS, fail_requests={0})
+	monkeypatch.setattr(sheet_client, "_authed_session", lambda: session)
+
+	out = sheet_client._fetch_background_colors_batch("MAIN", {"B탭": ["B3:B4", "B8"], "A탭": ["B1"]})
+
+	assert session.requests == [
+		["'B탭'!B3:B4", "'B탭'!B8"],
+		["'A탭'!B1"],
+		["'B탭'!B3:B4", "'B탭'!B8"],
+	]
+	assert sheet_client._color_at(out["B탭"], 2, 0) == (1.0, 1.0, 0.0)
+	assert sheet_client._color_at(out["B탭"], 7, 0) == (0.85, 0.92, 0.83)
+	assert sheet_client._color_at(out["A탭"], 0, 0) == (0.85, 0.92, 0.83)
+
+
+def test_fetch_background_colors_batch_tab_missing_from_response(monkeypatch):
+	"""응답에서 빠진 탭도 탭별 조회로 폴백, 그마저 실패하면 빈 목록"""
+	session = FakeSession(["A탭"], BG_GRIDS, fail_requests={1})
+	monkeypatch.setattr(sheet_client, "_authed_session", lambda: session)
+
+	out = sheet_client._fetch_background_colors_batch("MAIN", {"B탭": ["B8"], "A탭": ["B1"]})
+
+	assert session.requests == [["'B탭'!B8", "'A탭'!B1"], ["'B탭'!B8"]]
+	assert out["B탭"] == []
+	assert sheet_client._color_at(out["A탭"], 0, 0) == (0.85, 0.92, 0.83)
+
+
+class FakeAPIResponse:
+	"""gspread APIError 생성용 응답 (상태 코드 / 헤더 / 오류 본문)"""
+
+	def __init__(self, status_code, headers=None, details=None):
+		self.status_code = status_code
+		self.headers = headers or {}
+		self.details = details or []
+
+	def json(self):
+		return {"error": {"code": self.status_code, "message": "error", "details": self.details}}
+
+
+def api_error(status_code, headers=None, details=None):
+	return sheet_client.gspread.exceptions.APIError(FakeAPIResponse(status_code, headers, details))
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+	"""time.sleep 대신 대기 시간만 기록 (지터는 0)"""
+	recorded = []
+	monkeypatch.setattr(sheet_client.time, "sleep", recorded.append)
+	monkeypatch.setattr(sheet_client.random, "uniform", lambda a, b: 0.0)
+	return recorded
+
+
+def failing_then_ok(*errors):
+	"""주어진 예외를 차례로 던진 뒤 'ok'를 돌려주는 호출 대상"""
+	pending = list(errors)
+
+	def call():
+		if pending:
+			raise pending.pop(0)
+		return "ok"
+	return call
+
+
+@pytest.mark.parametrize("error", [
+	api_error(429, headers={"Retry-After": "3600"}),
+	api_error(429, details=[{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "900s"}]),
+])
+def test_with_retry_clamps_server_retry_delay(sleeps, error):
+	"""서버가 알려 준 대기 시간이 길어도 RETRY_MAX_DELAY(기본 30초)까지만 대기"""
+	assert sheet_client._with_retry(failing_then_ok(error)) == "ok"
+	assert sleeps == [30.0]
+
+
+def test_with_retry_uses_server_delay_within_cap(sleeps):
+	error = api_error(429, headers={"Retry-After": "5"})
+	assert sheet_client._with_retry(failing_then_ok(error)) == "ok"
+	assert sleeps == [5.0]
+
+
+@pytest.mark.parametrize("error", [
+	api_error(503, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}),
+	api_error(503, details=[{"retryDelay": "soon"}]),
+])
+def test_with_retry_malformed_server_delay_falls_back_to_backoff(sleeps, error):
+	assert sheet_client._with_retry(failing_then_ok(error, error)) == "ok"
+	assert sleeps == [0.8, 1.6]
+
+
+@pytest.mark.parametrize("error", [
+	FileNotFoundError("service_account.json"),
+	PermissionError("service_account.json"),
+	api_error(400),
+	api_error(403),
+])
+def test_with_retry_raises_permanent_errors_without_sleeping(sleeps, error):
+	"""로컬 I/O 오류와 400/403은 첫 시도에서 바로 raise (백오프 대기 없음)"""
+	calls = []
+
+	def call():
+		calls.append(1)
+		raise error
+
+	with pytest.raises(type(error)):
+		sheet_client._with_retry(call)
+	assert calls == [1]
+	assert sleeps == []
+
+
+@pytest.mark.parametrize("error", [
+	sheet_client.requests.exceptions.ConnectionError("reset"),
+	sheet_client.requests.exceptions.ReadTimeout("slow"),
+	TimeoutError("slow"),
+])
+def test_with_retry_retries_connection_errors(sleeps, error):
+	assert sheet_client._with_retry(failing_then_ok(error)) == "ok"
+	assert sleeps == [0.8]
@@ -363,8 +363,8 @@ class WorklogCache:
         
         try:
             from sheet_client import (
-                load_settings, _get_client, _find_header_row, _build_records,
-                _get_value_flexible, _normalize_key, _parse_int_maybe
+                load_settings, _get_spreadsheet, _get_worksheets, _find_header_row, _build_records,
+                _get_value_flexible, _parse_int_maybe
             )
             from internal_manager import _is_internal_or_postpaid, parse_date_flexible
             from guarantee_manager import GuaranteeManager
@@ -373,8 +373,6 @@ class WorklogCache:
             if not settings.spreadsheet_id:
                 return {"success": False, "records_count": 0, "message": "SPREADSHEET_ID 미설정"}
             
-            client = _get_client()
-            
             # 보장건 데이터에서 회사-상호명 매핑 로드
             company_map = {}  # business_name -> company
             guarantee_map = {}  # business_name -> guarantee_item
@@ -390,8 +388,8 @@ class WorklogCache:
                 logger.warning(f"보장건 매핑 로드 실패: {e}")
             
             # 스프레드시트 열기
-            ss = _with_retry(client.open_by_key, settings.spreadsheet_id)
-            ws_list = ss.worksheets()
+            ss = _with_retry(_get_spreadsheet, settings.spreadsheet_id)
+            ws_list = _get_worksheets(ss)
             
             today = datetime.now(KST).date()
             all_records = []
@@ -427,11 +425,9 @@ class WorklogCache:
                 
                 # 각 행 처리
                 for row in records:
-                    row_norm = {_normalize_key(k): v for k, v in row.items()}
-                    
                     # 내부 진행건/후불 필터
                     is_internal = _is_internal_or_postpaid(
-                        _get_value_flexible(row_norm, settings.internal_col, "INTERNAL_COLUMN")
+                        _get_value_flexible(row, settings.internal_col, "INTERNAL_COLUMN")
                     )
                     if not is_internal:
                         continue
@@ -439,15 +435,15 @@ class WorklogCache:
                     stats["internal_rows"] += 1
                     
                     # 필드 추출
-                    bizname = str(_get_value_flexible(row_norm, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
+                    bizname = str(_get_value_flexible(row, settings.bizname_col, "BIZNAME_COLUMN") or "").strip()
                     if not bizname:
                         continue
                     
-                    agency = str(_get_value_flexible(row_norm, settings.agency_col, "AGENCY_COLUMN") or "").strip()
-                    workload = str(_get_value_flexible(row_norm, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
-                    product = str(_get_value_flexible(row_norm, settings.product_col, "PRODUCT_COLUMN") or "").strip()
-                    product_name = str(_get_value_flexible(row_norm, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
-                    remain = _parse_int_maybe(_get_value_flexible(row_norm, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
+                    agency = str(_get_value_flexible(row, settings.agency_col, "AGENCY_COLUMN") or "").strip()
+                    workload = str(_get_value_flexible(row, settings.daily_workload_col, "DAILY_WORKLOAD_COLUMN") or "").strip()
+                    product = str(_get_value_flexible(row, settings.product_col, "PRODUCT_COLUMN") or "").strip()
+                    product_name = str(_get_value_flexible(row, settings.product_name_col, "PRODUCT_NAME_COLUMN") or "").strip()
+                    remain = _parse_int_maybe(_get_value_flexible(row, settings.remaining_days_col, "REMAINING_DAYS_COLUMN"))
                     
                     # 회사 결정
                     company = company_map.get(bizname, "기타")
@@ -464,7 +460,7 @@ class WorklogCache:
                     # 작업 시작일 추출
                     start_date = None
                     for col in ["작업 시작일", "작업시작일", "시작일", "세팅일"]:
-                        val = _get_value_flexible(row_norm, col, "")
+                        val = _get_value_flexible(row, col, "")
                         if val:
                             parsed = parse_date_flexible(str(val).strip())
                             if parsed:
@@ -475,7 +471,7 @@ class WorklogCache:
                     place_url = None
                     mid = None
                     for col in ["URL", "url", "플레이스 URL", "플레이스URL", "장소 URL", "장소URL"]:
-                        val = _get_value_flexible(row_norm, col, "")
+                        val = _get_value_flexible(row, col, "")
                         if val:
                             place_url = str(val).strip()
                             mid = extract_mid_from_url(place_url)
@@ -484,7 +480,7 @@ class WorklogCache:
                     # MID 컬럼 직접 읽기 (URL 없을 때 대비)
                     if not mid:
                         for col in ["MID", "mid", "place_id", "플레이스ID"]:
-                            val = _get_value_flexible(row_norm, col, "")
+                            val = _get_value_flexible(row, col, "")
                             if val:
                                 mid_str = str(val).strip()
                                 if mid_str.isdigit() and len(mid_str) >= 5: